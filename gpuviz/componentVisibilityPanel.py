@@ -42,6 +42,8 @@ class ComponentVisibilityPanel(QtWidgets.QGroupBox):
         for i, (key, label, default) in enumerate(components):
             checkbox = QtWidgets.QCheckBox(label)
             checkbox.setChecked(default)
+            # Toggle slots read the key back from the sender instead of per-checkbox lambdas
+            checkbox.setProperty("component_key", key)
             self.component_checkboxes[key] = checkbox
             components_layout.addWidget(checkbox, i // 2, i % 2)
         
@@ -56,6 +58,7 @@ class ComponentVisibilityPanel(QtWidgets.QGroupBox):
         
         for key, label in performance_modes:
             radio = QtWidgets.QRadioButton(label)
+            radio.setProperty("performance_mode", key)
             self.performance_radio[key] = radio
             performance_layout.addWidget(radio)
         
@@ -80,15 +83,21 @@ class ComponentVisibilityPanel(QtWidgets.QGroupBox):
         layout.addStretch()
         
     def setup_connections(self):
-        for key, checkbox in self.component_checkboxes.items():
-            checkbox.toggled.connect(lambda checked, k=key: self.on_component_toggled(k, checked))
-        for key, radio in self.performance_radio.items():
-            radio.toggled.connect(lambda checked, k=key: self.on_performance_changed(k, checked))
+        for checkbox in self.component_checkboxes.values():
+            checkbox.toggled.connect(self._on_checkbox_toggled)
+        for radio in self.performance_radio.values():
+            radio.toggled.connect(self._on_performance_toggled)
         self.show_all_btn.clicked.connect(self.show_all_components)
         self.hide_all_btn.clicked.connect(self.hide_all_components)
         self.reset_btn.clicked.connect(self.reset_view)
         self.isolate_checkbox.toggled.connect(self.on_isolate_toggled)
         
+    def _on_checkbox_toggled(self, checked: bool):
+        self.on_component_toggled(self.sender().property("component_key"), checked)
+        
+    def _on_performance_toggled(self, checked: bool):
+        self.on_performance_changed(self.sender().property("performance_mode"), checked)
+        
     def on_component_toggled(self, component: str, visible: bool):
         if self.view3d:
             self.view3d.set_component_visibility(component, visible)
@@ -7,6 +7,8 @@ Overview:
 - Registry and factory for available GPU 3D models
 """
 
+import gc
+
 from .baseGpuModel import BaseGPUModel
 from .rtx4080Model import RTX4080Model
 from .rtx4090Model import RTX4090Model
@@ -37,9 +39,6 @@ GPU_MODELS = {
 }
 
 def get_gpu_model(model_name: str, view3d_instance) -> BaseGPUModel:
-    import gc
-    gc.collect()  # Force cleanup before creating new model
-    
     normalized_name = model_name.replace('–', '-').replace('—', '-')
     
     gpu_model_mapping = {
@@ -82,7 +81,7 @@ def get_gpu_model(model_name: str, view3d_instance) -> BaseGPUModel:
         model_instance = model_class(view3d_instance)
         return model_instance
     except Exception as e:
-        # If model creation fails, try to force cleanup and retry once
+        # If model creation fails, collect once (only on this rare path) and retry
         print(f"GPU model creation failed, attempting cleanup: {e}")
         gc.collect()
         try:
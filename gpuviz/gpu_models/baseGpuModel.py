@@ -10,6 +10,7 @@ import math
 import time
 import random
 import weakref
+import numpy as np
 
 class BaseGPUModel(ABC):
     """Base class for all GPU 3D models."""
@@ -21,6 +22,8 @@ class BaseGPUModel(ABC):
         self.component_explanations = {}
         self.highlighted_component = None
         self._open_gl_initialized = False
+        # Corner arrays of repeated static parts; they depend only on their key, not on view state
+        self._geometry_cache = {}
         
     @property
     def view3d(self):
@@ -77,11 +80,16 @@ class BaseGPUModel(ABC):
     def set_component_color(self, component_name: str, base_color: Tuple[float, float, float, float]):
         """Set color based on highlighting state."""
         if self.highlighted_component == component_name:
-            glColor4f(1.0, 0.2, 0.1, 1.0)
+            color = (1.0, 0.2, 0.1, 1.0)
         elif self.highlighted_component is not None:
-            glColor4f(0.5, 0.5, 0.5, 0.2)
+            color = (0.5, 0.5, 0.5, 0.2)
         else:
-            glColor4f(*base_color)
+            color = base_color
+        v = self.view3d
+        if v is not None and hasattr(v, '_set_color'):
+            v._set_color(color)
+        else:
+            glColor4f(*color)
             
     def is_component_highlighted(self, component_name: str) -> bool:
         """Check if component is currently highlighted."""
@@ -120,6 +128,101 @@ class BaseGPUModel(ABC):
             self._open_gl_initialized = True
             pass
     
+    def _static_geometry(self, key, build):
+        """Return build() for key, computed once per model instance."""
+        geometry = self._geometry_cache.get(key)
+        if geometry is None:
+            geometry = self._geometry_cache[key] = build()
+        return geometry
+
+    def _draw_trace_grid(self, pcb_length, pcb_width, power_traces, data_rows, data_cols):
+        """Draw evenly spaced power traces and a data trace grid as two bulk box submissions."""
+        def build():
+            power_y = -pcb_width/2 + np.arange(1, power_traces + 1) * (pcb_width / (power_traces + 1))
+            power = np.column_stack([np.full(power_traces, -pcb_length/2 + 2), power_y - 0.1,
+                                     np.full(power_traces, 0.08)])
+            rows, cols = np.meshgrid(np.arange(data_rows), np.arange(data_cols), indexing='ij')
+            data = np.column_stack([(-pcb_length/2 + cols * (pcb_length / data_cols)).ravel(),
+                                    (-pcb_width/2 + rows * (pcb_width / data_rows) - 0.05).ravel(),
+                                    np.full(rows.size, 0.08)])
+            return power.astype(np.float32), data.astype(np.float32)
+
+        power, data = self._static_geometry(
+            ('traces', pcb_length, pcb_width, power_traces, data_rows, data_cols), build)
+        trace_color = (0.7, 0.6, 0.3, 0.8)
+        self.view3d._draw_boxes(power, (pcb_length - 4, 0.2, 0.05), trace_color)
+        self.view3d._draw_boxes(data, (0.3, 0.1, 0.03), trace_color)
+
+    def _draw_smd_parts(self, pcb_length, pcb_width, resistors, capacitors, inductors):
+        """Draw surface-mount parts as one bulk submission per part type.
+
+        resistors and capacitors are (count, per_row, row_slots) grids inset from the board edge;
+        inductors is the number spread along the far edge.
+        """
+        def grid(count, per_row, row_slots):
+            i = np.arange(count)
+            return np.column_stack([-pcb_length/2 + 2 + (i % per_row) * (pcb_length - 4) / per_row,
+                                    -pcb_width/2 + 1 + (i // per_row) * (pcb_width - 2) / row_slots,
+                                    np.full(count, 0.05)]).astype(np.float32)
+
+        def build():
+            i = np.arange(inductors)
+            edge = np.column_stack([-pcb_length/2 + 3 + i * (pcb_length - 6) / inductors,
+                                    np.full(inductors, -pcb_width/2 + pcb_width - 2),
+                                    np.full(inductors, 0.05)]).astype(np.float32)
+            return grid(*resistors), grid(*capacitors), edge
+
+        resistor_at, capacitor_at, inductor_at = self._static_geometry(
+            ('smd_parts', pcb_length, pcb_width, resistors, capacitors, inductors), build)
+        # Surface mount resistors (0402 size: 1.0mm x 0.5mm), capacitors and inductors
+        self.view3d._draw_boxes(resistor_at, (0.1, 0.05, 0.02), (0.3, 0.2, 0.1, 1.0))
+        self.view3d._draw_cylinders(capacitor_at, 0.03, 0.1, (0.1, 0.1, 0.2, 1.0))
+        self.view3d._draw_cylinders(inductor_at, 0.08, 0.15, (0.2, 0.15, 0.1, 1.0))
+
+    def _draw_heatsink_fins(self, x0, span, fin_count, y, depth, height):
+        """Draw fin_count evenly spaced heatsink fins across span as one bulk box submission."""
+        def build():
+            x = x0 + np.arange(fin_count) * (span / fin_count)
+            return np.column_stack([x, np.full(fin_count, y), np.full(fin_count, 0.5)]).astype(np.float32)
+
+        fins = self._static_geometry(('fins', x0, span, fin_count, y), build)
+        self.view3d._draw_boxes(fins, (0.08, depth, height), (0.8, 0.8, 0.85, 1.0))
+
+    def _draw_die_tiles(self, die_size, z_offset, tiles, cols, rows, tile_blocks):
+        """Draw a row-major grid of SM/WGP tiles and the blocks inside them as one bulk submission per block type.
+
+        tile_blocks(tile_width, tile_height) returns (corners, size, dz, color) groups, where corners are
+        block corners relative to a tile centre and dz is their height above the tile base.
+        """
+        tile_width = die_size / (cols + 1)
+        tile_height = die_size / (rows + 1)
+
+        def build():
+            i = np.arange(tiles)
+            centres = np.column_stack([-die_size/2 + (i % cols + 0.5) * tile_width,
+                                       -die_size/2 + (i // cols + 0.5) * tile_height,
+                                       np.full(tiles, z_offset)])
+            groups = [(centres - (tile_width/3, tile_height/3, 0), (tile_width*0.66, tile_height*0.66, 0.015),
+                       (0.35, 0.25, 0.15, 0.9))]
+            for corners, size, dz, color in tile_blocks(tile_width, tile_height):
+                offsets = np.column_stack([corners, np.full(len(corners), 0.015 + dz)])
+                groups.append(((centres[:, None, :] + offsets[None, :, :]).reshape(-1, 3), size, color))
+            return [(at.astype(np.float32), size, color) for at, size, color in groups]
+
+        groups = self._static_geometry(('die', die_size, z_offset, tiles, cols, rows, tile_blocks.__name__), build)
+        for at, size, color in groups:
+            self.view3d._draw_boxes(at, size, color)
+
+    def _draw_bonding_wires(self, x, y, z, count, start, pitch, drop):
+        """Draw a VRAM chip's row of bonding wires as one bulk box submission."""
+        def build():
+            wire_x = x - start + np.arange(count) * pitch
+            return np.column_stack([wire_x - 0.01, np.full(count, y - 0.01), np.full(count, z + 0.18)]).astype(np.float32)
+
+        wires = self._static_geometry(('bonding_wires', x, y, z, count, start, pitch), build)
+        # Simplified bonding wire representation: a flat strip from the die pad towards the substrate
+        self.view3d._draw_boxes(wires, (0.02, 0.02 - drop, 0.01), (0.8, 0.8, 0.7, 1.0))
+
     def update_animation(self, delta_time: float):
         """Default per-frame animation updater; models can override."""
         if hasattr(self, 'animation_state') and isinstance(self.animation_state, dict):
@@ -236,18 +339,27 @@ class BaseGPUModel(ABC):
 
     def start_component_animation(self, component_id: str, mode: str = 'pulse'):
         """Start a generic per-component animation that loops until stopped."""
+        self.start_component_animations((component_id,), mode)
+
+    def start_component_animations(self, component_ids, mode: str = 'pulse'):
+        """Start the same looping animation on several components with one timer start and repaint."""
+        component_ids = list(component_ids)
+        if not component_ids:
+            return
         if not hasattr(self, 'animation_state') or not isinstance(getattr(self, 'animation_state', None), dict):
             self.animation_state = {}
         cams = self.animation_state.get('component_animations')
         if not isinstance(cams, dict):
             cams = {}
             self.animation_state['component_animations'] = cams
-        cams[component_id] = {'mode': mode, 't': self.animation_state.get('animation_time', 0.0), 'running': True}
-        self.animation_state['selected_component'] = component_id
+        t = self.animation_state.get('animation_time', 0.0)
+        for component_id in component_ids:
+            cams[component_id] = {'mode': mode, 't': t, 'running': True}
+        self.animation_state['selected_component'] = component_ids[-1]
         self.animation_state['anim_mode'] = mode
         self.animation_state['running'] = True
         self.animation_state['loop'] = True
-        self.animation_state['animation_time'] = self.animation_state.get('animation_time', 0.0)
+        self.animation_state['animation_time'] = t
         self.animation_state['workflow_frame'] = self.animation_state.get('workflow_frame', 0)
         v = self.view3d
         if v and hasattr(v, 'animation_timer'):
@@ -261,13 +373,18 @@ class BaseGPUModel(ABC):
 
     def stop_component_animation(self, component_id: str = None):
         """Stop generic per-component animations. If component_id is None, stops all."""
+        self.stop_component_animations(None if component_id is None else (component_id,))
+
+    def stop_component_animations(self, component_ids=None):
+        """Stop animations for several components with one repaint. If component_ids is None, stops all."""
         if hasattr(self, 'animation_state') and isinstance(self.animation_state, dict):
             cams = self.animation_state.get('component_animations')
             if isinstance(cams, dict):
-                if component_id is None:
+                if component_ids is None:
                     cams.clear()
                 else:
-                    cams.pop(component_id, None)
+                    for component_id in component_ids:
+                        cams.pop(component_id, None)
             if not cams or len(cams) == 0:
                 self.animation_state['running'] = False
                 self.animation_state['anim_mode'] = None
@@ -6,6 +6,7 @@ Complete 1:1 replica with every component found on actual RTX 4060 Ti
 from .baseGpuModel import BaseGPUModel
 from typing import Dict, Tuple
 import math
+import numpy as np
 
 class RTX4060TiModel(BaseGPUModel):
     """Ultra-realistic RTX 4060 Ti GPU model with all real-world components."""
@@ -110,49 +111,12 @@ class RTX4060TiModel(BaseGPUModel):
 
     def _draw_pcb_traces(self, pcb_length, pcb_width):
         """Draw realistic PCB traces."""
-        trace_color = (0.7, 0.6, 0.3, 0.8)
-        
-        # Main power traces (thicker)
-        for i in range(4):
-            y = -pcb_width/2 + (i + 1) * (pcb_width / 5)
-            self.view3d._draw_3d_box(-pcb_length/2 + 2, y - 0.1, 0.08,
-                                     pcb_length - 4, 0.2, 0.05, trace_color)
-        
-        # Data traces (thinner)
-        for i in range(8):
-            y = -pcb_width/2 + i * (pcb_width / 8)
-            for j in range(10):
-                x = -pcb_length/2 + j * (pcb_length / 10)
-                self.view3d._draw_3d_box(x, y - 0.05, 0.08, 0.3, 0.1, 0.03, trace_color)
+        # 4 main power traces (thicker) and a 8 x 10 grid of data traces (thinner)
+        self._draw_trace_grid(pcb_length, pcb_width, 4, 8, 10)
 
     def _draw_microscopic_components(self, pcb_length, pcb_width):
         """Draw resistors, capacitors, and other tiny components."""
-        # Surface mount resistors (0402 size: 1.0mm x 0.5mm)
-        resistor_color = (0.3, 0.2, 0.1, 1.0)
-        
-        for i in range(100):
-            x = -pcb_length/2 + 2 + (i % 20) * (pcb_length - 4) / 20
-            y = -pcb_width/2 + 1 + (i // 20) * (pcb_width - 2) / 5
-            
-            self.view3d._draw_3d_box(x, y, 0.05, 0.1, 0.05, 0.02, resistor_color)
-        
-        # Surface mount capacitors
-        capacitor_color = (0.1, 0.1, 0.2, 1.0)
-        
-        for i in range(50):
-            x = -pcb_length/2 + 2 + (i % 10) * (pcb_length - 4) / 10
-            y = -pcb_width/2 + 1 + (i // 10) * (pcb_width - 2) / 5
-            
-            self.view3d._draw_3d_cylinder(x, y, 0.05, 0.03, 0.1, capacitor_color)
-        
-        # Inductors
-        inductor_color = (0.2, 0.15, 0.1, 1.0)
-        
-        for i in range(10):
-            x = -pcb_length/2 + 3 + i * (pcb_length - 6) / 10
-            y = -pcb_width/2 + pcb_width - 2
-            
-            self.view3d._draw_3d_cylinder(x, y, 0.05, 0.08, 0.15, inductor_color)
+        self._draw_smd_parts(pcb_length, pcb_width, resistors=(100, 20, 5), capacitors=(50, 10, 5), inductors=10)
 
     def _draw_rtx4060ti_pcb_components(self, pcb_length, pcb_width):
         """Draw all real-world RTX 4060 Ti PCB components."""
@@ -697,58 +661,27 @@ class RTX4060TiModel(BaseGPUModel):
         gpc_count = 4
         sms_per_gpc = 6
         
-        # Calculate SM dimensions
-        total_sms = gpc_count * sms_per_gpc
-        sm_cols = 6
-        sm_rows = 4
-        sm_width = die_size / (sm_cols + 1)
-        sm_height = die_size / (sm_rows + 1)
-        
-        for gpc in range(gpc_count):
-            for sm in range(sms_per_gpc):
-                sm_index = gpc * sms_per_gpc + sm
-                row = sm_index // sm_cols
-                col = sm_index % sm_cols
-                
-                x = -die_size/2 + (col + 0.5) * sm_width
-                y = -die_size/2 + (row + 0.5) * sm_height
-                
-                # SM tile
-                sm_color = (0.35, 0.25, 0.15, 0.9)
-                self.view3d._draw_3d_box(x - sm_width/3, y - sm_height/3, z_offset,
-                                         sm_width*0.66, sm_height*0.66, 0.015, sm_color)
-                
-                # Draw CUDA cores within SM (128 cores per SM)
-                self._draw_cuda_cores_in_sm(x, y, sm_width, sm_height, z_offset + 0.015)
+        # SM tiles on a 6 x 4 grid, each with its CUDA cores
+        self._draw_die_tiles(die_size, z_offset, gpc_count * sms_per_gpc, 6, 4, self._cuda_core_blocks)
 
-    def _draw_cuda_cores_in_sm(self, sm_x, sm_y, sm_width, sm_height, z_offset):
-        """Draw individual CUDA cores within an SM."""
-        # Each SM has 128 CUDA cores arranged in clusters
-        cores_per_cluster = 32
-        clusters_per_sm = 4
-        
+    def _cuda_core_blocks(self, sm_width, sm_height):
+        """Return the CUDA core clusters and cores within an SM, relative to its centre."""
+        # Each SM has 128 CUDA cores arranged in 4 clusters, 2 per row
         cluster_width = sm_width / 3
         cluster_height = sm_height / 3
-        
-        for cluster in range(clusters_per_sm):
-            cluster_row = cluster // 2
-            cluster_col = cluster % 2
-            
-            cx = sm_x - sm_width/3 + (cluster_col + 0.5) * cluster_width
-            cy = sm_y - sm_height/3 + (cluster_row + 0.5) * cluster_height
-            
-            # Draw core cluster
-            cluster_color = (0.45, 0.35, 0.25, 1.0)
-            self.view3d._draw_3d_box(cx - cluster_width/3, cy - cluster_height/3, z_offset,
-                                     cluster_width*0.66, cluster_height*0.66, 0.008, cluster_color)
-            
-            # Draw individual cores (simplified representation)
-            for core in range(8):
-                core_x = cx - cluster_width/4 + (core % 4) * cluster_width/8
-                core_y = cy - cluster_height/4 + (core // 4) * cluster_height/4
-                core_color = (0.55, 0.45, 0.35, 1.0)
-                self.view3d._draw_3d_box(core_x - 0.02, core_y - 0.02, z_offset + 0.008,
-                                         0.04, 0.04, 0.004, core_color)
+        cluster = np.arange(4)
+        cx = -sm_width/3 + (cluster % 2 + 0.5) * cluster_width
+        cy = -sm_height/3 + (cluster // 2 + 0.5) * cluster_height
+
+        # Individual cores (simplified representation), 8 per cluster
+        core = np.arange(8)
+        core_x = (cx[:, None] - cluster_width/4 + (core % 4) * cluster_width/8).ravel()
+        core_y = (cy[:, None] - cluster_height/4 + (core // 4) * cluster_height/4).ravel()
+        return [
+            (np.column_stack([cx - cluster_width/3, cy - cluster_height/3]),
+             (cluster_width*0.66, cluster_height*0.66, 0.008), 0.0, (0.45, 0.35, 0.25, 1.0)),
+            (np.column_stack([core_x - 0.02, core_y - 0.02]), (0.04, 0.04, 0.004), 0.008, (0.55, 0.45, 0.35, 1.0)),
+        ]
 
     def _draw_rtx4060ti_vram(self):
         """Draw 8 GDDR6 VRAM chips in exact RTX 4060 Ti layout."""
@@ -779,10 +712,7 @@ class RTX4060TiModel(BaseGPUModel):
         
         # Microscopic bonding wires
         if front:
-            wire_color = (0.8, 0.8, 0.7, 1.0)
-            for i in range(8):
-                wire_x = x - 0.35 + i * 0.07
-                self._draw_bonding_wire(wire_x, y, z + 0.18, wire_x, y - 0.25, z + 0.05, wire_color)
+            self._draw_bonding_wires(x, y, z, 8, 0.35, 0.07, 0.25)
 
     def _draw_bonding_wire(self, x1, y1, z1, x2, y2, z2, color):
         """Draw microscopic bonding wire."""
@@ -830,13 +760,7 @@ class RTX4060TiModel(BaseGPUModel):
         else:
             fin_count = 6
         
-        fin_thickness = 0.08
-        fin_spacing = 24.0 / fin_count
-        
-        for i in range(fin_count):
-            x = -12 + i * fin_spacing
-            fin_color = (0.8, 0.8, 0.85, 1.0)
-            self.view3d._draw_3d_box(x, -5.8, 0.5, fin_thickness, 11.6, 2.5, fin_color)
+        self._draw_heatsink_fins(-12, 24.0, fin_count, -5.8, 11.6, 2.5)
 
     def _draw_rtx4060ti_heat_pipes(self):
         """Draw 4 nickel-plated copper heat pipes."""
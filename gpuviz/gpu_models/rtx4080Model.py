@@ -6,6 +6,7 @@ Complete 1:1 replica with every component found on actual RTX 4080
 from .baseGpuModel import BaseGPUModel
 from typing import Dict, Tuple
 import math
+import numpy as np
 import time
 
 class RTX4080Model(BaseGPUModel):
@@ -518,44 +519,12 @@ class RTX4080Model(BaseGPUModel):
 
     def _draw_pcb_traces(self, pcb_length, pcb_width):
         """Draw realistic PCB traces."""
-        trace_color = (0.7, 0.6, 0.3, 0.8)
-        
-        for i in range(6):
-            y = -pcb_width/2 + (i + 1) * (pcb_width / 7)
-            self.view3d._draw_3d_box(-pcb_length/2 + 2, y - 0.1, 0.08,
-                                     pcb_length - 4, 0.2, 0.05, trace_color)
-        
-        for i in range(12):
-            y = -pcb_width/2 + i * (pcb_width / 12)
-            for j in range(15):
-                x = -pcb_length/2 + j * (pcb_length / 15)
-                self.view3d._draw_3d_box(x, y - 0.05, 0.08, 0.3, 0.1, 0.03, trace_color)
+        # 6 main power traces (thicker) and a 12 x 15 grid of data traces (thinner)
+        self._draw_trace_grid(pcb_length, pcb_width, 6, 12, 15)
 
     def _draw_microscopic_components(self, pcb_length, pcb_width):
         """Draw resistors, capacitors, and other tiny components."""
-        resistor_color = (0.3, 0.2, 0.1, 1.0)
-        
-        for i in range(150):
-            x = -pcb_length/2 + 2 + (i % 25) * (pcb_length - 4) / 25
-            y = -pcb_width/2 + 1 + (i // 25) * (pcb_width - 2) / 6
-            
-            self.view3d._draw_3d_box(x, y, 0.05, 0.1, 0.05, 0.02, resistor_color)
-        
-        capacitor_color = (0.1, 0.1, 0.2, 1.0)
-        
-        for i in range(80):
-            x = -pcb_length/2 + 2 + (i % 16) * (pcb_length - 4) / 16
-            y = -pcb_width/2 + 1 + (i // 16) * (pcb_width - 2) / 5
-            
-            self.view3d._draw_3d_cylinder(x, y, 0.05, 0.03, 0.1, capacitor_color)
-        
-        inductor_color = (0.2, 0.15, 0.1, 1.0)
-        
-        for i in range(15):
-            x = -pcb_length/2 + 3 + i * (pcb_length - 6) / 15
-            y = -pcb_width/2 + pcb_width - 2
-            
-            self.view3d._draw_3d_cylinder(x, y, 0.05, 0.08, 0.15, inductor_color)
+        self._draw_smd_parts(pcb_length, pcb_width, resistors=(150, 25, 6), capacitors=(80, 16, 5), inductors=15)
 
     def _draw_rtx4080_pcb_components(self, pcb_length, pcb_width):
         """Draw all real-world RTX 4080 PCB components."""
@@ -1099,58 +1068,27 @@ class RTX4080Model(BaseGPUModel):
         gpc_count = 4
         sms_per_gpc = 6
         
-        # Calculate SM dimensions
-        total_sms = gpc_count * sms_per_gpc
-        sm_cols = 6
-        sm_rows = 4
-        sm_width = die_size / (sm_cols + 1)
-        sm_height = die_size / (sm_rows + 1)
-        
-        for gpc in range(gpc_count):
-            for sm in range(sms_per_gpc):
-                sm_index = gpc * sms_per_gpc + sm
-                row = sm_index // sm_cols
-                col = sm_index % sm_cols
-                
-                x = -die_size/2 + (col + 0.5) * sm_width
-                y = -die_size/2 + (row + 0.5) * sm_height
-                
-                # SM tile
-                sm_color = (0.35, 0.25, 0.15, 0.9)
-                self.view3d._draw_3d_box(x - sm_width/3, y - sm_height/3, z_offset,
-                                         sm_width*0.66, sm_height*0.66, 0.015, sm_color)
-                
-                # Draw CUDA cores within SM (128 cores per SM)
-                self._draw_cuda_cores_in_sm(x, y, sm_width, sm_height, z_offset + 0.015)
+        # SM tiles on a 6 x 4 grid, each with its CUDA cores
+        self._draw_die_tiles(die_size, z_offset, gpc_count * sms_per_gpc, 6, 4, self._cuda_core_blocks)
 
-    def _draw_cuda_cores_in_sm(self, sm_x, sm_y, sm_width, sm_height, z_offset):
-        """Draw individual CUDA cores within an SM."""
-        # Each SM has 128 CUDA cores arranged in clusters
-        cores_per_cluster = 32
-        clusters_per_sm = 4
-        
+    def _cuda_core_blocks(self, sm_width, sm_height):
+        """Return the CUDA core clusters and cores within an SM, relative to its centre."""
+        # Each SM has 128 CUDA cores arranged in 4 clusters, 2 per row
         cluster_width = sm_width / 3
         cluster_height = sm_height / 3
-        
-        for cluster in range(clusters_per_sm):
-            cluster_row = cluster // 2
-            cluster_col = cluster % 2
-            
-            cx = sm_x - sm_width/3 + (cluster_col + 0.5) * cluster_width
-            cy = sm_y - sm_height/3 + (cluster_row + 0.5) * cluster_height
-            
-            # Draw core cluster
-            cluster_color = (0.45, 0.35, 0.25, 1.0)
-            self.view3d._draw_3d_box(cx - cluster_width/3, cy - cluster_height/3, z_offset,
-                                     cluster_width*0.66, cluster_height*0.66, 0.008, cluster_color)
-            
-            # Draw individual cores (simplified representation)
-            for core in range(8):
-                core_x = cx - cluster_width/4 + (core % 4) * cluster_width/8
-                core_y = cy - cluster_height/4 + (core // 4) * cluster_height/4
-                core_color = (0.55, 0.45, 0.35, 1.0)
-                self.view3d._draw_3d_box(core_x - 0.02, core_y - 0.02, z_offset + 0.008,
-                                         0.04, 0.04, 0.004, core_color)
+        cluster = np.arange(4)
+        cx = -sm_width/3 + (cluster % 2 + 0.5) * cluster_width
+        cy = -sm_height/3 + (cluster // 2 + 0.5) * cluster_height
+
+        # Individual cores (simplified representation), 8 per cluster
+        core = np.arange(8)
+        core_x = (cx[:, None] - cluster_width/4 + (core % 4) * cluster_width/8).ravel()
+        core_y = (cy[:, None] - cluster_height/4 + (core // 4) * cluster_height/4).ravel()
+        return [
+            (np.column_stack([cx - cluster_width/3, cy - cluster_height/3]),
+             (cluster_width*0.66, cluster_height*0.66, 0.008), 0.0, (0.45, 0.35, 0.25, 1.0)),
+            (np.column_stack([core_x - 0.02, core_y - 0.02]), (0.04, 0.04, 0.004), 0.008, (0.55, 0.45, 0.35, 1.0)),
+        ]
 
     def _draw_rtx4080_vram(self):
         """Draw 16 GDDR6X VRAM chips in exact RTX 4080 layout."""
@@ -1181,10 +1119,7 @@ class RTX4080Model(BaseGPUModel):
         
         # Microscopic bonding wires
         if front:
-            wire_color = (0.8, 0.8, 0.7, 1.0)
-            for i in range(12):
-                wire_x = x - 0.45 + i * 0.08
-                self._draw_bonding_wire(wire_x, y, z + 0.18, wire_x, y - 0.25, z + 0.05, wire_color)
+            self._draw_bonding_wires(x, y, z, 12, 0.45, 0.08, 0.25)
 
     def _draw_bonding_wire(self, x1, y1, z1, x2, y2, z2, color):
         """Draw microscopic bonding wire."""
@@ -1232,13 +1167,7 @@ class RTX4080Model(BaseGPUModel):
         else:
             fin_count = 8
         
-        fin_thickness = 0.08
-        fin_spacing = 32.0 / fin_count
-        
-        for i in range(fin_count):
-            x = -16 + i * fin_spacing
-            fin_color = (0.8, 0.8, 0.85, 1.0)
-            self.view3d._draw_3d_box(x, -6.8, 0.5, fin_thickness, 13.6, 4.0, fin_color)
+        self._draw_heatsink_fins(-16, 32.0, fin_count, -6.8, 13.6, 4.0)
 
     def _draw_rtx4080_heat_pipes(self):
         """Draw 8 nickel-plated copper heat pipes."""
@@ -7,6 +7,7 @@ Optimized for smooth rendering with display list caching
 from .baseGpuModel import BaseGPUModel
 from typing import Dict, Tuple
 import math
+import numpy as np
 import time
 
 class RTX4090Model(BaseGPUModel):
@@ -222,49 +223,12 @@ class RTX4090Model(BaseGPUModel):
 
     def _draw_pcb_traces(self, pcb_length, pcb_width):
         """Draw realistic PCB traces."""
-        trace_color = (0.7, 0.6, 0.3, 0.8)
-        
-        # Main power traces (thicker)
-        for i in range(8):
-            y = -pcb_width/2 + (i + 1) * (pcb_width / 9)
-            self.view3d._draw_3d_box(-pcb_length/2 + 2, y - 0.1, 0.08,
-                                     pcb_length - 4, 0.2, 0.05, trace_color)
-        
-        # Data traces (medium thickness)
-        for i in range(16):
-            y = -pcb_width/2 + i * (pcb_width / 16)
-            for j in range(20):
-                x = -pcb_length/2 + j * (pcb_length / 20)
-                self.view3d._draw_3d_box(x, y - 0.05, 0.08, 0.3, 0.1, 0.03, trace_color)
+        # 8 main power traces (thicker) and a 16 x 20 grid of data traces (thinner)
+        self._draw_trace_grid(pcb_length, pcb_width, 8, 16, 20)
 
     def _draw_microscopic_components(self, pcb_length, pcb_width):
         """Draw resistors, capacitors, and other tiny components."""
-        # Surface mount resistors (0402 size: 1.0mm x 0.5mm)
-        resistor_color = (0.3, 0.2, 0.1, 1.0)
-        
-        for i in range(150):
-            x = -pcb_length/2 + 2 + (i % 25) * (pcb_length - 4) / 25
-            y = -pcb_width/2 + 1 + (i // 25) * (pcb_width - 2) / 6
-            
-            self.view3d._draw_3d_box(x, y, 0.05, 0.1, 0.05, 0.02, resistor_color)
-        
-        # Surface mount capacitors
-        capacitor_color = (0.1, 0.1, 0.2, 1.0)
-        
-        for i in range(80):
-            x = -pcb_length/2 + 2 + (i % 16) * (pcb_length - 4) / 16
-            y = -pcb_width/2 + 1 + (i // 16) * (pcb_width - 2) / 5
-            
-            self.view3d._draw_3d_cylinder(x, y, 0.05, 0.03, 0.1, capacitor_color)
-        
-        # Inductors
-        inductor_color = (0.2, 0.15, 0.1, 1.0)
-        
-        for i in range(16):
-            x = -pcb_length/2 + 3 + i * (pcb_length - 6) / 16
-            y = -pcb_width/2 + pcb_width - 2
-            
-            self.view3d._draw_3d_cylinder(x, y, 0.05, 0.08, 0.15, inductor_color)
+        self._draw_smd_parts(pcb_length, pcb_width, resistors=(150, 25, 6), capacitors=(80, 16, 5), inductors=16)
 
     def _draw_rtx4090_pcb_components(self, pcb_length, pcb_width):
         """Draw all real-world RTX 4090 PCB components."""
@@ -324,43 +288,19 @@ class RTX4090Model(BaseGPUModel):
         gpcs = 8
         sms_per_gpc = 12
         
-        # Calculate SM dimensions
-        sm_cols = 12
-        sm_rows = 8
-        sm_width = die_size / (sm_cols + 1)
-        sm_height = die_size / (sm_rows + 1)
-        
-        for gpc in range(gpcs):
-            for sm in range(sms_per_gpc):
-                sm_index = gpc * sms_per_gpc + sm
-                row = sm_index // sm_cols
-                col = sm_index % sm_cols
-                
-                x = -die_size/2 + (col + 0.5) * sm_width
-                y = -die_size/2 + (row + 0.5) * sm_height
-                
-                # SM tile
-                sm_color = (0.35, 0.25, 0.15, 0.9)
-                self.view3d._draw_3d_box(x - sm_width/3, y - sm_height/3, z_offset,
-                                         sm_width*0.66, sm_height*0.66, 0.015, sm_color)
-                
-                # Draw CUDA cores within SM (128 cores per SM)
-                self._draw_cuda_cores_in_sm(x, y, sm_width, sm_height, z_offset + 0.015)
-
-    def _draw_cuda_cores_in_sm(self, sm_x, sm_y, sm_width, sm_height, z_offset):
-        """Draw individual CUDA cores within an SM."""
+        # SM tiles on a 12 x 8 grid, each with its CUDA cores
+        self._draw_die_tiles(die_size, z_offset, gpcs * sms_per_gpc, 12, 8, self._cuda_core_blocks)
+
+    def _cuda_core_blocks(self, sm_width, sm_height):
+        """Return the CUDA cores within an SM, relative to its centre."""
         # Each SM has 128 CUDA cores arranged in 4x32 arrays
-        for subarray in range(4):
-            for core in range(32):
-                array_x = sm_x - sm_width/3 + (subarray % 2) * sm_width/3
-                array_y = sm_y - sm_height/3 + (subarray // 2) * sm_height/3
-                
-                core_x = array_x - sm_width/8 + (core % 8) * sm_width/32
-                core_y = array_y - sm_height/8 + (core // 8) * sm_height/16
-                
-                core_color = (0.45, 0.35, 0.25, 1.0)
-                self.view3d._draw_3d_box(core_x - 0.01, core_y - 0.01, z_offset,
-                                         0.02, 0.02, 0.004, core_color)
+        subarray = np.arange(4)[:, None]
+        core = np.arange(32)[None, :]
+        array_x = -sm_width/3 + (subarray % 2) * sm_width/3
+        array_y = -sm_height/3 + (subarray // 2) * sm_height/3
+        core_x = (array_x - sm_width/8 + (core % 8) * sm_width/32).ravel()
+        core_y = (array_y - sm_height/8 + (core // 8) * sm_height/16).ravel()
+        return [(np.column_stack([core_x - 0.01, core_y - 0.01]), (0.02, 0.02, 0.004), 0.0, (0.45, 0.35, 0.25, 1.0))]
 
     def _draw_rtx4090_vram(self):
         """Draw 24 GDDR6X VRAM chips in exact RTX 4090 layout."""
@@ -392,15 +332,7 @@ class RTX4090Model(BaseGPUModel):
         
         # Microscopic bonding wires
         if front:
-            wire_color = (0.8, 0.8, 0.7, 1.0)
-            for i in range(12):
-                wire_x = x - 0.45 + i * 0.07
-                self._draw_bonding_wire(wire_x, y, z + 0.18, wire_x, y - 0.35, z + 0.05, wire_color)
-
-    def _draw_bonding_wire(self, x1, y1, z1, x2, y2, z2, color):
-        """Draw microscopic bonding wire."""
-        # Simplified bonding wire representation
-        self.view3d._draw_3d_box(x1 - 0.01, y1 - 0.01, z1, 0.02, (y2-y1) + 0.02, 0.01, color)
+            self._draw_bonding_wires(x, y, z, 12, 0.45, 0.07, 0.35)
 
     def _draw_rtx4090_vrms(self):
         """Draw 24-phase VRM power delivery system."""
@@ -489,13 +421,7 @@ class RTX4090Model(BaseGPUModel):
         
         # Optimized heatsink fins (150 fins for RTX 4090)
         fin_count = self.HEATSINK_FINS
-        fin_thickness = 0.08
-        fin_spacing = 33.6 / fin_count
-        
-        for i in range(fin_count):
-            x = -16.8 + i * fin_spacing
-            fin_color = (0.8, 0.8, 0.85, 1.0)
-            self.view3d._draw_3d_box(x, -6.8, 0.5, fin_thickness, 13.6, 5.5, fin_color)
+        self._draw_heatsink_fins(-16.8, 33.6, fin_count, -6.8, 13.6, 5.5)
 
     def _draw_rtx4090_heat_pipes(self):
         """Draw 10 heat pipes with realistic routing."""
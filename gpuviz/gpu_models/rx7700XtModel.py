@@ -6,6 +6,7 @@ Complete 1:1 replica with every component found on actual RX 7700 XT
 from .baseGpuModel import BaseGPUModel
 from typing import Dict, Tuple
 import math
+import numpy as np
 
 class RX7700XTModel(BaseGPUModel):
     """Ultra-realistic RX 7700 XT GPU model with all real-world components."""
@@ -417,49 +418,12 @@ class RX7700XTModel(BaseGPUModel):
 
     def _draw_pcb_traces(self, pcb_length, pcb_width):
         """Draw realistic PCB traces."""
-        trace_color = (0.7, 0.6, 0.3, 0.8)
-
-        # Main power traces (thicker)
-        for i in range(5):
-            y = -pcb_width/2 + (i + 1) * (pcb_width / 6)
-            self.view3d._draw_3d_box(-pcb_length/2 + 2, y - 0.1, 0.08,
-                                     pcb_length - 4, 0.2, 0.05, trace_color)
-
-        # Data traces (medium thickness)
-        for i in range(10):
-            y = -pcb_width/2 + i * (pcb_width / 10)
-            for j in range(12):
-                x = -pcb_length/2 + j * (pcb_length / 12)
-                self.view3d._draw_3d_box(x, y - 0.05, 0.08, 0.3, 0.1, 0.03, trace_color)
+        # 5 main power traces (thicker) and a 10 x 12 grid of data traces (thinner)
+        self._draw_trace_grid(pcb_length, pcb_width, 5, 10, 12)
 
     def _draw_microscopic_components(self, pcb_length, pcb_width):
         """Draw resistors, capacitors, and other tiny components."""
-        # Surface mount resistors (0402 size: 1.0mm x 0.5mm)
-        resistor_color = (0.3, 0.2, 0.1, 1.0)
-
-        for i in range(100):
-            x = -pcb_length/2 + 2 + (i % 18) * (pcb_length - 4) / 18
-            y = -pcb_width/2 + 1 + (i // 18) * (pcb_width - 2) / 6
-
-            self.view3d._draw_3d_box(x, y, 0.05, 0.1, 0.05, 0.02, resistor_color)
-
-        # Surface mount capacitors
-        capacitor_color = (0.1, 0.1, 0.2, 1.0)
-
-        for i in range(50):
-            x = -pcb_length/2 + 2 + (i % 10) * (pcb_length - 4) / 10
-            y = -pcb_width/2 + 1 + (i // 10) * (pcb_width - 2) / 5
-
-            self.view3d._draw_3d_cylinder(x, y, 0.05, 0.03, 0.1, capacitor_color)
-
-        # Inductors
-        inductor_color = (0.2, 0.15, 0.1, 1.0)
-
-        for i in range(10):
-            x = -pcb_length/2 + 3 + i * (pcb_length - 6) / 10
-            y = -pcb_width/2 + pcb_width - 2
-
-            self.view3d._draw_3d_cylinder(x, y, 0.05, 0.08, 0.15, inductor_color)
+        self._draw_smd_parts(pcb_length, pcb_width, resistors=(100, 18, 6), capacitors=(50, 10, 5), inductors=10)
 
     def _draw_rx7700xt_pcb_components(self, pcb_length, pcb_width):
         """Draw all real-world RX 7700 XT PCB components."""
@@ -532,48 +496,24 @@ class RX7700XTModel(BaseGPUModel):
         shader_engines = 6
         wgps_per_se = 3
 
-        # Calculate WGP dimensions
-        wgp_cols = 6
-        wgp_rows = 3
-        wgp_width = die_size / (wgp_cols + 1)
-        wgp_height = die_size / (wgp_rows + 1)
-
-        for se in range(shader_engines):
-            for wgp in range(wgps_per_se):
-                wgp_index = se * wgps_per_se + wgp
-                row = wgp_index // wgp_cols
-                col = wgp_index % wgp_cols
-
-                x = -die_size/2 + (col + 0.5) * wgp_width
-                y = -die_size/2 + (row + 0.5) * wgp_height
-
-                # WGP tile
-                wgp_color = (0.35, 0.25, 0.15, 0.9)
-                self.view3d._draw_3d_box(x - wgp_width/3, y - wgp_height/3, z_offset,
-                                         wgp_width*0.66, wgp_height*0.66, 0.015, wgp_color)
-
-                # Draw compute units within WGP (2 CUs per WGP)
-                self._draw_compute_units_in_wgp(x, y, wgp_width, wgp_height, z_offset + 0.015)
-
-    def _draw_compute_units_in_wgp(self, wgp_x, wgp_y, wgp_width, wgp_height, z_offset):
-        """Draw individual compute units within a WGP."""
-        # Each WGP has 2 Compute Units
-        for cu in range(2):
-            cu_x = wgp_x - wgp_width/4 + cu * wgp_width/2
-            cu_y = wgp_y
-
-            # CU cluster
-            cu_color = (0.45, 0.35, 0.25, 1.0)
-            self.view3d._draw_3d_box(cu_x - wgp_width/6, cu_y - wgp_height/6, z_offset,
-                                     wgp_width/3, wgp_height/3, 0.008, cu_color)
-
-            # Draw wavefronts within CU (simplified representation)
-            for wave in range(4):
-                wave_x = cu_x - wgp_width/12 + (wave % 2) * wgp_width/12
-                wave_y = cu_y - wgp_height/12 + (wave // 2) * wgp_height/12
-                wave_color = (0.55, 0.45, 0.35, 1.0)
-                self.view3d._draw_3d_box(wave_x - 0.02, wave_y - 0.02, z_offset + 0.008,
-                                         0.04, 0.04, 0.004, wave_color)
+        # WGP tiles on a 6 x 3 grid, each with its compute units
+        self._draw_die_tiles(die_size, z_offset, shader_engines * wgps_per_se, 6, 3, self._compute_unit_blocks)
+
+    def _compute_unit_blocks(self, wgp_width, wgp_height):
+        """Return the compute units and wavefronts within a WGP, relative to its centre."""
+        # Each WGP has 2 Compute Units side by side
+        cu_x = -wgp_width/4 + np.arange(2) * wgp_width/2
+        cu_y = np.zeros(2)
+
+        # Wavefronts within each CU (simplified representation), 4 per CU
+        wave = np.arange(4)
+        wave_x = (cu_x[:, None] - wgp_width/12 + (wave % 2) * wgp_width/12).ravel()
+        wave_y = (cu_y[:, None] - wgp_height/12 + (wave // 2) * wgp_height/12).ravel()
+        return [
+            (np.column_stack([cu_x - wgp_width/6, cu_y - wgp_height/6]),
+             (wgp_width/3, wgp_height/3, 0.008), 0.0, (0.45, 0.35, 0.25, 1.0)),
+            (np.column_stack([wave_x - 0.02, wave_y - 0.02]), (0.04, 0.04, 0.004), 0.008, (0.55, 0.45, 0.35, 1.0)),
+        ]
 
     def _draw_rx7700xt_vram(self):
         """Draw 6 GDDR6 VRAM chips in exact RX 7700 XT layout (192-bit bus)."""
@@ -601,15 +541,7 @@ class RX7700XTModel(BaseGPUModel):
 
         # Microscopic bonding wires
         if front:
-            wire_color = (0.8, 0.8, 0.7, 1.0)
-            for i in range(8):
-                wire_x = x - 0.35 + i * 0.07
-                self._draw_bonding_wire(wire_x, y, z + 0.18, wire_x, y - 0.25, z + 0.05, wire_color)
-
-    def _draw_bonding_wire(self, x1, y1, z1, x2, y2, z2, color):
-        """Draw microscopic bonding wire."""
-        # Simplified bonding wire representation
-        self.view3d._draw_3d_box(x1 - 0.01, y1 - 0.01, z1, 0.02, (y2-y1) + 0.02, 0.01, color)
+            self._draw_bonding_wires(x, y, z, 8, 0.35, 0.07, 0.25)
 
     def _draw_rx7700xt_vrms(self):
         """Draw 10-phase VRM power delivery system."""
@@ -698,13 +630,7 @@ class RX7700XTModel(BaseGPUModel):
 
         # Heatsink fins (38 fins for RX 7700 XT)
         fin_count = self.HEATSINK_FINS
-        fin_thickness = 0.08
-        fin_spacing = 26.7 / fin_count
-
-        for i in range(fin_count):
-            x = -13.35 + i * fin_spacing
-            fin_color = (0.8, 0.8, 0.85, 1.0)
-            self.view3d._draw_3d_box(x, -5.8, 0.5, fin_thickness, 11.6, 4.0, fin_color)
+        self._draw_heatsink_fins(-13.35, 26.7, fin_count, -5.8, 11.6, 4.0)
 
     def _draw_rx7700xt_heat_pipes(self):
         """Draw 4 heat pipes with realistic routing."""
@@ -4,25 +4,67 @@ GPU Layout Presets and JSON IO
 Author: 𝙅𝙖𝙠𝙤𝙗 / 𝙎𝙚𝙣𝙨𝙚𝙞 𝙄𝙨𝙨𝙚𝙞
 
 Overview:
-- Preset GPULayout definitions and JSON import/export helpers
+- Preset GPULayout definitions (built lazily on first use) and JSON import/export helpers
 """
-from typing import Dict, List
+import threading
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Tuple
 from .models import GPULayout, GPC, SM, Core
 
-PRESETS: Dict[str, GPULayout] = {
-    "RTX 4090 (Ada – AD102-300)": GPULayout.from_spec("RTX 4090", gpc_count=7, sms_per_gpc=9, cores_per_sm=128),
-    "RTX 4080 (Ada – AD103-300)": GPULayout.from_spec("RTX 4080", gpc_count=5, sms_per_gpc=7, cores_per_sm=128),
-    "RTX 4070 Ti (Ada – AD104-400)": GPULayout.from_spec("RTX 4070 Ti", gpc_count=6, sms_per_gpc=8, cores_per_sm=128),
-    "RTX 4070 (Ada – AD104-250)": GPULayout.from_spec("RTX 4070", gpc_count=5, sms_per_gpc=7, cores_per_sm=128),
-    "RTX 4060 Ti (Ada – AD106-350)": GPULayout.from_spec("RTX 4060 Ti", gpc_count=4, sms_per_gpc=6, cores_per_sm=128),
-    "RTX 4060 (Ada – AD107-400)": GPULayout.from_spec("RTX 4060", gpc_count=3, sms_per_gpc=6, cores_per_sm=128),
-    "RX 7900 XTX (RDNA3 – Navi 31)": GPULayout.from_spec("RX 7900 XTX", gpc_count=12, sms_per_gpc=2, cores_per_sm=64),
-    "RX 7900 XT (RDNA3 – Navi 31)": GPULayout.from_spec("RX 7900 XT", gpc_count=10, sms_per_gpc=2, cores_per_sm=64),
-    "RX 7800 XT (RDNA3 – Navi 32)": GPULayout.from_spec("RX 7800 XT", gpc_count=8, sms_per_gpc=2, cores_per_sm=64),
-    "RX 7700 XT (RDNA3 – Navi 33)": GPULayout.from_spec("RX 7700 XT", gpc_count=6, sms_per_gpc=2, cores_per_sm=64),
-    "NVIDIA H100 SXM5 - Ultra Detailed (Interactive)": GPULayout.from_spec("H100 SXM5", gpc_count=8, sms_per_gpc=18, cores_per_sm=128),
-    "Compact Demo": GPULayout.from_spec("Compact", gpc_count=3, sms_per_gpc=4, cores_per_sm=32),
-}
+class _PresetRegistry(MutableMapping):
+    """Preset name -> GPULayout; spec-defined presets are only built on first lookup."""
+
+    def __init__(self, specs: Dict[str, Tuple[str, int, int, int]]):
+        # Values are GPULayout once built (or assigned), a from_spec argument tuple until then
+        self._entries: Dict[str, object] = dict(specs)
+        # Builds may run on pool threads (load and prefetch); one build per key, shared by all callers
+        self._build_lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> GPULayout:
+        entry = self._entries[key]
+        if isinstance(entry, GPULayout):
+            return entry
+        with self._build_lock:
+            entry = self._entries[key]
+            if not isinstance(entry, GPULayout):
+                name, gpc_count, sms_per_gpc, cores_per_sm = entry
+                entry = GPULayout.from_spec(name, gpc_count=gpc_count, sms_per_gpc=sms_per_gpc, cores_per_sm=cores_per_sm)
+                self._entries[key] = entry
+        return entry
+
+    def __setitem__(self, key: str, layout: GPULayout):
+        self._entries[key] = layout
+
+    def __delitem__(self, key: str):
+        del self._entries[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def is_built(self, key: str) -> bool:
+        """True when key already maps to a GPULayout, so a lookup will not construct one."""
+        return isinstance(self._entries.get(key), GPULayout)
+
+PRESETS: MutableMapping[str, GPULayout] = _PresetRegistry({
+    "RTX 4090 (Ada – AD102-300)": ("RTX 4090", 7, 9, 128),
+    "RTX 4080 (Ada – AD103-300)": ("RTX 4080", 5, 7, 128),
+    "RTX 4070 Ti (Ada – AD104-400)": ("RTX 4070 Ti", 6, 8, 128),
+    "RTX 4070 (Ada – AD104-250)": ("RTX 4070", 5, 7, 128),
+    "RTX 4060 Ti (Ada – AD106-350)": ("RTX 4060 Ti", 4, 6, 128),
+    "RTX 4060 (Ada – AD107-400)": ("RTX 4060", 3, 6, 128),
+    "RX 7900 XTX (RDNA3 – Navi 31)": ("RX 7900 XTX", 12, 2, 64),
+    "RX 7900 XT (RDNA3 – Navi 31)": ("RX 7900 XT", 10, 2, 64),
+    "RX 7800 XT (RDNA3 – Navi 32)": ("RX 7800 XT", 8, 2, 64),
+    "RX 7700 XT (RDNA3 – Navi 33)": ("RX 7700 XT", 6, 2, 64),
+    "NVIDIA H100 SXM5 - Ultra Detailed (Interactive)": ("H100 SXM5", 8, 18, 128),
+    "Compact Demo": ("Compact", 3, 4, 32),
+})
 
 def dump_layout_to_json(layout: GPULayout) -> Dict:
     return {
@@ -62,6 +62,16 @@ class LogWindow(QtWidgets.QWidget):
         self.log_entries: List[dict] = []
         self.max_entries = 1000
         self.performance_mode = False
+        # One paragraph per entry; the document drops its oldest lines once it holds max_entries
+        self.log_display.document().setMaximumBlockCount(self.max_entries)
+        
+        # Entries logged since the last refresh are appended together on the next tick
+        self._pending_entries: List[dict] = []
+        self._needs_rebuild = False
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._flush_pending)
         
         self.setup_highlighting()
     
@@ -88,14 +98,42 @@ class LogWindow(QtWidgets.QWidget):
         self.log_entries.append(entry)
         
         if len(self.log_entries) > self.max_entries:
+            dropped = self.log_entries[:-self.max_entries]
             self.log_entries = self.log_entries[-self.max_entries:]
-        
-        self.update_display()
+            # The block cap only tracks the unfiltered view; a filtered one needs a rebuild
+            filter_level = self.filter_combo.currentText()
+            if filter_level != "All" and any(e['level'] == filter_level for e in dropped):
+                self._needs_rebuild = True
+        
+        self._pending_entries.append(entry)
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+    
+    def _flush_pending(self):
+        if self._needs_rebuild:
+            self.update_display()
+        else:
+            filter_level = self.filter_combo.currentText()
+            for entry in self._pending_entries:
+                if filter_level == "All" or entry['level'] == filter_level:
+                    self.log_display.append(self._format_entry(entry))
+            self._pending_entries.clear()
         
         if self.autoscroll_cb.isChecked():
             self.log_display.moveCursor(QtGui.QTextCursor.End)
     
+    def _format_entry(self, entry: dict) -> str:
+        timestamp_color = self.colors['TIMESTAMP']
+        level_color = self.colors.get(entry['level'], self.colors['INFO'])
+        
+        formatted_entry = f'<span style="color: {timestamp_color}">[{entry["timestamp"]}]</span> '
+        formatted_entry += f'<span style="color: {level_color}; font-weight: bold;">{entry["level"]}</span> '
+        formatted_entry += f'<span style="color: {self.colors["INFO"]}">{entry["message"]}</span>'
+        return formatted_entry
+    
     def update_display(self):
+        self._pending_entries.clear()
+        self._needs_rebuild = False
         self.log_display.clear()
         
         filter_level = self.filter_combo.currentText()
@@ -104,17 +142,12 @@ class LogWindow(QtWidgets.QWidget):
             if filter_level != "All" and entry['level'] != filter_level:
                 continue
             
-            timestamp_color = self.colors['TIMESTAMP']
-            level_color = self.colors.get(entry['level'], self.colors['INFO'])
-            
-            formatted_entry = f'<span style="color: {timestamp_color}">[{entry["timestamp"]}]</span> '
-            formatted_entry += f'<span style="color: {level_color}; font-weight: bold;">{entry["level"]}</span> '
-            formatted_entry += f'<span style="color: {self.colors["INFO"]}">{entry["message"]}</span>'
-            
-            self.log_display.append(formatted_entry)
+            self.log_display.append(self._format_entry(entry))
     
     def clear_log(self):
         self.log_entries.clear()
+        self._pending_entries.clear()
+        self._needs_rebuild = False
         self.log_display.clear()
         self.log("Log cleared", "INFO")
     
@@ -7,6 +7,7 @@ Overview:
 - Real-time GPU activity synthesis across GPC → SM → Core hierarchy
 - DVFS model coupling voltage, frequency, power, and temperature
 - Periodic Qt signal emissions for 2D/3D views at configurable rates
+- Thread-agnostic: may be moved onto a worker QThread; views receive per-step snapshots as queued calls
 
 Key Components:
 - DVFSModel: Computes frequency, power, and temperature evolution
@@ -39,15 +40,24 @@ class DVFSModel:
         return f, power, self.T
 
 class Simulation(QtCore.QObject):
-    updated = QtCore.Signal()
+    # Emits a snapshot dict per step; the layout is shared with the views and never written here
+    updated = QtCore.Signal(object)
+    # Timer control is routed through signals so it lands on the sim's own thread
+    _timer_start = QtCore.Signal(int)
+    _timer_stop = QtCore.Signal()
 
     def __init__(self, layout: GPULayout, logger: Optional[object] = None):
         super().__init__()
         self.layout = layout
         self.logger = logger
+        # Layout structure is fixed, so the per-step loop only walks these
+        self._sm_ids = [sm.id for g in layout.gpcs for sm in g.sms]
+        self._sm_core_counts = [len(sm.cores) for g in layout.gpcs for sm in g.sms]
         self.running = False
         self.timer = QtCore.QTimer(self)
         self.timer.timeout.connect(self.step)
+        self._timer_start.connect(self.timer.start)
+        self._timer_stop.connect(self.timer.stop)
         self.speed_ms = 100
         self.phase = 0.0
         self.global_util = 0.7
@@ -66,7 +76,7 @@ class Simulation(QtCore.QObject):
         old_speed = self.speed_ms
         self.speed_ms = max(16, int(ms))
         if self.running:
-            self.timer.start(self.speed_ms)
+            self._timer_start.emit(self.speed_ms)
         if self.logger:
             self.logger.log(f"Simulation speed changed from {old_speed}ms to {self.speed_ms}ms", "INFO")
 
@@ -88,14 +98,14 @@ class Simulation(QtCore.QObject):
             self._last_wall = time.time()
             self._start_time = time.time()
             self._step_count = 0
-            self.timer.start(self.speed_ms)
+            self._timer_start.emit(self.speed_ms)
             if self.logger:
                 self.logger.log_simulation_event("Simulation started")
 
     def stop(self):
         if self.running:
             self.running = False
-            self.timer.stop()
+            self._timer_stop.emit()
             runtime = time.time() - self._start_time
             if self.logger:
                 self.logger.log_simulation_event(f"Simulation stopped after {runtime:.1f}s ({self._step_count} steps)")
@@ -110,24 +120,46 @@ class Simulation(QtCore.QObject):
         f_ghz, watts, tempC = self.dvfs.step(max(0.001, dt), volts, util)
 
         self.phase += 0.06
-        for g in self.layout.gpcs:
-            for sm in g.sms:
-                base = 0.15 + 0.85 * util
-                wave = 0.25 * math.sin(self.phase + sm.id * 0.19)
-                thermal_drag = max(0.6, 1.0 - max(0.0, tempC - 70) * 0.01)
-                sm.activity = clamp01((base + wave) * thermal_drag + random.uniform(-0.05, 0.05))
-                for i, c in enumerate(sm.cores):
-                    jitter = 0.18 * math.sin(self.phase * 1.7 + i * 0.13)
-                    c.activity = clamp01(0.7 * sm.activity + 0.3 * (base + jitter) + random.uniform(-0.04, 0.04))
-                    c.temperature = clamp01((tempC - 25) / 80.0)
-                    c.mem_pressure = clamp01(0.2 + 0.8 * abs(math.sin(self.phase * 0.6 + i * 0.07)))
+        phase = self.phase
+        base = 0.15 + 0.85 * util
+        thermal_drag = max(0.6, 1.0 - max(0.0, tempC - 70) * 0.01)
+        core_temp = clamp01((tempC - 25) / 80.0)
+        # Per-core terms depend only on the core's index within its SM, so build them once per step
+        cores_per_sm = max(self._sm_core_counts, default=0)
+        core_base = [0.3 * (base + 0.18 * math.sin(phase * 1.7 + i * 0.13)) for i in range(cores_per_sm)]
+        core_mem = [clamp01(0.2 + 0.8 * abs(math.sin(phase * 0.6 + i * 0.07))) for i in range(cores_per_sm)]
+        uniform = random.uniform
+        sm_activities = []
+        core_activities = []
+        core_pressures = []
+        append = core_activities.append
+        for sm_id, core_count in zip(self._sm_ids, self._sm_core_counts):
+            wave = 0.25 * math.sin(phase + sm_id * 0.19)
+            sm_activity = clamp01((base + wave) * thermal_drag + uniform(-0.05, 0.05))
+            sm_activities.append(sm_activity)
+            sm_share = 0.7 * sm_activity
+            for cb in core_base[:core_count]:
+                a = sm_share + cb + uniform(-0.04, 0.04)
+                append(0.0 if a < 0.0 else (1.0 if a > 1.0 else a))
+            core_pressures.extend(core_mem[:core_count])
+        
+        # Per-core values are flat tuples in layout order (GPC -> SM -> core)
+        snapshot = {
+            'sm_activity': tuple(sm_activities),
+            'activity': tuple(core_activities),
+            'temperature': (core_temp,) * len(core_activities),
+            'mem_pressure': tuple(core_pressures),
+            'temperature_c': tempC,
+            'power_w': watts,
+            'freq_ghz': f_ghz,
+        }
         
         self._step_count += 1
         step_duration = (time.time() - start_time) * 1000
         
         if self.logger and self._step_count % 100 == 0:
-            avg_activity = sum(sm.activity for g in self.layout.gpcs for sm in g.sms) / max(1, len([sm for g in self.layout.gpcs for sm in g.sms]))
+            avg_activity = sum(sm_activities) / max(1, len(sm_activities))
             self.logger.log_performance("Simulation step", step_duration)
             self.logger.log(f"Avg SM activity: {avg_activity:.2f}, Temp: {tempC:.1f}°C, Power: {watts:.1f}W, Freq: {f_ghz:.2f}GHz", "PERFORMANCE")
         
-        self.updated.emit()
\ No newline at end of file
+        self.updated.emit(snapshot)
\ No newline at end of file
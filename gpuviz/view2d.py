@@ -15,10 +15,11 @@ from .models import GPULayout, GPC, SM, Core
 from .resources import COLORMAPS
 
 class CoreItem(QtWidgets.QGraphicsRectItem):
-    def __init__(self, core: Core, rect: QtCore.QRectF, get_color, glow: bool):
+    def __init__(self, core: Core, index: int, rect: QtCore.QRectF, view, glow: bool):
         super().__init__(rect)
         self.core = core
-        self.get_color = get_color
+        self.index = index
+        self.view = view
         self.setAcceptHoverEvents(True)
         self.setPen(QtGui.QPen(QtCore.Qt.NoPen))
         self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
@@ -27,11 +28,12 @@ class CoreItem(QtWidgets.QGraphicsRectItem):
             eff.setBlurRadius(6); eff.setOffset(0, 0); eff.setColor(QtGui.QColor(255,255,255,40))
             self.setGraphicsEffect(eff)
 
-    def reinitialize(self, core: Core, rect: QtCore.QRectF, get_color, glow: bool):
+    def reinitialize(self, core: Core, index: int, rect: QtCore.QRectF, view, glow: bool):
         """Reinitialize item with new data when reused from pool"""
         self.setRect(rect)
         self.core = core
-        self.get_color = get_color
+        self.index = index
+        self.view = view
         if glow and not self.graphicsEffect():
             eff = QtWidgets.QGraphicsDropShadowEffect()
             eff.setBlurRadius(6); eff.setOffset(0, 0); eff.setColor(QtGui.QColor(255,255,255,40))
@@ -41,21 +43,25 @@ class CoreItem(QtWidgets.QGraphicsRectItem):
         self.setVisible(True)
 
     def hoverEnterEvent(self, event):
+        util = self.view.core_value(self.core, self.index, 'activity')
+        temp = self.view.core_value(self.core, self.index, 'temperature')
         QtWidgets.QToolTip.showText(
             event.screenPos(),
-            f"Core #{self.core.id}\nUtil: {self.core.activity:.2f}\nTemp: {self.core.temperature*80+25:.0f}°C"
+            f"Core #{self.core.id}\nUtil: {util:.2f}\nTemp: {temp*80+25:.0f}°C"
         )
         super().hoverEnterEvent(event)
 
     def paint(self, painter: QtGui.QPainter, option, widget=None):
-        r, g, b = self.get_color(self.core)
+        r, g, b = self.view.color_for_core(self.core, self.index)
         painter.fillRect(self.rect(), QtGui.QColor(int(r*255), int(g*255), int(b*255)))
 
 
 class SMItem(QtWidgets.QGraphicsRectItem):
-    def __init__(self, sm: SM, rect: QtCore.QRectF, label: bool):
+    def __init__(self, sm: SM, first_core: int, rect: QtCore.QRectF, label: bool, view):
         super().__init__(rect)
         self.sm = sm
+        self.first_core = first_core
+        self.view = view
         self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
         pen = QtGui.QPen(QtGui.QColor(255, 255, 255, 60)); pen.setWidthF(0)
         self.setPen(pen)
@@ -66,10 +72,12 @@ class SMItem(QtWidgets.QGraphicsRectItem):
             self.text.setPos(rect.x() + 2, rect.y() + 2)
         self.setAcceptHoverEvents(True)
 
-    def reinitialize(self, sm: SM, rect: QtCore.QRectF, label: bool):
+    def reinitialize(self, sm: SM, first_core: int, rect: QtCore.QRectF, label: bool, view):
         """Reinitialize item with new data when reused from pool"""
         self.setRect(rect)
         self.sm = sm
+        self.first_core = first_core
+        self.view = view
         if self.text:
             self.text.setText(f"SM {sm.id}")
             self.text.setVisible(label)
@@ -80,7 +88,8 @@ class SMItem(QtWidgets.QGraphicsRectItem):
         self.setVisible(True)
 
     def hoverEnterEvent(self, event):
-        util = sum(c.activity for c in self.sm.cores) / max(1, len(self.sm.cores))
+        util = sum(self.view.core_value(c, self.first_core + k, 'activity')
+                   for k, c in enumerate(self.sm.cores)) / max(1, len(self.sm.cores))
         QtWidgets.QToolTip.showText(event.screenPos(), f"SM #{self.sm.id}\nAvg Util: {util:.2f}")
         super().hoverEnterEvent(event)
 
@@ -237,6 +246,8 @@ class GPU2DView(QtWidgets.QGraphicsView):
         self.scene_ = QtWidgets.QGraphicsScene(self)
         self.setScene(self.scene_)
         self._layout = None
+        # Latest simulation step; per-core values are flat tuples in layout order
+        self._snapshot = None
         self._color_map = COLORMAPS["Turbo"]
         self.coloring_mode = "Utilization"
         self.show_labels = True
@@ -314,8 +325,11 @@ class GPU2DView(QtWidgets.QGraphicsView):
                 g_item.setVisible(True)
                 self.scene_.addItem(g_item)
                 self.gpc_items.append(g_item)
+            first_core = 0
             for sm, s_rect in cache['sm_positions']:
-                s_item = self._get_pooled_item('sm', SMItem, sm, s_rect, self.show_labels if self.view_mode == "Logical" else False)
+                s_item = self._get_pooled_item('sm', SMItem, sm, first_core, s_rect,
+                                               self.show_labels if self.view_mode == "Logical" else False, self)
+                first_core += len(sm.cores)
                 if self.show_grid and self.view_mode != "Logical":
                     pen = QtGui.QPen(QtGui.QColor(255, 255, 255, 40))
                     pen.setWidthF(0)
@@ -325,8 +339,8 @@ class GPU2DView(QtWidgets.QGraphicsView):
                 s_item.setVisible(True)
                 self.scene_.addItem(s_item)
                 self.sm_items.append(s_item)
-            for core, cell in cache['core_positions']:
-                ci = self._get_pooled_item('core', CoreItem, core, cell, self.color_for_core, self._glow_enabled)
+            for index, (core, cell) in enumerate(cache['core_positions']):
+                ci = self._get_pooled_item('core', CoreItem, core, index, cell, self, self._glow_enabled)
                 ci.setVisible(True)
                 self.scene_.addItem(ci)
                 self.core_items.append(ci)
@@ -438,12 +452,16 @@ class GPU2DView(QtWidgets.QGraphicsView):
 
     def set_layout(self, layout: GPULayout):
         self._layout = layout
+        self._snapshot = None
         self._layout_dirty = True
         self._view_dirty = True
         self.rebuild_scene(hard=True)
 
     def set_colormap(self, name: str):
-        self._color_map = COLORMAPS.get(name, COLORMAPS["Turbo"])
+        color_map = COLORMAPS.get(name, COLORMAPS["Turbo"])
+        if color_map is self._color_map:
+            return
+        self._color_map = color_map
         self._color_dirty = True
         self.update_colors()
 
@@ -458,17 +476,28 @@ class GPU2DView(QtWidgets.QGraphicsView):
         self._view_dirty = True
         self.rebuild_scene()
 
-    def metric_for_core(self, c: Core) -> float:
-        if self.coloring_mode == "Utilization":
-            return float(getattr(c, 'activity', 0.0))
+    def set_sim_snapshot(self, snapshot: Optional[dict]):
+        """Color from a simulation step's snapshot instead of the layout's own values."""
+        if snapshot is not None and len(snapshot['activity']) != self._last_core_count:
+            # Emitted for another layout before the sim was swapped out
+            return
+        self._snapshot = snapshot
+        self._color_dirty = True
+
+    def core_value(self, c: Core, index: int, field: str) -> float:
+        if self._snapshot is not None:
+            return float(self._snapshot[field][index])
+        return float(getattr(c, field, 0.0))
+
+    def metric_for_core(self, c: Core, index: int) -> float:
         if self.coloring_mode == "Temperature":
-            return float(getattr(c, 'temperature', 0.0))
+            return self.core_value(c, index, 'temperature')
         if self.coloring_mode == "Memory pressure":
-            return float(getattr(c, 'mem_pressure', 0.0))
-        return float(getattr(c, 'activity', 0.0))
+            return self.core_value(c, index, 'mem_pressure')
+        return self.core_value(c, index, 'activity')
 
-    def color_for_core(self, c: Core) -> Tuple[float, float, float]:
-        return self._color_map(self.metric_for_core(c))
+    def color_for_core(self, c: Core, index: int) -> Tuple[float, float, float]:
+        return self._color_map(self.metric_for_core(c, index))
 
     def start_global_animations(self, comp_ids: list, mode: str):
         if not comp_ids:
@@ -9,9 +9,13 @@ Overview:
 - Integrates with simulation for responsive visual updates
 """
 from typing import Optional, Dict
+from collections import OrderedDict
+from contextlib import contextmanager
 from PySide6 import QtCore, QtGui, QtWidgets
+import ctypes
 import math
 import time
+import numpy as np
 from .gpu_models import get_gpu_model
 from .componentHighlighter import ComponentType
 from OpenGL.GL import (
@@ -23,7 +27,10 @@ from OpenGL.GL import (
     glPushMatrix, glPopMatrix, glVertex2f, glVertex4f, GL_TRIANGLE_STRIP,
     GL_TRIANGLE_FAN, GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE, GL_QUAD_STRIP,
     GL_LINE_SMOOTH, glHint, GL_LINE_SMOOTH_HINT, GL_NICEST, glGenLists,
-    glNewList, glEndList, glCallList, GL_COMPILE, glDeleteLists
+    glNewList, glEndList, glCallList, GL_COMPILE, glDeleteLists,
+    glLoadMatrixd, glGenBuffers, glBindBuffer, glBufferData, glDeleteBuffers, GL_ARRAY_BUFFER,
+    GL_STATIC_DRAW, glEnableClientState, glDisableClientState, GL_VERTEX_ARRAY,
+    GL_COLOR_ARRAY, glVertexPointer, glColorPointer, GL_FLOAT, GL_UNSIGNED_BYTE, glDrawArrays
 )
 from OpenGL.GLU import gluPerspective, gluLookAt
 from OpenGL.GLUT import *
@@ -55,6 +62,216 @@ from .resources import COLORMAPS
 
 BaseGL = QOpenGLWidget if (HAVE_QOPENGLWIDGET and HAVE_GL) else QtWidgets.QWidget
 
+# Value -> member lookup so highlight_component avoids the enum constructor and ValueError
+_COMPONENT_TYPE_MAP = {ct.value: ct for ct in ComponentType}
+
+# show_* flags packed into the static-cache key, one bit each
+_VIS_FLAGS = (
+    "show_chassis", "show_cooling", "show_pcb", "show_gpu_die",
+    "show_vram", "show_power_delivery", "show_backplate",
+    "show_io_bracket", "show_microscopic", "show_traces"
+)
+
+# Unit-cube corners (x, y, z as 0/1) forming a single triangle strip over all six faces
+_BOX_STRIP = (
+    (0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0), (1, 1, 1), (1, 0, 0), (1, 0, 1),
+    (0, 0, 0), (0, 0, 1), (0, 1, 0), (0, 1, 1), (1, 1, 1), (0, 0, 1), (1, 0, 1),
+)
+
+# Hover picks are skipped until the cursor has moved at least this far
+_HOVER_PICK_MIN_MOVE_PX = 3
+
+# Marks "no hover change pending"; None is a real pending target (empty space)
+_NO_PENDING = object()
+
+# Built GPU models kept per layout name so switching back skips reconstruction
+_MODEL_CACHE_MAX = 4
+
+# Compiled static models kept per visibility state; toggling back to one reuses its buffers
+_STATIC_CACHE_MAX = 4
+
+# Interleaved vertex layout recorded by _GeometryBatch: x, y, z, r, g, b, a
+_VERTEX_FLOATS = 7
+# Uploaded layout: float32 position + normalized RGBA8 color (16 bytes instead of 28)
+_VERTEX_STRIDE = 16
+_CYL_SEGMENTS = 16
+# Unit circle for cylinder walls, computed once instead of per call
+_UNIT_RING = tuple(
+    (math.cos(2.0 * math.pi * i / _CYL_SEGMENTS), math.sin(2.0 * math.pi * i / _CYL_SEGMENTS))
+    for i in range(_CYL_SEGMENTS + 1)
+)
+
+# Components per BVH leaf used for hover/click picking
+_BVH_LEAF_SIZE = 2
+# Up to this many components one vectorized slab test beats walking the BVH in Python
+_VECTOR_PICK_MAX = 256
+
+
+def _ray_box_entry(origin, inv_dir, bmin, bmax):
+    """Return the ray's entry distance into an AABB, or None if it misses."""
+    tmin = 0.0
+    tmax = float('inf')
+    for i in range(3):
+        o = origin[i]
+        inv = inv_dir[i]
+        if inv is None:
+            # Ray is parallel to this axis
+            if o < bmin[i] or o > bmax[i]:
+                return None
+        else:
+            t1 = (bmin[i] - o) * inv
+            t2 = (bmax[i] - o) * inv
+            if t1 > t2:
+                t1, t2 = t2, t1
+            if t1 > tmin:
+                tmin = t1
+            if t2 < tmax:
+                tmax = t2
+            if tmin > tmax:
+                return None
+    return tmin
+
+def _ray_boxes_entry(origin, ray_dir, mins, maxs):
+    """Vectorized slab test: entry distance per (N, 3) box, inf where the ray misses."""
+    o = np.asarray(origin, dtype=np.float64)
+    d = np.asarray(ray_dir, dtype=np.float64)
+    parallel = np.abs(d) < 1e-6
+    inv_dir = 1.0 / np.where(parallel, 1.0, d)
+    t1 = (mins - o) * inv_dir
+    t2 = (maxs - o) * inv_dir
+    t_near = np.minimum(t1, t2)
+    t_far = np.maximum(t1, t2)
+    miss = np.zeros(len(mins), dtype=bool)
+    if parallel.any():
+        # Parallel axes only constrain the origin to lie within the slab
+        t_near[:, parallel] = -np.inf
+        t_far[:, parallel] = np.inf
+        miss = ((o < mins) | (o > maxs))[:, parallel].any(axis=1)
+    tmin = np.maximum(t_near.max(axis=1), 0.0)
+    tmax = t_far.min(axis=1)
+    return np.where((tmin <= tmax) & ~miss, tmin, np.inf)
+
+def _perspective_matrix(fovy_deg, aspect, z_near, z_far):
+    """Same matrix gluPerspective multiplies onto the stack (row-major, column vectors)."""
+    f = 1.0 / math.tan(math.radians(fovy_deg) / 2.0)
+    return np.array([
+        [f / aspect, 0.0, 0.0, 0.0],
+        [0.0, f, 0.0, 0.0],
+        [0.0, 0.0, (z_far + z_near) / (z_near - z_far), 2.0 * z_far * z_near / (z_near - z_far)],
+        [0.0, 0.0, -1.0, 0.0],
+    ], dtype=np.float64)
+
+
+def _look_at_matrix(eye, center, up):
+    """Same matrix gluLookAt multiplies onto the stack (row-major, column vectors)."""
+    eye = np.asarray(eye, dtype=np.float64)
+    forward = np.asarray(center, dtype=np.float64) - eye
+    forward /= np.linalg.norm(forward)
+    side = np.cross(forward, np.asarray(up, dtype=np.float64))
+    side /= np.linalg.norm(side)
+    true_up = np.cross(side, forward)
+    m = np.identity(4, dtype=np.float64)
+    m[0, :3] = side
+    m[1, :3] = true_up
+    m[2, :3] = -forward
+    m[:3, 3] = -m[:3, :3] @ eye
+    return m
+
+_PACKED_VERTEX = np.dtype([('pos', np.float32, 3), ('rgba', np.uint8, 4)])
+# Unit-box corners in the same face/winding order as _draw_3d_box
+# Selects max (True) or min (False) per axis for the 8 corners of a box
+_BOX_CORNER_MASK = np.array([[(i >> k) & 1 for k in range(3)] for i in range(8)], dtype=bool)
+_BOX_TEMPLATE = np.array([
+    (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1),
+    (0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0),
+    (0, 1, 0), (0, 1, 1), (1, 1, 1), (1, 1, 0),
+    (0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1),
+    (1, 0, 0), (1, 1, 0), (1, 1, 1), (1, 0, 1),
+    (0, 0, 0), (0, 0, 1), (0, 1, 1), (0, 1, 0),
+], dtype=np.float32)
+# Quad-strip of _draw_3d_cylinder unrolled into quads: ring index and top/bottom per vertex
+_CYL_RING_INDEX = np.array([[i, i, i + 1, i + 1] for i in range(_CYL_SEGMENTS)]).ravel()
+_CYL_TOP = np.tile(np.array([0, 1, 1, 0], dtype=np.float32), _CYL_SEGMENTS)
+_RING_COS = np.array([c for c, _ in _UNIT_RING], dtype=np.float32)
+_RING_SIN = np.array([s for _, s in _UNIT_RING], dtype=np.float32)
+
+
+def _cylinder_quads(centres, radius, height):
+    """Unrolled GL_QUADS wall vertices, shape (N, 4 * _CYL_SEGMENTS, 3), for cylinders at base centres."""
+    xs = centres[:, 0:1] + radius * _RING_COS[_CYL_RING_INDEX][None, :]
+    ys = centres[:, 1:2] + radius * _RING_SIN[_CYL_RING_INDEX][None, :]
+    zs = centres[:, 2:3] + height * _CYL_TOP[None, :]
+    return np.stack([xs, ys, zs], axis=2)
+
+
+def vsync_interval_ms(target_ms, widget=None):
+    """Round target_ms to a whole number of display refresh periods so timer ticks land on vsync."""
+    try:
+        screen = widget.screen() if widget is not None else None
+        if screen is None:
+            screen = QtGui.QGuiApplication.primaryScreen()
+        refresh = screen.refreshRate() if screen is not None else 0.0
+    except Exception:
+        refresh = 0.0
+    if refresh <= 0:
+        return int(target_ms)
+    period = 1000.0 / refresh
+    return max(16, int(round(max(1, round(target_ms / period)) * period)))
+
+
+class _GeometryBatch:
+    """Records box/cylinder draws and expands them into one interleaved vertex array."""
+
+    def __init__(self):
+        # Runs of (kind, flat params) so draw order is preserved across primitive kinds
+        self._runs = []
+
+    def _run(self, kind):
+        if not self._runs or self._runs[-1][0] != kind:
+            self._runs.append((kind, []))
+        return self._runs[-1][1]
+
+    def add_box(self, x, y, z, w, h, d, color):
+        self._run("box").extend((x, y, z, w, h, d, color[0], color[1], color[2], color[3]))
+
+    def add_boxes(self, origins, size, color):
+        """Append many same-sized, same-colored boxes from an (N, 3) array of corners."""
+        rows = np.empty((len(origins), 10), dtype=np.float32)
+        rows[:, 0:3] = origins
+        rows[:, 3:6] = size
+        rows[:, 6:10] = color
+        self._runs.append(("box_array", rows))
+
+    def add_cylinder(self, cx, cy, cz, radius, height, color):
+        self._run("cylinder").extend((cx, cy, cz, radius, height, color[0], color[1], color[2], color[3]))
+
+    def add_cylinders(self, centres, radius, height, color):
+        """Append many same-sized, same-colored cylinders from an (N, 3) array of base centres."""
+        rows = np.empty((len(centres), 9), dtype=np.float32)
+        rows[:, 0:3] = centres
+        rows[:, 3] = radius
+        rows[:, 4] = height
+        rows[:, 5:9] = color
+        self._runs.append(("cylinder_array", rows))
+
+    def build(self):
+        """Return an (N, 7) float32 array of GL_QUADS vertices with colors."""
+        parts = []
+        for kind, data in self._runs:
+            if kind in ("box", "box_array"):
+                a = np.asarray(data, dtype=np.float32).reshape(-1, 10)
+                verts = a[:, None, 0:3] + _BOX_TEMPLATE[None, :, :] * a[:, None, 3:6]
+                colors = np.broadcast_to(a[:, None, 6:10], (len(a), len(_BOX_TEMPLATE), 4))
+            else:
+                a = np.asarray(data, dtype=np.float32).reshape(-1, 9)
+                verts = _cylinder_quads(a[:, 0:3], a[:, 3:4], a[:, 4:5])
+                colors = np.broadcast_to(a[:, None, 5:9], (len(a), len(_CYL_RING_INDEX), 4))
+            parts.append(np.concatenate([verts, colors], axis=2).reshape(-1, _VERTEX_FLOATS))
+        if not parts:
+            return np.empty((0, _VERTEX_FLOATS), dtype=np.float32)
+        return np.ascontiguousarray(np.concatenate(parts), dtype=np.float32)
+
+
 class GPU3DView(BaseGL):
     def __init__(self, layout: Optional[GPULayout] = None, sim=None, logger=None):
         super().__init__()
@@ -62,6 +279,16 @@ class GPU3DView(BaseGL):
         self.sim = sim
         self.logger = logger
         self.gpu_model = None
+        self._model_cache = OrderedDict()
+        
+        # Repaint coalescing: requests inside the frame budget collapse into one timed paint
+        self._paint_clock = QtCore.QElapsedTimer()
+        self._update_pending = False
+        # Duration of the most recent paintGL in ms; the main window reads it to pace sim repaints
+        self.last_paint_ms = 0.0
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(self._flush_update)
 
         self.camera_distance = 100.0
         self.camera_orbit_x = 0.0
@@ -70,6 +297,16 @@ class GPU3DView(BaseGL):
         self.camera_pan_y = 0.0
         self.zoom = 1.0
         self.fov = 45.0
+        # CPU copies of the GL matrices so picking never reads them back from the driver
+        self._proj_matrix = None
+        self._view_matrix = None
+        self._inv_view_proj = None
+        # Column-major copy of the view matrix for glLoadMatrixd; rebuilt only when the camera moves
+        self._view_matrix_gl = None
+        self._view_dirty = True
+        # Orbit eye offset, recomputed only when orbit angles/zoom/distance change
+        self._camera_key = None
+        self._camera_eye = (0.0, 0.0, 0.0)
         
         self.last_pos = None
         self.mouse_mode = "orbit"
@@ -79,6 +316,18 @@ class GPU3DView(BaseGL):
         
         # Interactive component support
         self.interactive_components = {}
+        # Picking BVH: component ids, their (min, max) bounds and flat node list
+        self._pick_ids = []
+        self._pick_bounds = []
+        self._pick_nodes = []
+        self._pick_mins = None
+        self._pick_maxs = None
+        self._scene_min = None
+        self._scene_max = None
+        # Screen-space rectangles of the component boxes, reprojected after camera changes
+        self._pick_rects = None
+        self._last_pick_key = None
+        self._last_pick_hit = None
         self.hovered_component = None
         self.animation_timer = QtCore.QTimer()
         self.animation_timer.timeout.connect(self.update_animation)
@@ -90,9 +339,23 @@ class GPU3DView(BaseGL):
         self._mouse_press_pos = None
         self._dragging = False
         self._press_component_id = None
+        self._press_orbit = None
         # Hover picking throttle
-        self._hover_pick_interval_s = 0.03
-        self._last_pick_time = 0.0
+        self._hover_pick_interval_ms = 30
+        self._pick_clock = QtCore.QElapsedTimer()
+        self._pick_clock.start()
+        self._last_pick_ms = -self._hover_pick_interval_ms
+        self._last_pick_xy = None
+        # Hover hysteresis: a new target must win this many consecutive picks
+        self._pending_hover_id = _NO_PENDING
+        self._pending_hover_count = 0
+        self._hover_hysteresis_n = 2
+        # Whether handle_hover_event has a tooltip up that hover-leave should hide
+        self._tooltip_visible = False
+        self._hover_confirm_timer = QtCore.QTimer(self)
+        self._hover_confirm_timer.setSingleShot(True)
+        self._hover_confirm_timer.timeout.connect(self._confirm_pending_hover)
+        self._last_hover = None
         
         self.show_chassis = True
         self.show_cooling = True
@@ -108,20 +371,19 @@ class GPU3DView(BaseGL):
         self.performance_mode = "balanced"
         self._max_framerate = 60
         
-        visibility_flags = [
-            "show_chassis", "show_cooling", "show_pcb", "show_gpu_die",
-            "show_vram", "show_power_delivery", "show_backplate",
-            "show_io_bracket", "show_microscopic", "show_traces"
-        ]
-        for flag in visibility_flags:
-            setattr(self, flag, True)
-        
-        self._cache = {}
-        self._max_cache_size = 50
-        
-        self._cleanup_timer = QtCore.QTimer()
-        self._cleanup_timer.timeout.connect(self._cleanup_memory)
-        self._cleanup_timer.start(20000)
+        # Last color sent to GL; lets repeated colors skip glColor4f
+        self._current_color = None
+        # Static model geometry: a VBO, or a display list if the buffer cannot be built
+        self._batch = None
+        # (vis mask, isolate, isolated component) -> (vbo, vertex count, display list)
+        self._gpu_render_cache = OrderedDict()
+        self._static_key = None
+        self._rebuild_pending = False
+        # Render cache entries released outside paintGL, waiting for a current context
+        self._gl_delete_queue = []
+        self._gpu_display_list = None
+        self._gpu_vbo = None
+        self._gpu_vbo_count = 0
         
         if HAVE_QOPENGLWIDGET and HAVE_GL:
             self.setMinimumSize(1200, 800)
@@ -136,6 +398,25 @@ class GPU3DView(BaseGL):
         if layout:
             self.set_layout(layout)
 
+    def update(self, *args):
+        """Schedule a repaint, holding paints to at most _max_framerate per second."""
+        if args:
+            return super().update(*args)
+        if self._update_pending or self._update_timer.isActive():
+            return
+        min_interval_ms = 1000 // max(1, getattr(self, '_max_framerate', 60))
+        elapsed_ms = self._paint_clock.elapsed() if self._paint_clock.isValid() else min_interval_ms
+        due_ms = min_interval_ms - elapsed_ms
+        if due_ms <= 0:
+            self._flush_update()
+        else:
+            self._update_timer.start(due_ms)
+
+    def _flush_update(self):
+        # Further requests before the paint lands are dropped instead of re-posted
+        self._update_pending = True
+        super().update()
+
     def reset_camera(self):
         self.camera_distance = 100.0
         self.camera_orbit_x = 0.0
@@ -143,28 +424,24 @@ class GPU3DView(BaseGL):
         self.camera_pan_x = 0.0
         self.camera_pan_y = 0.0
         self.zoom = 1.0
+        self._view_dirty = True
+        self._camera_key = None
         self.update()
 
     def highlight_component(self, component_id: str):
-        try:
-            component_type = ComponentType(component_id)
-            self.highlighted_component = component_type
-            # Rebuild static cache only if we're isolating the highlight
-            if getattr(self, 'isolate_highlight', False):
-                self._gpu_cache_valid = False
-            
-            if hasattr(self, 'gpu_model') and self.gpu_model:
-                self.gpu_model.highlight_component(component_id)
-            else:
-                self.update()
-        except ValueError:
+        component_type = _COMPONENT_TYPE_MAP.get(component_id)
+        if component_type is None:
             self.clear_highlight()
+            return
+        self.highlighted_component = component_type
+        
+        if hasattr(self, 'gpu_model') and self.gpu_model:
+            self.gpu_model.highlight_component(component_id)
+        else:
+            self.update()
     
     def clear_highlight(self):
         self.highlighted_component = None
-        # Rebuild static cache only if we're isolating the highlight
-        if getattr(self, 'isolate_highlight', False):
-            self._gpu_cache_valid = False
         
         if hasattr(self, 'gpu_model') and self.gpu_model:
             self.gpu_model.clear_highlight()
@@ -187,8 +464,7 @@ class GPU3DView(BaseGL):
         
         if component_type in visibility_map:
             setattr(self, visibility_map[component_type], visible)
-            # Invalidate GPU display-list cache so visibility change takes effect immediately
-            self._gpu_cache_valid = False
+            # The static cache is keyed by visibility, so no explicit invalidation is needed
             self.update()
     
     def set_performance_mode(self, mode: str):
@@ -210,17 +486,17 @@ class GPU3DView(BaseGL):
         
         # Adjust hover pick frequency and animation FPS
         if mode == "low":
-            self._hover_pick_interval_s = 0.06  # ~16 picks/sec
+            self._hover_pick_interval_ms = 60  # ~16 picks/sec
             if self.animation_timer.isActive():
-                self.animation_timer.setInterval(80)  # 12.5 FPS overlays
+                self.animation_timer.setInterval(self._hover_frame_interval_ms())  # ~12.5 FPS overlays
         elif mode == "balanced":
-            self._hover_pick_interval_s = 0.03  # ~33 picks/sec
+            self._hover_pick_interval_ms = 30  # ~33 picks/sec
             if self.animation_timer.isActive():
-                self.animation_timer.setInterval(50)  # 20 FPS overlays
+                self.animation_timer.setInterval(self._hover_frame_interval_ms())  # ~20 FPS overlays
         else:  # ultra
-            self._hover_pick_interval_s = 0.02  # 50 picks/sec
+            self._hover_pick_interval_ms = 20  # 50 picks/sec
             if self.animation_timer.isActive():
-                self.animation_timer.setInterval(50)
+                self.animation_timer.setInterval(self._hover_frame_interval_ms())
 
         if self.logger and old_mode != mode:
             self.logger.log(f"Performance mode changed from {old_mode} to {mode}", "INFO")
@@ -230,28 +506,20 @@ class GPU3DView(BaseGL):
     def set_layout(self, layout: GPULayout):
         self.layout = layout
         
-        if hasattr(self, 'gpu_model') and self.gpu_model is not None:
-            try:
-                if hasattr(self.gpu_model, 'view3d_ref'):
-                    self.gpu_model.view3d_ref = None
-                self.gpu_model = None
-                import gc
-                gc.collect()
-            except Exception as e:
-                print(f"Warning: Failed to clean up old GPU model: {e}")
-        
+        # The previous model stays in _model_cache so switching back to it is instant
+        self.gpu_model = None
         self.clear_caches()
         
         try:
             if hasattr(layout, 'name'):
-                self.gpu_model = get_gpu_model(layout.name, self)
+                self.gpu_model = self._get_cached_model(layout.name)
                 if self.logger:
                     self.logger.log_gpu_info(layout.name,
                                            sum(len(sm.cores) for g in layout.gpcs for sm in g.sms),
                                            len([sm for g in layout.gpcs for sm in g.sms]),
                                            len(layout.gpcs))
             else:
-                self.gpu_model = get_gpu_model("RTX 4080 (Ada – illustrative)", self)
+                self.gpu_model = self._get_cached_model("RTX 4080 (Ada – illustrative)")
                 if self.logger:
                     self.logger.log("Using default GPU model: RTX 4080", "INFO")
         except Exception as e:
@@ -261,24 +529,64 @@ class GPU3DView(BaseGL):
         
         self.highlighted_component = None
         self.hovered_component = None
+        self._last_hover = None
         self.interactive_components = {}
         
         # Initialize interactive components if GPU model supports them
         if self.gpu_model and hasattr(self.gpu_model, 'interactive_components'):
             self.interactive_components = self.gpu_model.interactive_components
+        self._build_pick_bvh()
         
         self.update()
 
+    def _get_cached_model(self, name: str):
+        """Return the GPU model for name, reusing a previously built instance when possible."""
+        model = self._model_cache.get(name)
+        if model is not None:
+            self._model_cache.move_to_end(name)
+            if hasattr(model, 'highlighted_component'):
+                model.highlighted_component = None
+            return model
+        
+        model = get_gpu_model(name, self)
+        if model is not None:
+            self._model_cache[name] = model
+            while len(self._model_cache) > _MODEL_CACHE_MAX:
+                self._model_cache.popitem(last=False)
+        return model
+
+    def _hover_frame_interval_ms(self):
+        """Hover overlay tick: ~12.5 FPS in low mode, ~20 FPS otherwise, snapped to the display refresh."""
+        return vsync_interval_ms(80 if self.performance_mode == "low" else 50, self)
+
+    def hideEvent(self, event):
+        # No point animating overlays nobody can see
+        self.animation_timer.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # A paint requested while hidden never lands; don't let it block future updates
+        self._update_pending = False
+        if self.hovered_component and not self.animation_timer.isActive():
+            self.animation_timer.start(self._hover_frame_interval_ms())
+
     def set_colormap(self, name: str):
-        self.color_map = COLORMAPS.get(name, COLORMAPS["Turbo"]); self.update()
+        color_map = COLORMAPS.get(name, COLORMAPS["Turbo"])
+        if color_map is getattr(self, 'color_map', None):
+            return
+        self.color_map = color_map; self.update()
 
     def update_animation(self):
         """Update animation frame for interactive components."""
+        if not self.isVisible():
+            self.animation_timer.stop()
+            return
         self.animation_frame += 1
         # Forward to GPU model if it supports per-frame animation updates
         if self.gpu_model and hasattr(self.gpu_model, 'update_animation'):
             try:
-                self.gpu_model.update_animation(0.05)
+                self.gpu_model.update_animation(self.animation_timer.interval() / 1000.0)
             except Exception:
                 pass
         # Do not invalidate static cache; overlays handle animations
@@ -297,25 +605,53 @@ class GPU3DView(BaseGL):
         if width <= 0 or height <= 0:
             return None
         
+        # Reuse the last result while the cursor sits within a pixel and the camera is unchanged
+        camera_key = (self.camera_orbit_x, self.camera_orbit_y, self.camera_pan_x,
+                      self.camera_pan_y, self.zoom, width, height)
+        last = self._last_pick_key
+        if (last is not None and last[2] == camera_key and
+                abs(last[0] - mouse_x) <= 1 and abs(last[1] - mouse_y) <= 1):
+            return self._last_pick_hit
+        hit = self._pick_uncached(mouse_x, mouse_y, width, height)
+        self._last_pick_key = (mouse_x, mouse_y, camera_key)
+        self._last_pick_hit = hit
+        return hit
+
+    def _pick_uncached(self, mouse_x, mouse_y, width, height):
         # Convert mouse coordinates to OpenGL coordinates
         gl_x = mouse_x
         gl_y = height - mouse_y  # Flip Y coordinate
         
-        # Set up projection matrix for unprojection
-        from OpenGL.GLU import gluUnProject
-        from OpenGL.GL import glGetDoublev, GL_MODELVIEW_MATRIX, GL_PROJECTION_MATRIX, GL_VIEWPORT
-        
-        # Get current matrices
-        modelview = glGetDoublev(GL_MODELVIEW_MATRIX)
-        projection = glGetDoublev(GL_PROJECTION_MATRIX)
-        viewport_array = [0, 0, width, height]
-        
-        # Unproject near and far points
-        try:
-            near_x, near_y, near_z = gluUnProject(gl_x, gl_y, 0.0, modelview, projection, viewport_array)
-            far_x, far_y, far_z = gluUnProject(gl_x, gl_y, 1.0, modelview, projection, viewport_array)
-        except:
-            return None
+        if self._proj_matrix is not None and self._view_matrix is not None:
+            # Unproject near and far points on the CPU from the cached camera matrices
+            try:
+                if self._inv_view_proj is None:
+                    self._inv_view_proj = np.linalg.inv(self._proj_matrix @ self._view_matrix)
+                ndc_x = 2.0 * gl_x / width - 1.0
+                ndc_y = 2.0 * gl_y / height - 1.0
+                points = self._inv_view_proj @ np.array([[ndc_x, ndc_x], [ndc_y, ndc_y],
+                                                          [-1.0, 1.0], [1.0, 1.0]])
+                points = points[:3] / points[3]
+            except Exception:
+                return None
+            near_x, near_y, near_z = points[:, 0].tolist()
+            far_x, far_y, far_z = points[:, 1].tolist()
+        else:
+            # Set up projection matrix for unprojection
+            from OpenGL.GLU import gluUnProject
+            from OpenGL.GL import glGetDoublev, GL_MODELVIEW_MATRIX, GL_PROJECTION_MATRIX, GL_VIEWPORT
+            
+            # Get current matrices
+            modelview = glGetDoublev(GL_MODELVIEW_MATRIX)
+            projection = glGetDoublev(GL_PROJECTION_MATRIX)
+            viewport_array = [0, 0, width, height]
+            
+            # Unproject near and far points
+            try:
+                near_x, near_y, near_z = gluUnProject(gl_x, gl_y, 0.0, modelview, projection, viewport_array)
+                far_x, far_y, far_z = gluUnProject(gl_x, gl_y, 1.0, modelview, projection, viewport_array)
+            except:
+                return None
         
         # Create ray direction
         ray_dir = [far_x - near_x, far_y - near_y, far_z - near_z]
@@ -325,15 +661,138 @@ class GPU3DView(BaseGL):
         
         ray_origin = [near_x, near_y, near_z]
         
-        # Check intersection with each interactive component
+        if not self._pick_nodes:
+            self._build_pick_bvh()
+        if self._scene_min is None:
+            return None
+        inv_dir = [None if abs(d) < 1e-6 else 1.0 / d for d in ray_dir]
+        if _ray_box_entry(ray_origin, inv_dir, self._scene_min, self._scene_max) is None:
+            return None
+        if self._pick_mins is not None and self._view_matrix is not None:
+            rects = self._screen_pick_rects(width, height)
+            if rects is not None:
+                candidates = np.nonzero((rects[:, 0] <= gl_x) & (gl_x <= rects[:, 2]) &
+                                        (rects[:, 1] <= gl_y) & (gl_y <= rects[:, 3]))[0]
+                return self._pick_vectorized_closest(ray_origin, ray_dir, candidates)
+        if self._pick_mins is not None and len(self._pick_ids) <= _VECTOR_PICK_MAX:
+            return self._pick_vectorized_closest(ray_origin, ray_dir)
+        return self._pick_bvh_closest(ray_origin, ray_dir)
+
+    def _screen_pick_rects(self, width, height):
+        """Project every component box to a GL window-space rectangle for the current camera."""
+        if self._pick_rects is not None:
+            return self._pick_rects
+        try:
+            corners = np.where(_BOX_CORNER_MASK, self._pick_maxs[:, None, :], self._pick_mins[:, None, :])
+            mvp = self._proj_matrix @ self._view_matrix
+            clip = corners @ mvp[:, :3].T + mvp[:, 3]
+            w = clip[..., 3]
+            behind = (w <= 1e-6).any(axis=1)
+            w = np.where(w <= 1e-6, 1.0, w)
+            sx = (clip[..., 0] / w + 1.0) * 0.5 * width
+            sy = (clip[..., 1] / w + 1.0) * 0.5 * height
+            rects = np.stack([sx.min(axis=1), sy.min(axis=1), sx.max(axis=1), sy.max(axis=1)], axis=1)
+            # Boxes crossing the near plane don't project cleanly; always hand them to the ray test
+            rects[behind] = (-np.inf, -np.inf, np.inf, np.inf)
+        except Exception:
+            return None
+        self._pick_rects = rects
+        return rects
+
+    def _pick_vectorized_closest(self, ray_origin, ray_dir, candidates=None):
+        """Test the ray against the component boxes at once and return the nearest id."""
+        mins, maxs = self._pick_mins, self._pick_maxs
+        if candidates is not None:
+            if len(candidates) == 0:
+                return None
+            mins, maxs = mins[candidates], maxs[candidates]
+        hits = _ray_boxes_entry(ray_origin, ray_dir, mins, maxs)
+        idx = int(np.argmin(hits))
+        if not np.isfinite(hits[idx]):
+            return None
+        if candidates is not None:
+            idx = int(candidates[idx])
+        return self._pick_ids[idx]
+
+    def _build_pick_bvh(self):
+        """Build a median-split BVH over the interactive component bounds."""
+        self._pick_ids = []
+        self._pick_bounds = []
+        self._pick_nodes = []
+        self._pick_mins = None
+        self._pick_maxs = None
+        self._scene_min = None
+        self._scene_max = None
+        # Screen-space rectangles of the component boxes, reprojected after camera changes
+        self._pick_rects = None
+        self._last_pick_key = None
+        self._last_pick_hit = None
+        for comp_id, comp_data in self.interactive_components.items():
+            try:
+                position = comp_data['position']
+                size = comp_data['size']
+                bmin = tuple(position[i] - size[i]/2 for i in range(3))
+                bmax = tuple(position[i] + size[i]/2 for i in range(3))
+            except (KeyError, TypeError, IndexError):
+                continue
+            self._pick_ids.append(comp_id)
+            self._pick_bounds.append((bmin, bmax))
+        
+        if self._pick_ids:
+            self._build_bvh_node(list(range(len(self._pick_ids))))
+            # Root node bounds the whole model; rays that miss it skip all component tests
+            self._scene_min, self._scene_max = self._pick_nodes[0][0], self._pick_nodes[0][1]
+            self._pick_mins = np.array([b[0] for b in self._pick_bounds], dtype=np.float64)
+            self._pick_maxs = np.array([b[1] for b in self._pick_bounds], dtype=np.float64)
+
+    def _build_bvh_node(self, indices):
+        bounds = [self._pick_bounds[i] for i in indices]
+        node_min = tuple(min(b[0][k] for b in bounds) for k in range(3))
+        node_max = tuple(max(b[1][k] for b in bounds) for k in range(3))
+        
+        node_index = len(self._pick_nodes)
+        self._pick_nodes.append(None)
+        if len(indices) <= _BVH_LEAF_SIZE:
+            self._pick_nodes[node_index] = (node_min, node_max, -1, -1, tuple(indices))
+            return node_index
+        
+        # Split at the median centre along the widest axis
+        axis = max(range(3), key=lambda k: node_max[k] - node_min[k])
+        bounds_of = self._pick_bounds
+        indices.sort(key=lambda i: bounds_of[i][0][axis] + bounds_of[i][1][axis])
+        mid = len(indices) // 2
+        left = self._build_bvh_node(indices[:mid])
+        right = self._build_bvh_node(indices[mid:])
+        self._pick_nodes[node_index] = (node_min, node_max, left, right, ())
+        return node_index
+
+    def _pick_bvh_closest(self, ray_origin, ray_dir):
+        """Traverse the picking BVH and return the id of the nearest hit component."""
+        if not self._pick_nodes:
+            return None
+        
+        inv_dir = [None if abs(d) < 1e-6 else 1.0 / d for d in ray_dir]
+        nodes = self._pick_nodes
+        bounds = self._pick_bounds
         closest_hit = None
         closest_distance = float('inf')
         
-        for comp_id, comp_data in self.interactive_components.items():
-            hit_distance = self._ray_intersects_component(ray_origin, ray_dir, comp_data)
-            if hit_distance is not None and hit_distance < closest_distance:
-                closest_distance = hit_distance
-                closest_hit = comp_id
+        stack = [0]
+        while stack:
+            node_min, node_max, left, right, leaf = nodes[stack.pop()]
+            t = _ray_box_entry(ray_origin, inv_dir, node_min, node_max)
+            # Prune subtrees that miss or start behind the current best hit
+            if t is None or t >= closest_distance:
+                continue
+            if leaf:
+                for i in leaf:
+                    hit_distance = _ray_box_entry(ray_origin, inv_dir, bounds[i][0], bounds[i][1])
+                    if hit_distance is not None and hit_distance < closest_distance:
+                        closest_distance = hit_distance
+                        closest_hit = self._pick_ids[i]
+            else:
+                stack.append(right)
+                stack.append(left)
         
         return closest_hit
 
@@ -342,34 +801,17 @@ class GPU3DView(BaseGL):
         position = comp_data['position']
         size = comp_data['size']
         
-        # Simple AABB (Axis-Aligned Bounding Box) intersection
-        # Component bounds
         min_bounds = [position[0] - size[0]/2, position[1] - size[1]/2, position[2] - size[2]/2]
         max_bounds = [position[0] + size[0]/2, position[1] + size[1]/2, position[2] + size[2]/2]
-        
-        # Ray-AABB intersection algorithm
-        tmin = 0.0
-        tmax = float('inf')
-        
-        for i in range(3):
-            if abs(ray_dir[i]) < 1e-6:
-                # Ray is parallel to this axis
-                if ray_origin[i] < min_bounds[i] or ray_origin[i] > max_bounds[i]:
-                    return None
-            else:
-                t1 = (min_bounds[i] - ray_origin[i]) / ray_dir[i]
-                t2 = (max_bounds[i] - ray_origin[i]) / ray_dir[i]
-                
-                tmin = max(tmin, min(t1, t2))
-                tmax = min(tmax, max(t1, t2))
-                
-                if tmin > tmax:
-                    return None
-        
-        return tmin if tmin >= 0 else None
+        inv_dir = [None if abs(d) < 1e-6 else 1.0 / d for d in ray_dir]
+        return _ray_box_entry(ray_origin, inv_dir, min_bounds, max_bounds)
 
     def handle_hover_event(self, component_id):
         """Handle hover enter for interactive component."""
+        if component_id == self._last_hover:
+            return
+        self._last_hover = component_id
+        
         if self.gpu_model and hasattr(self.gpu_model, 'handle_hover_event'):
             self.gpu_model.handle_hover_event(component_id)
         
@@ -381,6 +823,7 @@ class GPU3DView(BaseGL):
             # Get global mouse position for tooltip
             cursor_pos = QtGui.QCursor.pos()
             QtWidgets.QToolTip.showText(cursor_pos, tooltip_text)
+            self._tooltip_visible = True
         
         # Do not invalidate static cache on hover; overlays will handle dynamic visuals
 
@@ -404,11 +847,21 @@ class GPU3DView(BaseGL):
         aspect = w / max(1.0, float(h))
         gluPerspective(self.fov / self.zoom, aspect, 1.0, 1000.0)
         glMatrixMode(GL_MODELVIEW)
+        self._proj_matrix = _perspective_matrix(self.fov / self.zoom, aspect, 1.0, 1000.0)
+        self._inv_view_proj = None
+        self._pick_rects = None
 
     def paintGL(self):
         if not (HAVE_QOPENGLWIDGET and HAVE_GL): return
         
-        start_time = time.time()
+        start_time = time.perf_counter()
+        self._paint_clock.restart()
+        self._update_pending = False
+        self._current_color = None
+        if self._gl_delete_queue:
+            for entry in self._gl_delete_queue:
+                self._delete_static_entry(entry)
+            self._gl_delete_queue.clear()
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glMatrixMode(GL_MODELVIEW)
         glLoadIdentity()
@@ -433,40 +886,63 @@ class GPU3DView(BaseGL):
         
         self._draw_gpu_smart_cached()
         
-        render_time = (time.time() - start_time) * 1000
+        render_time = (time.perf_counter() - start_time) * 1000
+        self.last_paint_ms = render_time
         if self.logger and render_time > 16.67:
             self.logger.log_performance("3D render frame", render_time)
 
     def _setup_camera(self):
-        orbit_x_rad = math.radians(self.camera_orbit_x)
-        orbit_y_rad = math.radians(self.camera_orbit_y)
-        
-        zoomed_distance = self.camera_distance / self.zoom
-        
-        cam_x = zoomed_distance * math.cos(orbit_y_rad) * math.sin(orbit_x_rad)
-        cam_y = zoomed_distance * math.sin(orbit_y_rad)
-        cam_z = zoomed_distance * math.cos(orbit_y_rad) * math.cos(orbit_x_rad)
+        if not self._view_dirty and self._view_matrix_gl is not None:
+            glLoadMatrixd(self._view_matrix_gl)
+            return
         
-        gluLookAt(
-            cam_x + self.camera_pan_x, cam_y + self.camera_pan_y, cam_z,
-            self.camera_pan_x, self.camera_pan_y, 0,
-            0, 1, 0
+        camera_key = (self.camera_orbit_x, self.camera_orbit_y, self.zoom, self.camera_distance)
+        if camera_key != self._camera_key:
+            orbit_x_rad = math.radians(self.camera_orbit_x)
+            orbit_y_rad = math.radians(self.camera_orbit_y)
+            
+            zoomed_distance = self.camera_distance / self.zoom
+            
+            self._camera_eye = (
+                zoomed_distance * math.cos(orbit_y_rad) * math.sin(orbit_x_rad),
+                zoomed_distance * math.sin(orbit_y_rad),
+                zoomed_distance * math.cos(orbit_y_rad) * math.cos(orbit_x_rad),
+            )
+            self._camera_key = camera_key
+        cam_x, cam_y, cam_z = self._camera_eye
+        
+        self._view_matrix = _look_at_matrix(
+            (cam_x + self.camera_pan_x, cam_y + self.camera_pan_y, cam_z),
+            (self.camera_pan_x, self.camera_pan_y, 0.0),
+            (0.0, 1.0, 0.0)
         )
+        self._view_matrix_gl = np.ascontiguousarray(self._view_matrix.T)
+        self._inv_view_proj = None
+        self._pick_rects = None
+        self._view_dirty = False
+        glLoadMatrixd(self._view_matrix_gl)
 
     def _draw_gpu_smart_cached(self):
         if hasattr(self, 'gpu_model') and self.gpu_model:
             try:
-                current_state = self.get_component_visibility_state()
-                # Rebuild static cache only when visibility/highlight state changes
-                if (not hasattr(self, '_gpu_cache_valid') or not self._gpu_cache_valid or
-                    current_state != getattr(self, '_cached_component_state', None)):
-                    self._rebuild_gpu_cache()
-                    self._cached_component_state = current_state
+                key = self._static_cache_key()
+                if not getattr(self, '_gpu_cache_valid', False):
+                    # Explicit invalidation drops whatever was compiled for the current state
+                    self._drop_static_entry(key)
                     self._gpu_cache_valid = True
+                # Swap in compiled states directly; new states are compiled after this frame
+                if key != self._static_key or key not in self._gpu_render_cache:
+                    if key in self._gpu_render_cache:
+                        self._use_static_entry(key)
+                    else:
+                        self._schedule_static_build()
 
-                # Draw static cached geometry
-                if hasattr(self, '_gpu_display_list') and self._gpu_display_list:
+                # Draw static cached geometry; a pending build keeps showing the previous entry
+                if self._gpu_vbo:
+                    self._draw_gpu_vbo()
+                elif hasattr(self, '_gpu_display_list') and self._gpu_display_list:
                     glCallList(self._gpu_display_list)
+                    self._current_color = None
                 else:
                     self.gpu_model.draw_complete_model(0)
 
@@ -494,34 +970,114 @@ class GPU3DView(BaseGL):
         if self.layout:
             self._draw_simple_gpu()
 
-    def get_component_visibility_state(self):
-        return {
-            'show_chassis': self.show_chassis,
-            'show_cooling': self.show_cooling,
-            'show_pcb': self.show_pcb,
-            'show_gpu_die': self.show_gpu_die,
-            'show_vram': self.show_vram,
-            'show_power_delivery': self.show_power_delivery,
-            'show_backplate': self.show_backplate,
-            'show_io_bracket': self.show_io_bracket,
-            'show_microscopic': self.show_microscopic,
-            'show_traces': self.show_traces
-        }
+    def _static_cache_key(self):
+        # Highlight colours are baked into the compiled geometry, so the highlight is part of the state
+        isolate = bool(getattr(self, 'isolate_highlight', False))
+        highlighted = getattr(self.gpu_model, 'highlighted_component', None)
+        return (self._vis_mask(), isolate, highlighted)
+
+    def _use_static_entry(self, key):
+        """Make the compiled model for key current, building it on a cache miss."""
+        entry = self._gpu_render_cache.get(key)
+        if entry is None:
+            self._rebuild_gpu_cache()
+            entry = (self._gpu_vbo, self._gpu_vbo_count, self._gpu_display_list)
+            self._gpu_render_cache[key] = entry
+            while len(self._gpu_render_cache) > _STATIC_CACHE_MAX:
+                _, old = self._gpu_render_cache.popitem(last=False)
+                self._delete_static_entry(old)
+        else:
+            self._gpu_render_cache.move_to_end(key)
+            self._gpu_vbo, self._gpu_vbo_count, self._gpu_display_list = entry
+        self._static_key = key
+
+    def _schedule_static_build(self):
+        """Compile the current state outside paintGL so toggles don't stall a frame."""
+        if not self._rebuild_pending:
+            self._rebuild_pending = True
+            QtCore.QTimer.singleShot(0, self, self._deferred_static_build)
+
+    def _deferred_static_build(self):
+        self._rebuild_pending = False
+        if not (hasattr(self, 'gpu_model') and self.gpu_model):
+            return
+        try:
+            self.makeCurrent()
+            try:
+                self._use_static_entry(self._static_cache_key())
+            finally:
+                self.doneCurrent()
+        except Exception as e:
+            if self.logger:
+                self.logger.log_warning(f"Deferred GPU cache rebuild failed: {e}")
+        self.update()
+
+    def _drop_static_entry(self, key):
+        entry = self._gpu_render_cache.pop(key, None)
+        if entry is not None:
+            self._delete_static_entry(entry)
+        if key == self._static_key:
+            # The handles pointed at the deleted entry; draw immediately until a rebuild
+            self._static_key = None
+            self._gpu_display_list = None
+            self._gpu_vbo = None
+            self._gpu_vbo_count = 0
+
+    def _delete_static_entry(self, entry):
+        vbo, _, display_list = entry
+        try:
+            if vbo:
+                glDeleteBuffers(1, [vbo])
+            if display_list:
+                glDeleteLists(display_list, 1)
+        except Exception:
+            pass
+
+    def _release_static_cache(self):
+        # Callers may not have the GL context current; paintGL frees these on its next run
+        self._gl_delete_queue.extend(self._gpu_render_cache.values())
+        self._gpu_render_cache.clear()
+        self._static_key = None
+        self._gpu_display_list = None
+        self._gpu_vbo = None
+        self._gpu_vbo_count = 0
+
+    def _vis_mask(self):
+        """Pack the show_* flags into an int so cache checks are a single compare."""
+        mask = 0
+        for bit, flag in enumerate(_VIS_FLAGS):
+            if getattr(self, flag):
+                mask |= 1 << bit
+        return mask
 
     def _rebuild_gpu_cache(self):
         try:
             start_time = time.time()
             
-            if hasattr(self, '_gpu_display_list') and self._gpu_display_list:
-                glDeleteLists(self._gpu_display_list, 1)
+            # Buffers of other states stay alive in _gpu_render_cache; start from empty handles
+            self._gpu_display_list = None
+            self._gpu_vbo = None
+            self._gpu_vbo_count = 0
             
-            self._gpu_display_list = glGenLists(1)
-            glNewList(self._gpu_display_list, GL_COMPILE)
-            
-            if hasattr(self, 'gpu_model') and self.gpu_model:
-                self.gpu_model.draw_complete_model(0)
+            built = False
+            try:
+                built = self._build_gpu_vbo()
+            except Exception as e:
+                self._delete_gpu_vbo()
+                if self.logger:
+                    self.logger.log_warning(f"VBO build failed, using display list: {e}")
             
-            glEndList()
+            if not built:
+                self._gpu_display_list = glGenLists(1)
+                # The list must record its own color changes, so start from an unknown color
+                self._current_color = None
+                glNewList(self._gpu_display_list, GL_COMPILE)
+                
+                if hasattr(self, 'gpu_model') and self.gpu_model:
+                    self.gpu_model.draw_complete_model(0)
+                
+                glEndList()
+                self._current_color = None
             
             rebuild_time = (time.time() - start_time) * 1000
             if self.logger:
@@ -533,6 +1089,58 @@ class GPU3DView(BaseGL):
                 self.logger.log_error(f"Failed to rebuild GPU cache: {e}")
             self._gpu_cache_valid = False
 
+    def _build_gpu_vbo(self):
+        """Record the static model into a batch and upload it as one vertex buffer."""
+        if not (hasattr(self, 'gpu_model') and self.gpu_model):
+            return False
+        
+        batch = _GeometryBatch()
+        self._batch = batch
+        self._current_color = None
+        try:
+            self.gpu_model.draw_complete_model(0)
+        finally:
+            self._batch = None
+            self._current_color = None
+        
+        verts = batch.build()
+        if not len(verts):
+            return False
+        
+        # Colors only need display precision; quantize them to RGBA8
+        data = np.empty(len(verts), dtype=_PACKED_VERTEX)
+        data['pos'] = verts[:, 0:3]
+        data['rgba'] = np.clip(np.rint(verts[:, 3:7] * 255.0), 0, 255)
+        
+        self._gpu_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self._gpu_vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self._gpu_vbo_count = len(verts)
+        return True
+
+    def _draw_gpu_vbo(self):
+        glBindBuffer(GL_ARRAY_BUFFER, self._gpu_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, _VERTEX_STRIDE, ctypes.c_void_p(0))
+        glColorPointer(4, GL_UNSIGNED_BYTE, _VERTEX_STRIDE, ctypes.c_void_p(12))
+        glDrawArrays(GL_QUADS, 0, self._gpu_vbo_count)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        # The color array leaves the current GL color undefined
+        self._current_color = None
+
+    def _delete_gpu_vbo(self):
+        if self._gpu_vbo:
+            try:
+                glDeleteBuffers(1, [self._gpu_vbo])
+            except Exception:
+                pass
+        self._gpu_vbo = None
+        self._gpu_vbo_count = 0
+
     def _draw_generic_ultra_gpu(self):
         if self.show_pcb:
             self._draw_ultra_pcb()
@@ -560,7 +1168,7 @@ class GPU3DView(BaseGL):
         pcb_width = 11.0
         pcb_thickness = 0.15
         
-        glColor4f(0.1, 0.25, 0.1, 1.0)
+        self._set_color((0.1, 0.25, 0.1, 1.0))
         self._draw_3d_box(-pcb_length/2, -pcb_width/2, -pcb_thickness/2,
                          pcb_length, pcb_width, pcb_thickness)
         
@@ -571,7 +1179,7 @@ class GPU3DView(BaseGL):
             self._draw_microscopic_components(pcb_length, pcb_width)
 
     def _draw_pcb_traces(self, pcb_length, pcb_width):
-        glColor4f(0.7, 0.6, 0.3, 0.8)
+        self._set_color((0.7, 0.6, 0.3, 0.8))
         glLineWidth(0.1)
         
         for i in range(20):
@@ -591,33 +1199,31 @@ class GPU3DView(BaseGL):
     def _draw_microscopic_components(self, pcb_length, pcb_width):
         resistor_color = (0.3, 0.2, 0.1, 1.0)
         
-        for i in range(100):
-            x = -pcb_length/2 + (i % 20) * (pcb_length / 20)
-            y = -pcb_width/2 + (i // 20) * (pcb_width / 5)
-            
-            glColor4f(*resistor_color)
-            self._draw_3d_box(x, y, 0.05, 0.1, 0.05, 0.02)
+        with self.color_group(resistor_color):
+            for i in range(100):
+                x = -pcb_length/2 + (i % 20) * (pcb_length / 20)
+                y = -pcb_width/2 + (i // 20) * (pcb_width / 5)
+                self._draw_3d_box(x, y, 0.05, 0.1, 0.05, 0.02)
         
         capacitor_color = (0.1, 0.1, 0.2, 1.0)
         
-        for i in range(50):
-            x = -pcb_length/2 + (i % 10) * (pcb_length / 10)
-            y = -pcb_width/2 + 2 + (i // 10) * 0.5
-            
-            glColor4f(*capacitor_color)
-            self._draw_3d_box(x, y, 0.05, 0.1, 0.05, 0.02)
+        with self.color_group(capacitor_color):
+            for i in range(50):
+                x = -pcb_length/2 + (i % 10) * (pcb_length / 10)
+                y = -pcb_width/2 + 2 + (i // 10) * 0.5
+                self._draw_3d_box(x, y, 0.05, 0.1, 0.05, 0.02)
 
     def _draw_ultra_gpu_package(self):
         pkg_size = 3.0
         pkg_thickness = 0.1
         
-        glColor4f(0.05, 0.1, 0.05, 1.0)
+        self._set_color((0.05, 0.1, 0.05, 1.0))
         self._draw_3d_box(-pkg_size/2, -pkg_size/2, 0, pkg_size, pkg_size, pkg_thickness)
         
         die_size = 1.5
         die_thickness = 0.08
         
-        glColor4f(0.2, 0.2, 0.3, 1.0)
+        self._set_color((0.2, 0.2, 0.3, 1.0))
         self._draw_3d_box(-die_size/2, -die_size/2, pkg_thickness,
                          die_size, die_size, die_thickness)
         
@@ -634,7 +1240,7 @@ class GPU3DView(BaseGL):
                 x = -die_size/2 + (i + 0.5) * sm_size
                 y = -die_size/2 + (j + 0.5) * sm_size
             
-                glColor4f(0.4, 0.3, 0.2, 0.9)
+                self._set_color((0.4, 0.3, 0.2, 0.9))
                 self._draw_3d_box(x - sm_size/3, y - sm_size/3, z_offset + die_thickness,
                                  sm_size*0.66, sm_size*0.66, 0.01)
                 
@@ -643,7 +1249,7 @@ class GPU3DView(BaseGL):
                         for cj in range(4):
                             cx = x - sm_size/3 + (ci + 0.5) * sm_size/6
                             cy = y - sm_size/3 + (cj + 0.5) * sm_size/6
-                            glColor4f(0.6, 0.5, 0.4, 1.0)
+                            self._set_color((0.6, 0.5, 0.4, 1.0))
                             self._draw_3d_box(cx - 0.02, cy - 0.02, z_offset + die_thickness + 0.01,
                                              0.04, 0.04, 0.005)
 
@@ -654,22 +1260,24 @@ class GPU3DView(BaseGL):
             (-10, 0), (10, 0)
         ]
         
+        with self.color_group((0.1, 0.1, 0.2, 1.0)):
+            for x, y in vram_positions:
+                self._draw_3d_box(x - 0.7, y - 0.4, 0.1, 1.4, 0.8, 0.1)
+        
+        with self.color_group((0.3, 0.3, 0.4, 1.0)):
+            for x, y in vram_positions:
+                self._draw_3d_box(x - 0.5, y - 0.3, 0.2, 1.0, 0.6, 0.05)
+        
         for x, y in vram_positions:
-            glColor4f(0.1, 0.1, 0.2, 1.0)
-            self._draw_3d_box(x - 0.7, y - 0.4, 0.1, 1.4, 0.8, 0.1)
-            
-            glColor4f(0.3, 0.3, 0.4, 1.0)
-            self._draw_3d_box(x - 0.5, y - 0.3, 0.2, 1.0, 0.6, 0.05)
-            
             if self.detail_level == "ultra":
-                glColor4f(0.8, 0.8, 0.7, 1.0)
+                self._set_color((0.8, 0.8, 0.7, 1.0))
                 for i in range(8):
                     wire_x = x - 0.4 + i * 0.1
                     self._draw_bonding_wire(wire_x, y, 0.25, wire_x, y - 0.2, 0.1)
 
     def _draw_bonding_wire(self, x1, y1, z1, x2, y2, z2):
         glLineWidth(0.02)
-        glColor4f(0.8, 0.8, 0.7, 1.0)
+        self._set_color((0.8, 0.8, 0.7, 1.0))
         glBegin(GL_LINES)
         glVertex3f(x1, y1, z1)
         glVertex3f((x1+x2)/2, (y1+y2)/2, max(z1, z2) + 0.1)
@@ -680,32 +1288,34 @@ class GPU3DView(BaseGL):
     def _draw_ultra_power_delivery(self):
         vrm_positions = [(-12, -8), (-12, 8), (12, -8), (12, 8)]
         
-        for x, y in vrm_positions:
-            glColor4f(0.2, 0.2, 0.2, 1.0)
-            self._draw_3d_box(x - 0.5, y - 0.5, 0.1, 1.0, 1.0, 0.2)
-            
-            for i in range(10):
-                fin_x = x - 0.4 + i * 0.08
-                glColor4f(0.7, 0.7, 0.8, 1.0)
-                self._draw_3d_box(fin_x, y - 0.6, 0.3, 0.06, 0.2, 0.3)
+        # Draw bodies then fins so each color is set once
+        with self.color_group((0.2, 0.2, 0.2, 1.0)):
+            for x, y in vrm_positions:
+                self._draw_3d_box(x - 0.5, y - 0.5, 0.1, 1.0, 1.0, 0.2)
+        
+        with self.color_group((0.7, 0.7, 0.8, 1.0)):
+            for x, y in vrm_positions:
+                for i in range(10):
+                    fin_x = x - 0.4 + i * 0.08
+                    self._draw_3d_box(fin_x, y - 0.6, 0.3, 0.06, 0.2, 0.3)
 
     def _draw_ultra_cooling(self):
-        glColor4f(0.8, 0.8, 0.85, 1.0)
+        self._set_color((0.8, 0.8, 0.85, 1.0))
         self._draw_3d_box(-15, -6, 0.5, 30, 12, 2)
         
         fin_count = 60
         fin_thickness = 0.1
         fin_spacing = 30.0 / fin_count
         
-        for i in range(fin_count):
-            x = -15 + i * fin_spacing
-            glColor4f(0.85, 0.85, 0.9, 1.0)
-            self._draw_3d_box(x, -5.5, 0.5, fin_thickness, 11, 4)
+        with self.color_group((0.85, 0.85, 0.9, 1.0)):
+            for i in range(fin_count):
+                x = -15 + i * fin_spacing
+                self._draw_3d_box(x, -5.5, 0.5, fin_thickness, 11, 4)
         
         pipe_color = (0.8, 0.5, 0.2, 1.0)
-        for y in [-3, 0, 3]:
-            glColor4f(*pipe_color)
-            self._draw_3d_cylinder(0, y, 2, 0.3, 28)
+        with self.color_group(pipe_color):
+            for y in [-3, 0, 3]:
+                self._draw_3d_cylinder(0, y, 2, 0.3, 28)
 
     def _draw_simple_gpu(self):
         gpu_color = (0.7, 0.7, 0.75, 1.0)
@@ -724,72 +1334,92 @@ class GPU3DView(BaseGL):
         self._draw_3d_cylinder(8, 0, 2, 2, 0.5, fan_color)
 
     def _draw_ultra_io_bracket(self):
-        glColor4f(0.7, 0.7, 0.75, 1.0)
+        self._set_color((0.7, 0.7, 0.75, 1.0))
         self._draw_3d_box(15, -7, -2, 2, 14, 3)
         
         port_positions = [(16, -4), (16, -2), (16, 0), (16, 2)]
-        for i, (x, y) in enumerate(port_positions):
-            glColor4f(0.3, 0.3, 0.4, 1.0)
-            self._draw_3d_box(x, y, -1, 0.8, 1.2, 0.5)
+        with self.color_group((0.3, 0.3, 0.4, 1.0)):
+            for x, y in port_positions:
+                self._draw_3d_box(x, y, -1, 0.8, 1.2, 0.5)
+
+    def _set_color(self, color):
+        """Set the current GL color, skipping the call if it is already active."""
+        if self._batch is not None:
+            self._current_color = color
+        elif color != self._current_color:
+            glColor4f(color[0], color[1], color[2], color[3])
+            self._current_color = color
+
+    @contextmanager
+    def color_group(self, color):
+        """Set one color for a run of uncolored draws."""
+        self._set_color(color)
+        yield
 
     def _draw_3d_box(self, x, y, z, w, h, d, color=None):
         if color:
-            glColor4f(*color)
-        
-        glBegin(GL_QUADS)
-        glVertex3f(x, y, z + d)
-        glVertex3f(x + w, y, z + d)
-        glVertex3f(x + w, y + h, z + d)
-        glVertex3f(x, y + h, z + d)
-        glEnd()
-        
-        glBegin(GL_QUADS)
-        glVertex3f(x, y, z)
-        glVertex3f(x, y + h, z)
-        glVertex3f(x + w, y + h, z)
-        glVertex3f(x + w, y, z)
-        glEnd()
-        
-        glBegin(GL_QUADS)
-        glVertex3f(x, y + h, z)
-        glVertex3f(x, y + h, z + d)
-        glVertex3f(x + w, y + h, z + d)
-        glVertex3f(x + w, y + h, z)
-        glEnd()
+            self._set_color(color)
+        if self._batch is not None:
+            self._batch.add_box(x, y, z, w, h, d, self._current_color or (1.0, 1.0, 1.0, 1.0))
+            return
         
-        glBegin(GL_QUADS)
-        glVertex3f(x, y, z)
-        glVertex3f(x + w, y, z)
-        glVertex3f(x + w, y, z + d)
-        glVertex3f(x, y, z + d)
+        # One 14-vertex strip covers all six faces (two triangles each)
+        xs = (x, x + w)
+        ys = (y, y + h)
+        zs = (z, z + d)
+        glBegin(GL_TRIANGLE_STRIP)
+        for i, j, k in _BOX_STRIP:
+            glVertex3f(xs[i], ys[j], zs[k])
         glEnd()
+
+    def _draw_boxes(self, origins, size, color):
+        """Draw same-sized boxes at an (N, 3) array of min corners with one submission."""
+        if not len(origins):
+            return
+        if self._batch is not None:
+            self._current_color = color
+            self._batch.add_boxes(origins, size, color)
+            return
         
-        glBegin(GL_QUADS)
-        glVertex3f(x + w, y, z)
-        glVertex3f(x + w, y + h, z)
-        glVertex3f(x + w, y + h, z + d)
-        glVertex3f(x + w, y, z + d)
-        glEnd()
+        verts = origins[:, None, :] + _BOX_TEMPLATE[None, :, :] * np.asarray(size, dtype=np.float32)
+        verts = np.ascontiguousarray(verts.reshape(-1, 3), dtype=np.float32)
+        self._set_color(color)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, verts)
+        glDrawArrays(GL_QUADS, 0, len(verts))
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def _draw_cylinders(self, centres, radius, height, color):
+        """Draw same-sized cylinders at an (N, 3) array of base centres with one submission."""
+        if not len(centres):
+            return
+        if self._batch is not None:
+            self._current_color = color
+            self._batch.add_cylinders(centres, radius, height, color)
+            return
         
-        glBegin(GL_QUADS)
-        glVertex3f(x, y, z)
-        glVertex3f(x, y, z + d)
-        glVertex3f(x, y + h, z + d)
-        glVertex3f(x, y + h, z)
-        glEnd()
+        verts = _cylinder_quads(np.asarray(centres, dtype=np.float32), radius, height)
+        verts = np.ascontiguousarray(verts.reshape(-1, 3), dtype=np.float32)
+        self._set_color(color)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, verts)
+        glDrawArrays(GL_QUADS, 0, len(verts))
+        glDisableClientState(GL_VERTEX_ARRAY)
 
     def _draw_3d_cylinder(self, cx, cy, cz, radius, height, color=None):
         if color:
-            glColor4f(*color)
+            self._set_color(color)
+        if self._batch is not None:
+            self._batch.add_cylinder(cx, cy, cz, radius, height, self._current_color or (1.0, 1.0, 1.0, 1.0))
+            return
         
-        segments = 16
+        top = cz + height
         glBegin(GL_QUAD_STRIP)
-        for i in range(segments + 1):
-            angle = 2.0 * math.pi * i / segments
-            x = cx + radius * math.cos(angle)
-            y = cy + radius * math.sin(angle)
+        for c, s in _UNIT_RING:
+            x = cx + radius * c
+            y = cy + radius * s
             glVertex3f(x, y, cz)
-            glVertex3f(x, y, cz + height)
+            glVertex3f(x, y, top)
         glEnd()
 
     def mousePressEvent(self, e: QtGui.QMouseEvent):
@@ -801,6 +1431,7 @@ class GPU3DView(BaseGL):
             # Prepare for click-or-drag detection; defer click handling to mouseReleaseEvent
             self._mouse_press_pos = e.pos()
             self._press_component_id = self.get_component_at_position(e.x(), e.y())
+            self._press_orbit = (self.camera_orbit_x, self.camera_orbit_y)
             self._dragging = False
         elif e.button() == QtCore.Qt.RightButton:
             self.mouse_mode = "pan"
@@ -824,58 +1455,105 @@ class GPU3DView(BaseGL):
             self.camera_orbit_x += dx * 1.0
             self.camera_orbit_y += dy * 1.0
             self.camera_orbit_y = max(-89, min(89, self.camera_orbit_y))
+            self._view_dirty = True
             self.update()
         elif event.buttons() & QtCore.Qt.RightButton:
             self.camera_pan_x += dx * 0.25
             self.camera_pan_y += dy * 0.25
+            self._view_dirty = True
             self.update()
         
         # Handle hover detection with throttling (skip while dragging to keep orbit smooth)
+        # and only re-pick once the cursor has moved a few pixels since the last pick
         current_component = self.hovered_component
-        now_ts = time.time()
-        if not self._dragging and (now_ts - self._last_pick_time) >= self._hover_pick_interval_s:
-            current_component = self.get_component_at_position(event.x(), event.y())
-            self._last_pick_time = now_ts
+        x, y = event.x(), event.y()
+        if not self._dragging:
+            now_ms = self._pick_clock.elapsed()
+            if self._last_pick_xy is None:
+                moved2 = _HOVER_PICK_MIN_MOVE_PX ** 2
+            else:
+                moved2 = (x - self._last_pick_xy[0]) ** 2 + (y - self._last_pick_xy[1]) ** 2
+            if (now_ms - self._last_pick_ms) >= self._hover_pick_interval_ms and moved2 >= _HOVER_PICK_MIN_MOVE_PX ** 2:
+                current_component = self._debounce_hover(self.get_component_at_position(x, y))
+                self._last_pick_ms = now_ms
+                self._last_pick_xy = (x, y)
         
         if current_component != self.hovered_component:
-            if self.hovered_component:
-                # Hover leave - stop animation
-                self.animation_timer.stop()
-                self.animation_frame = 0
-                if self.gpu_model and hasattr(self.gpu_model, 'handle_hover_leave_event'):
-                    self.gpu_model.handle_hover_leave_event(self.hovered_component)
-            
-            self.hovered_component = current_component
-            
-            if current_component:
-                # Hover enter - start animation and handle event
-                # Set FPS based on performance mode
-                if self.performance_mode == "low":
-                    self.animation_timer.start(80)  # ~12.5 FPS
-                else:
-                    self.animation_timer.start(50)  # 20 FPS
-                self.handle_hover_event(current_component)
-            else:
-                # Clear tooltip when not hovering over any component
-                QtWidgets.QToolTip.hideText()
+            self._apply_hover(current_component)
         
         self.last_pos = event.pos()
+
+    def _debounce_hover(self, component_id):
+        """Only let a hover change through once consecutive picks agree on it."""
+        if component_id == self.hovered_component:
+            self._pending_hover_id = _NO_PENDING
+            self._pending_hover_count = 0
+            self._hover_confirm_timer.stop()
+            return component_id
+        if self._pending_hover_id is not _NO_PENDING and component_id == self._pending_hover_id:
+            self._pending_hover_count += 1
+        else:
+            self._pending_hover_id = component_id
+            self._pending_hover_count = 1
+        if self._pending_hover_count >= self._hover_hysteresis_n:
+            self._pending_hover_id = _NO_PENDING
+            self._pending_hover_count = 0
+            self._hover_confirm_timer.stop()
+            return component_id
+        # Re-pick shortly even if the cursor stops, so a real change still lands
+        self._hover_confirm_timer.start(self._hover_pick_interval_ms)
+        return self.hovered_component
+
+    def _confirm_pending_hover(self):
+        if self._pending_hover_id is _NO_PENDING or self._last_pick_xy is None or self._dragging:
+            return
+        current_component = self._debounce_hover(self.get_component_at_position(*self._last_pick_xy))
+        if current_component != self.hovered_component:
+            self._apply_hover(current_component)
+
+    def _apply_hover(self, current_component):
+        if self.hovered_component:
+            # Hover leave - stop animation
+            self.animation_timer.stop()
+            self.animation_frame = 0
+            self._last_hover = None
+            if self.gpu_model and hasattr(self.gpu_model, 'handle_hover_leave_event'):
+                self.gpu_model.handle_hover_leave_event(self.hovered_component)
+        
+        self.hovered_component = current_component
+        
+        if current_component:
+            # Hover enter - start animation and handle event
+            # Set FPS based on performance mode
+            self.animation_timer.start(self._hover_frame_interval_ms())
+            self.handle_hover_event(current_component)
+        elif self._tooltip_visible:
+            # Clear tooltip when not hovering over any component
+            QtWidgets.QToolTip.hideText()
+            self._tooltip_visible = False
     
     def mouseReleaseEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
             did_click = False
-            if self._mouse_press_pos is not None:
+            # A drag can never become a click, so don't pay for a release pick
+            if self._mouse_press_pos is not None and not self._dragging and self._press_component_id:
                 dist2 = (event.x() - self._mouse_press_pos.x())**2 + (event.y() - self._mouse_press_pos.y())**2
-                if dist2 < (self._drag_threshold_px ** 2) and self._press_component_id:
-                    # Verify still over the same component on release
-                    comp_at_release = self.get_component_at_position(event.x(), event.y())
-                    if comp_at_release == self._press_component_id:
+                if dist2 < (self._drag_threshold_px ** 2):
+                    if dist2 == 0 and self._press_orbit == (self.camera_orbit_x, self.camera_orbit_y):
+                        # Same pixel, same camera: the press pick still holds
                         did_click = True
+                    else:
+                        # Verify still over the same component on release
+                        comp_at_release = self.get_component_at_position(event.x(), event.y())
+                        if comp_at_release == self._press_component_id:
+                            did_click = True
             if did_click:
                 self.handle_click_event(self._press_component_id)
             self._mouse_press_pos = None
             self._press_component_id = None
             self._dragging = False
+            if self.hovered_component is None:
+                self.animation_timer.stop()
     
     def wheelEvent(self, event):
         delta = event.angleDelta().y()
@@ -884,6 +1562,7 @@ class GPU3DView(BaseGL):
         else:
             self.zoom *= 0.88
         self.zoom = max(0.1, min(10.0, self.zoom))
+        self._view_dirty = True
         self.update()
 
     def reset_camera(self):
@@ -893,6 +1572,8 @@ class GPU3DView(BaseGL):
         self.camera_pan_x = 0.0
         self.camera_pan_y = 0.0
         self.zoom = 1.0
+        self._view_dirty = True
+        self._camera_key = None
         self.update()
             
     def get_component_visibility_state(self):
@@ -909,52 +1590,9 @@ class GPU3DView(BaseGL):
             "traces": self.show_traces
         }
     
-    def _cleanup_memory(self):
-        try:
-            if len(self._cache) > 20:
-                self._cache.clear()
-            
-            import gc
-            gc.collect()
-            
-        except Exception:
-            pass
-    
-    def _get_cached(self, cache_key: str, generator_func):
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-        
-        result = generator_func()
-        if len(self._cache) < self._max_cache_size:
-            self._cache[cache_key] = result
-        
-        return result
-    
     def clear_caches(self):
-        self._cache.clear()
-        
-        if hasattr(self, '_gpu_display_list') and self._gpu_display_list:
-            try:
-                glDeleteLists(self._gpu_display_list, 1)
-                self._gpu_display_list = None
-            except:
-                pass
-        
-        if hasattr(self, '_gpu_render_cache'):
-            try:
-                from OpenGL.GL import glDeleteLists
-                for display_list in self._gpu_render_cache.values():
-                    try:
-                        glDeleteLists(display_list, 1)
-                    except:
-                        pass
-                self._gpu_render_cache.clear()
-            except ImportError:
-                pass
+        self._release_static_cache()
         
         self._gpu_cache_valid = False
         self._last_gpu_model_id = None
-        self._cached_component_state = None
-        
-        import gc
-        gc.collect()
\ No newline at end of file
+        self._cached_component_state = None
\ No newline at end of file
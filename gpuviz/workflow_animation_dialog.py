@@ -8,6 +8,23 @@ from PySide6 import QtCore, QtWidgets, QtGui
 import math
 import time
 
+from .view3d import vsync_interval_ms
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+    HAVE_QOPENGLWIDGET = True
+except Exception:
+    HAVE_QOPENGLWIDGET = False
+
+# QPainter on a QOpenGLWidget rasterizes through the GL paint engine instead of the CPU
+AnimationBase = QOpenGLWidget if HAVE_QOPENGLWIDGET else QtWidgets.QWidget
+
 class WorkflowAnimationDialog(QtWidgets.QDialog):
     """Dialog showing animated GPU workflow explanations."""
 
@@ -18,6 +35,8 @@ class WorkflowAnimationDialog(QtWidgets.QDialog):
         self.animation_frame = 0
         self.animation_timer = QtCore.QTimer()
         self.animation_timer.timeout.connect(self.update_animation)
+        # Set when the timer was stopped because the dialog was hidden or minimized
+        self._resume_on_show = False
 
         self.setWindowTitle(f"GPU Workflow: {component_data['name']}")
         self.setModal(False)
@@ -88,7 +107,7 @@ class WorkflowAnimationDialog(QtWidgets.QDialog):
 
     def start_animation(self):
         """Start the workflow animation."""
-        self.animation_timer.start(50)  # 20 FPS
+        self.animation_timer.start(vsync_interval_ms(50, self))  # ~20 FPS
         self.pause_btn.setText(" Pause")
 
     def toggle_pause(self):
@@ -97,7 +116,7 @@ class WorkflowAnimationDialog(QtWidgets.QDialog):
             self.animation_timer.stop()
             self.pause_btn.setText(" Play")
         else:
-            self.animation_timer.start(50)
+            self.animation_timer.start(vsync_interval_ms(50, self))
             self.pause_btn.setText(" Pause")
 
     def restart_animation(self):
@@ -108,8 +127,37 @@ class WorkflowAnimationDialog(QtWidgets.QDialog):
         if not self.animation_timer.isActive():
             self.start_animation()
 
+    def hideEvent(self, event):
+        self._suspend_animation()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._resume_animation()
+
+    def changeEvent(self, event):
+        if event.type() == QtCore.QEvent.WindowStateChange:
+            if self.isMinimized():
+                self._suspend_animation()
+            else:
+                self._resume_animation()
+        super().changeEvent(event)
+
+    def _suspend_animation(self):
+        """Stop ticking while the dialog can't be seen, remembering to resume later."""
+        if self.animation_timer.isActive():
+            self.animation_timer.stop()
+            self._resume_on_show = True
+
+    def _resume_animation(self):
+        if self._resume_on_show and self.isVisible() and not self.isMinimized():
+            self._resume_on_show = False
+            self.animation_timer.start(vsync_interval_ms(50, self))
+
     def update_animation(self):
         """Update animation frame."""
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
         self.animation_frame += 1
         self.animation_widget.animation_frame = self.animation_frame
         self.animation_widget.update()
@@ -139,7 +187,36 @@ class WorkflowAnimationDialog(QtWidgets.QDialog):
                 pass
 
 
-class WorkflowAnimationWidget(QtWidgets.QWidget):
+# (x, y, label, colour) of the matmul matrices and memory hierarchy levels
+_MATMUL_MATRICES = (
+    (50, 100, "Matrix A", (0.2, 0.5, 0.8)),
+    (350, 100, "Matrix B", (0.8, 0.3, 0.3)),
+    (200, 350, "Result C", (0.3, 0.8, 0.3)),
+)
+_MEMORY_LEVELS = (
+    ("Registers", 100, 100, (0.8, 0.2, 0.2)),
+    ("L1 Cache", 150, 200, (0.4, 0.4, 0.2)),
+    ("L2 Cache", 350, 300, (0.3, 0.3, 0.1)),
+    ("HBM", 100, 400, (0.1, 0.1, 0.3)),
+)
+
+# Particle layouts and pulse tables are fixed per workflow type, so dialogs share them
+_WORKFLOW_SHARED_ATTRS = (
+    'particles', '_particle_groups', '_matmul_lut', '_arrow_path', '_sm_stage_lut', '_sm_warp_lut', '_die_lut',
+    '_interconnect_lines',
+)
+_WORKFLOW_DATA = {}
+
+
+def _wave_lut(frames, phases, base, amplitude, speed=2.0):
+    """Per-frame table of base + amplitude*sin(progress*speed*pi + phase) for each phase."""
+    return [
+        tuple(base + amplitude * math.sin((f / frames) * math.pi * speed + phase) for phase in phases)
+        for f in range(frames)
+    ]
+
+
+class WorkflowAnimationWidget(AnimationBase):
     """Widget that renders the workflow animation."""
 
     def __init__(self, component_id: str, component_data: dict):
@@ -148,26 +225,70 @@ class WorkflowAnimationWidget(QtWidgets.QWidget):
         self.component_data = component_data
         self.animation_frame = 0
         self.setMinimumSize(780, 500)
+        if HAVE_QOPENGLWIDGET:
+            # The GL paint engine only antialiases with a multisampled surface
+            fmt = self.format()
+            fmt.setSamples(4)
+            self.setFormat(fmt)
 
         # Animation data
         self.workflow_type = component_data.get('workflow', 'default')
         self.particles = []
+        # Per-colour particle groups: (brush, left, y, size, phase) arrays, built once
+        self._particle_groups = []
+        # Brushes keyed by (r, g, b, a); the pulse tables repeat, so this stays small
+        self._brush_cache = {}
+        self._matrix_cell_cache = {}
+        self._background = QtGui.QColor(20, 20, 30)
+        self._text_pen = QtGui.QPen(QtGui.QColor(255, 255, 255))
+        self._link_pen = QtGui.QPen(QtGui.QColor(150, 150, 150, 100), 2)
+        self._arrow_pen = QtGui.QPen(QtGui.QColor(255, 255, 0, 150), 3, QtCore.Qt.DashLine)
+        # Background plus the parts of the scene that never animate; rebuilt on resize
+        self._static_layer = None
         self.initialize_animation_data()
 
     def initialize_animation_data(self):
         """Initialize animation data based on workflow type."""
-        if self.workflow_type == 'tensor_matmul':
-            self.initialize_matmul_data()
-        elif self.workflow_type == 'memory_access':
-            self.initialize_memory_data()
-        elif self.workflow_type == 'sm_execution':
-            self.initialize_sm_data()
-        elif self.workflow_type == 'die_layout':
-            self.initialize_die_data()
+        shared = _WORKFLOW_DATA.get(self.workflow_type)
+        if shared is not None:
+            for name, value in shared.items():
+                setattr(self, name, value)
+            return
+        init = self._WORKFLOW_INIT.get(self.workflow_type)
+        if init:
+            init(self)
+        self._pack_particles()
+        _WORKFLOW_DATA[self.workflow_type] = {
+            name: getattr(self, name) for name in _WORKFLOW_SHARED_ATTRS if hasattr(self, name)
+        }
+
+    def _pack_particles(self):
+        """Split particles into per-colour arrays so painting sets each brush once."""
+        groups = {}
+        for particle in self.particles:
+            groups.setdefault(particle['color'], []).append(particle)
+        self._particle_groups = []
+        for color, members in groups.items():
+            brush = self._brush(int(color[0] * 255), int(color[1] * 255), int(color[2] * 255), int(color[3] * 255))
+            xs = [p['x'] for p in members]
+            ys = [p['y'] for p in members]
+            sizes = [p['size'] for p in members]
+            lefts = [int(x - size/2) for x, size in zip(xs, sizes)]
+            if HAVE_NUMPY:
+                xs = np.array(xs, dtype=np.float64)
+                ys = np.array(ys, dtype=np.float64) - np.array(sizes, dtype=np.float64) / 2
+                phases = xs * 0.01
+            else:
+                ys = [y - size/2 for y, size in zip(ys, sizes)]
+                phases = [x * 0.01 for x in xs]
+            self._particle_groups.append((brush, lefts, ys, sizes, phases))
 
     def initialize_matmul_data(self):
         """Initialize matrix multiplication animation data."""
         self.particles = []
+        # Cell/tensor-core pulse depends only on the frame and i + j (0..6)
+        self._matmul_lut = _wave_lut(240, [k * 0.5 for k in range(7)], 0.5, 0.5)
+        self._arrow_path = self._build_arrow_path()
         # Matrix A tiles (blue)
         for i in range(16):
             self.particles.append({
@@ -239,6 +360,9 @@ class WorkflowAnimationWidget(QtWidgets.QWidget):
     def initialize_sm_data(self):
         """Initialize SM execution animation data."""
         self.particles = []
+        self._sm_stage_lut = _wave_lut(200, [-i * 0.5 for i in range(5)], 0.3, 0.7)
+        # Indexed by warp * 8 + thread
+        self._sm_warp_lut = _wave_lut(200, [w + t * 0.2 for w in range(4) for t in range(8)], 0.5, 0.5, speed=4.0)
         # CUDA cores
         for i in range(32):
             self.particles.append({
@@ -270,6 +394,13 @@ class WorkflowAnimationWidget(QtWidgets.QWidget):
     def initialize_die_data(self):
         """Initialize die layout animation data."""
         self.particles = []
+        self._die_lut = _wave_lut(180, [i * 0.3 for i in range(8)], 0.4, 0.6)
+        # GPC i links to GPC i + 1
+        self._interconnect_lines = [
+            QtCore.QLine(150 + (i % 4) * 150, 150 + (i // 4) * 200,
+                         150 + ((i + 1) % 4) * 150, 150 + ((i + 1) // 4) * 200)
+            for i in range(7)
+        ]
         # GPCs
         for i in range(8):
             self.particles.append({
@@ -289,43 +420,83 @@ class WorkflowAnimationWidget(QtWidgets.QWidget):
                 'size': 30
             })
 
+    def _brush(self, r, g, b, a=255):
+        """Return a shared brush for the given colour."""
+        key = (r, g, b, a)
+        brush = self._brush_cache.get(key)
+        if brush is None:
+            brush = QtGui.QBrush(QtGui.QColor(r, g, b, a))
+            self._brush_cache[key] = brush
+        return brush
+
     def paintEvent(self, event):
         """Paint the workflow animation."""
+        if event.region().isEmpty():
+            return
+        if HAVE_QOPENGLWIDGET:
+            # Makes the context current and calls paintGL
+            super().paintEvent(event)
+        else:
+            self._paint_scene()
+
+    def paintGL(self):
+        self._paint_scene()
+
+    def _paint_scene(self):
+        if self._static_layer is None:
+            self._static_layer = self._render_static_layer()
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
 
-        # Clear background
-        painter.fillRect(self.rect(), QtGui.QColor(20, 20, 30))
+        # Background, labels and fixed shapes
+        painter.drawPixmap(0, 0, self._static_layer)
 
         # Draw workflow-specific animation
-        if self.workflow_type == 'tensor_matmul':
-            self.draw_matmul_animation(painter)
-        elif self.workflow_type == 'memory_access':
-            self.draw_memory_animation(painter)
-        elif self.workflow_type == 'sm_execution':
-            self.draw_sm_animation(painter)
-        elif self.workflow_type == 'die_layout':
-            self.draw_die_animation(painter)
+        draw = self._WORKFLOW_DRAW.get(self.workflow_type)
+        if draw:
+            draw(self, painter)
 
         # Draw connecting lines and data flow
         self.draw_data_flow(painter)
+        painter.end()
+
+    def resizeEvent(self, event):
+        self._static_layer = None
+        super().resizeEvent(event)
+
+    def _render_static_layer(self):
+        """Paint the background and non-animated parts of the workflow into a pixmap."""
+        ratio = self.devicePixelRatioF()
+        layer = QtGui.QPixmap(self.size() * ratio)
+        layer.setDevicePixelRatio(ratio)
+        layer.fill(self._background)
+        painter = QtGui.QPainter(layer)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        if self.workflow_type == 'tensor_matmul':
+            painter.setPen(self._text_pen)
+            for x, y, label, _ in _MATMUL_MATRICES:
+                painter.drawText(x - 20, y - 10, label)
+        elif self.workflow_type == 'memory_access':
+            for name, x, y, color in _MEMORY_LEVELS:
+                self.draw_memory_level(painter, name, x, y, color, 0.0)
+        painter.end()
+        return layer
 
     def draw_matmul_animation(self, painter):
         """Draw matrix multiplication workflow."""
         progress = (self.animation_frame % 240) / 240.0
+        wave = self._matmul_lut[self.animation_frame % 240]
 
-        # Draw matrices
-        self.draw_matrix(painter, 50, 100, "Matrix A", (0.2, 0.5, 0.8), progress)
-        self.draw_matrix(painter, 350, 100, "Matrix B", (0.8, 0.3, 0.3), progress)
-        self.draw_matrix(painter, 200, 350, "Result C", (0.3, 0.8, 0.3), progress)
+        # Draw matrices (labels live in the static layer)
+        for x, y, _, color in _MATMUL_MATRICES:
+            self.draw_matrix(painter, x, y, color, wave)
 
         # Draw tensor cores
         for i in range(4):
             for j in range(4):
                 x, y = 200 + i * 80, 200 + j * 80
-                intensity = 0.5 + 0.5 * math.sin(progress * math.pi * 2 + (i + j) * 0.5)
-                color = QtGui.QColor(int(intensity * 153), int(intensity * 51), int(intensity * 204))
-                painter.setBrush(QtGui.QBrush(color))
+                intensity = wave[i + j]
+                painter.setBrush(self._brush(int(intensity * 153), int(intensity * 51), int(intensity * 204)))
                 painter.drawEllipse(x - 15, y - 15, 30, 30)
 
         # Draw data flow arrows
@@ -335,41 +506,33 @@ class WorkflowAnimationWidget(QtWidgets.QWidget):
         """Draw memory hierarchy workflow."""
         progress = (self.animation_frame % 300) / 300.0
 
-        # Draw memory hierarchy levels
-        levels = [
-            ("Registers", 100, 100, (0.8, 0.2, 0.2)),
-            ("L1 Cache", 150, 200, (0.4, 0.4, 0.2)),
-            ("L2 Cache", 350, 300, (0.3, 0.3, 0.1)),
-            ("HBM", 100, 400, (0.1, 0.1, 0.3))
-        ]
-
-        for name, x, y, color in levels:
-            self.draw_memory_level(painter, name, x, y, color, progress)
+        # Memory hierarchy levels are static; particles keep the levels' label pen as outline
+        painter.setPen(self._text_pen)
 
         # Draw data particles flowing
+        painter.setBrush(self._brush(100, 100, 255, 200))
         for i in range(10):
             particle_progress = (progress + i * 0.1) % 1.0
             y_pos = 400 - particle_progress * 300
             x_pos = 100 + math.sin(particle_progress * math.pi * 4) * 50
-            color = QtGui.QColor(100, 100, 255, 200)
-            painter.setBrush(QtGui.QBrush(color))
             painter.drawEllipse(int(x_pos - 3), int(y_pos - 3), 6, 6)
 
     def draw_sm_animation(self, painter):
         """Draw SM execution workflow."""
-        progress = (self.animation_frame % 200) / 200.0
+        frame = self.animation_frame % 200
+        stage_wave = self._sm_stage_lut[frame]
+        warp_wave = self._sm_warp_lut[frame]
 
         # Draw instruction pipeline stages
         stages = ["Fetch", "Decode", "Execute", "Memory", "Writeback"]
         for i, stage in enumerate(stages):
             x = 100 + i * 120
             y = 400
-            intensity = 0.3 + 0.7 * math.sin(progress * math.pi * 2 - i * 0.5)
-            color = QtGui.QColor(int(intensity * 255), int(intensity * 150), int(intensity * 100))
-            painter.setBrush(QtGui.QBrush(color))
+            intensity = stage_wave[i]
+            painter.setBrush(self._brush(int(intensity * 255), int(intensity * 150), int(intensity * 100)))
             painter.drawRect(x - 40, y - 20, 80, 40)
 
-            painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255)))
+            painter.setPen(self._text_pen)
             painter.drawText(x - 30, y + 5, stage)
 
         # Draw warp execution
@@ -377,105 +540,110 @@ class WorkflowAnimationWidget(QtWidgets.QWidget):
             for thread in range(8):
                 x = 150 + thread * 60
                 y = 200 + warp * 60
-                intensity = 0.5 + 0.5 * math.sin(progress * math.pi * 4 + warp + thread * 0.2)
-                color = QtGui.QColor(int(intensity * 100), int(intensity * 200), int(intensity * 100))
-                painter.setBrush(QtGui.QBrush(color))
+                intensity = warp_wave[warp * 8 + thread]
+                painter.setBrush(self._brush(int(intensity * 100), int(intensity * 200), int(intensity * 100)))
                 painter.drawRect(x - 8, y - 8, 16, 16)
 
     def draw_die_animation(self, painter):
         """Draw die layout workflow."""
-        progress = (self.animation_frame % 180) / 180.0
+        wave = self._die_lut[self.animation_frame % 180]
 
         # Draw GPCs
         for i in range(8):
             x = 150 + (i % 4) * 150
             y = 150 + (i // 4) * 200
-            intensity = 0.4 + 0.6 * math.sin(progress * math.pi * 2 + i * 0.3)
-            color = QtGui.QColor(int(intensity * 76), int(intensity * 76), int(intensity * 127))
-            painter.setBrush(QtGui.QBrush(color))
+            intensity = wave[i]
+            painter.setBrush(self._brush(int(intensity * 76), int(intensity * 76), int(intensity * 127)))
             painter.drawRect(x - 40, y - 40, 80, 80)
 
-            painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255)))
+            painter.setPen(self._text_pen)
             painter.drawText(x - 20, y + 5, f"GPC {i}")
 
         # Draw interconnect
-        painter.setPen(QtGui.QPen(QtGui.QColor(150, 150, 150, 100), 2))
-        for i in range(7):
-            x1 = 150 + (i % 4) * 150
-            y1 = 150 + (i // 4) * 200
-            x2 = 150 + ((i + 1) % 4) * 150
-            y2 = 150 + ((i + 1) // 4) * 200
-            painter.drawLine(x1, y1, x2, y2)
-
-    def draw_matrix(self, painter, x, y, label, color_tuple, progress):
-        """Draw a matrix representation."""
-        color = QtGui.QColor(int(color_tuple[0] * 255), int(color_tuple[1] * 255), int(color_tuple[2] * 255))
-        painter.setBrush(QtGui.QBrush(color))
-
-        # Draw matrix grid
-        for i in range(4):
-            for j in range(4):
-                cell_x = x + i * 15
-                cell_y = y + j * 15
-                intensity = 0.5 + 0.5 * math.sin(progress * math.pi * 2 + (i + j) * 0.5)
-                cell_color = QtGui.QColor(
-                    int(color.red() * intensity),
-                    int(color.green() * intensity),
-                    int(color.blue() * intensity)
-                )
-                painter.setBrush(QtGui.QBrush(cell_color))
-                painter.drawRect(cell_x - 7, cell_y - 7, 14, 14)
-
-        # Draw label
-        painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255)))
-        painter.drawText(x - 20, y - 10, label)
+        painter.setPen(self._link_pen)
+        painter.drawLines(self._interconnect_lines)
+
+    def draw_matrix(self, painter, x, y, color_tuple, wave):
+        """Draw a matrix representation; wave holds the pulse intensity per i + j."""
+        red, green, blue = (int(c * 255) for c in color_tuple[:3])
+
+        # Draw matrix grid; cells on the same anti-diagonal share a colour, so draw them together
+        for k, cells in enumerate(self._matrix_cells(x, y)):
+            intensity = wave[k]
+            painter.setBrush(self._brush(int(red * intensity), int(green * intensity), int(blue * intensity)))
+            painter.drawRects(cells)
+
+        # Later shapes are outlined with the label pen
+        painter.setPen(self._text_pen)
+
+    def _matrix_cells(self, x, y):
+        """Cell rects of the 4x4 matrix at (x, y), grouped by i + j."""
+        key = (x, y)
+        groups = self._matrix_cell_cache.get(key)
+        if groups is None:
+            groups = [[] for _ in range(7)]
+            for i in range(4):
+                for j in range(4):
+                    groups[i + j].append(QtCore.QRect(x + i * 15 - 7, y + j * 15 - 7, 14, 14))
+            self._matrix_cell_cache[key] = groups
+        return groups
 
     def draw_memory_level(self, painter, name, x, y, color_tuple, progress):
         """Draw a memory hierarchy level."""
-        color = QtGui.QColor(int(color_tuple[0] * 255), int(color_tuple[1] * 255), int(color_tuple[2] * 255))
-        painter.setBrush(QtGui.QBrush(color))
+        painter.setBrush(self._brush(int(color_tuple[0] * 255), int(color_tuple[1] * 255), int(color_tuple[2] * 255)))
         painter.drawRect(x - 40, y - 15, 80, 30)
 
-        painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255)))
+        painter.setPen(self._text_pen)
         painter.drawText(x - 30, y + 5, name)
 
     def draw_flow_arrows(self, painter, progress):
         """Draw data flow arrows."""
-        painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 0, 150), 3, QtCore.Qt.DashLine))
+        painter.setPen(self._arrow_pen)
+        painter.drawPath(self._arrow_path)
 
+    @staticmethod
+    def _build_arrow_path():
+        """Shafts and heads of the matmul flow arrows as one path."""
+        path = QtGui.QPainterPath()
         # Arrows from matrices to tensor cores
         arrows = [
             (150, 180, 200, 200),  # A to TC
             (350, 180, 280, 200),  # B to TC
             (240, 320, 240, 350)   # TC to C
         ]
-
         for x1, y1, x2, y2 in arrows:
-            painter.drawLine(x1, y1, x2, y2)
+            path.moveTo(x1, y1)
+            path.lineTo(x2, y2)
             # Arrow head
             angle = math.atan2(y2 - y1, x2 - x1)
-            painter.drawLine(x2, y2,
-                          x2 - 10 * math.cos(angle - 0.3),
-                          y2 - 10 * math.sin(angle - 0.3))
-            painter.drawLine(x2, y2,
-                          x2 - 10 * math.cos(angle + 0.3),
-                          y2 - 10 * math.sin(angle + 0.3))
+            for side in (-0.3, 0.3):
+                path.moveTo(x2, y2)
+                path.lineTo(x2 - 10 * math.cos(angle + side), y2 - 10 * math.sin(angle + side))
+        return path
 
     def draw_data_flow(self, painter):
         """Draw data flow particles."""
-        for particle in self.particles:
-            x, y = particle['x'], particle['y']
-            size = particle['size']
-            color = particle['color']
-
+        base = self.animation_frame * 0.1
+        for brush, lefts, ys, sizes, phases in self._particle_groups:
+            painter.setBrush(brush)
             # Add some animation
-            offset = math.sin(self.animation_frame * 0.1 + x * 0.01) * 2
-            y += offset
-
-            painter.setBrush(QtGui.QBrush(QtGui.QColor(
-                int(color[0] * 255),
-                int(color[1] * 255),
-                int(color[2] * 255),
-                int(color[3] * 255)
-            )))
-            painter.drawEllipse(int(x - size/2), int(y - size/2), size, size)
\ No newline at end of file
+            if HAVE_NUMPY:
+                tops = (ys + np.sin(base + phases) * 2).astype(np.int64).tolist()
+            else:
+                tops = [int(y + math.sin(base + phase) * 2) for y, phase in zip(ys, phases)]
+            for left, top, size in zip(lefts, tops, sizes):
+                painter.drawEllipse(left, top, size, size)
+
+    # Per-workflow handlers, looked up once per call instead of an if/elif chain
+    _WORKFLOW_INIT = {
+        'tensor_matmul': initialize_matmul_data,
+        'memory_access': initialize_memory_data,
+        'sm_execution': initialize_sm_data,
+        'die_layout': initialize_die_data,
+    }
+    _WORKFLOW_DRAW = {
+        'tensor_matmul': draw_matmul_animation,
+        'memory_access': draw_memory_animation,
+        'sm_execution': draw_sm_animation,
+        'die_layout': draw_die_animation,
+    }
@@ -26,364 +26,163 @@ from gpuviz.componentHighlighter import ComponentHighlighter, ComponentType
 from gpuviz.componentVisibilityPanel import ComponentVisibilityPanel
 from PySide6 import QtCore, QtWidgets, QtGui
 
+import functools
+import hashlib
 import json
+import re
 import sys
 import time
+import types
 from typing import Optional
 
-class DetailedComponentPanel(QtWidgets.QWidget):
-    component_selected = QtCore.Signal(str)
-    
-    def __init__(self):
-        super().__init__()
-        self.component_highlighter = ComponentHighlighter()
-        self.setup_ui()
-        
-    def setup_ui(self):
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setContentsMargins(15, 15, 15, 15)
-        layout.setSpacing(12)
-        
-        title = QtWidgets.QLabel("🔧 Advanced GPU Component Explorer")
-        title.setStyleSheet("""
-            QLabel {
-                color: #4fc3f7;
-                font-size: 18px;
-                font-weight: 700;
-                padding: 12px;
-                background-color: transparent;
-                border-bottom: 2px solid #404040;
-                margin-bottom: 8px;
-            }
-        """)
-        layout.addWidget(title)
-        
-        selection_group = QtWidgets.QGroupBox("🎯 Component Selection")
-        selection_layout = QtWidgets.QVBoxLayout(selection_group)
-        
-        self.component_list = QtWidgets.QListWidget()
-        self.component_list.setStyleSheet("""
-            QListWidget {
-                background-color: #2e2e2e;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 8px;
-                color: #ffffff;
-                font-size: 12px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                margin: 2px;
-                border-radius: 4px;
-                background-color: transparent;
-            }
-            QListWidget::item:selected {
-                background-color: #4fc3f7;
-                color: #ffffff;
-                font-weight: bold;
-            }
-            QListWidget::item:hover {
-                background-color: #3e3e3e;
-            }
-        """)
-        
-        self.populate_component_list()
-        selection_layout.addWidget(self.component_list)
-        
-        button_layout = QtWidgets.QHBoxLayout()
-        
-        self.highlight_btn = QtWidgets.QPushButton("🔦 Highlight")
-        self.highlight_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2e2e2e;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 600;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #3e3e3e;
-            }
-            QPushButton:pressed {
-                background-color: #4e4e4e;
-            }
-        """)
-        
-        self.clear_btn = QtWidgets.QPushButton("🧹 Clear")
-        self.clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2e2e2e;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 600;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #3e3e3e;
-            }
-            QPushButton:pressed {
-                background-color: #4e4e4e;
-            }
-        """)
-        
-        button_layout.addWidget(self.highlight_btn)
-        button_layout.addWidget(self.clear_btn)
-        selection_layout.addLayout(button_layout)
-        
-        layout.addWidget(selection_group)
-        
-        details_group = QtWidgets.QGroupBox("📊 Component Details")
-        details_layout = QtWidgets.QVBoxLayout(details_group)
-        
-        self.component_details = QtWidgets.QTextBrowser()
-        self.component_details.setStyleSheet("""
-            QTextBrowser {
-                background-color: #2e2e2e;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 12px;
-                color: #ffffff;
-                font-size: 11px;
-                line-height: 1.5;
-            }
-            QTextBrowser h3 {
-                color: #4fc3f7;
-                font-size: 14px;
-                font-weight: bold;
-                margin-bottom: 8px;
-            }
-            QTextBrowser strong {
-                color: #ffffff;
-                font-weight: bold;
-            }
-            QTextBrowser table {
-                border-collapse: collapse;
-                margin: 5px 0;
-            }
-        """)
-        self.component_details.setHtml("""
-            <div style="color: #b0bec5; text-align: center; padding: 20px;">
-                Select a component from the list above to view detailed technical information,
-                specifications, manufacturing details, and maintenance guidelines.
-            </div>
-        """)
-        
-        details_layout.addWidget(self.component_details)
-        layout.addWidget(details_group)
-        
-        self.performance_indicator = QtWidgets.QLabel("⚡ Performance Impact: None")
-        self.performance_indicator.setStyleSheet("""
-            QLabel {
-                background-color: #2a2a2a;
-                border-radius: 6px;
-                padding: 8px 12px;
-                color: #ffffff;
-                font-size: 11px;
-                font-weight: 600;
-            }
-        """)
-        layout.addWidget(self.performance_indicator)
-        
-        self.component_list.itemSelectionChanged.connect(self._on_component_selected)
-        self.highlight_btn.clicked.connect(self._on_highlight_clicked)
-        self.clear_btn.clicked.connect(self._on_clear_clicked)
-        
-    def populate_component_list(self):
-        components = [
-            ("chassis", "🏗️ GPU Chassis/Enclosure", "Structural housing and thermal management"),
-            ("cooling", "❄️ Cooling System", "Fans, heatsink, and heat pipes"),
-            ("pcb", "🔌 PCB Board", "Printed circuit board and traces"),
-            ("gpu_die", "🎯 GPU Silicon Die", "Core processor and compute units"),
-            ("vram", "💾 Video RAM", "High-bandwidth memory chips"),
-            ("power_delivery", "⚡ Power Delivery", "VRM and voltage regulation"),
-            ("backplate", "🔩 Backplate", "Rear mounting and cooling plate"),
-            ("io_bracket", "🖥️ I/O Bracket", "Display ports and power connectors"),
-            ("microscopic", "🔬 Microscopic Components", "Resistors, capacitors, ICs"),
-            ("traces", "📡 PCB Traces", "Copper pathways and signal routing")
-        ]
-        
-        for component_id, name, description in components:
-            item = QtWidgets.QListWidgetItem(f"{name}\n  {description}")
-            item.setData(QtCore.Qt.UserRole, component_id)
-            item.setToolTip(f"Click to explore {name}")
-            self.component_list.addItem(item)
-            
-    def _on_component_selected(self):
-        current_item = self.component_list.currentItem()
-        if current_item:
-            component_id = current_item.data(QtCore.Qt.UserRole)
-            try:
-                component_type = ComponentType(component_id)
-                component_info = self.component_highlighter.get_component_info(component_type)
-                
-                if component_info:
-                    self.component_details.setHtml(
-                        self.component_highlighter.format_component_details(component_info)
-                    )
-                    
-                    impact_color = "#f44336" if "CRITICAL" in component_info.importance else \
-                                  "#ff9800" if "HIGH" in component_info.importance else \
-                                  "#4caf50" if "MEDIUM" in component_info.importance else "#9e9e9e"
-                    
-                    self.performance_indicator.setStyleSheet(f"""
-                        QLabel {{
-                            background-color: {impact_color};
-                            border-radius: 6px;
-                            padding: 8px 12px;
-                            color: #ffffff;
-                            font-size: 11px;
-                            font-weight: 600;
-                        }}
-                    """)
-                    self.performance_indicator.setText(f"⚡ {component_info.importance}")
-                    
-            except ValueError:
-                self.component_details.setHtml("""
-                    <div style="color: #f44336; text-align: center; padding: 20px;">
-                        Invalid component selected. Please choose a valid component from the list.
-                    </div>
-                """)
-                self.performance_indicator.setText("⚡ Performance Impact: Unknown")
-                
-    def _on_highlight_clicked(self):
-        current_item = self.component_list.currentItem()
-        if current_item:
-            component_id = current_item.data(QtCore.Qt.UserRole)
-            try:
-                component_type = ComponentType(component_id)
-                self.component_selected.emit(component_id)
-                
-                self.highlight_btn.setText("🔦 Active")
-                self.highlight_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #4fc3f7;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 6px;
-                        padding: 8px 16px;
-                        font-weight: 600;
-                        font-size: 12px;
-                    }
-                """)
-                
-            except ValueError:
-                pass
-                
-    def _on_clear_clicked(self):
-        self.component_selected.emit("clear")
-        
-        self.highlight_btn.setText("🔦 Highlight")
-        self.highlight_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2e2e2e;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 600;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #3e3e3e;
-            }
-            QPushButton:pressed {
-                background-color: #4e4e4e;
-            }
-        """)
-        
-        self.component_details.setHtml("""
-            <div style="color: #b0bec5; text-align: center; padding: 20px;">
-                Component highlighting cleared. Select a component to view details.
-            </div>
-        """)
-        self.performance_indicator.setText("⚡ Performance Impact: None")
-        self.performance_indicator.setStyleSheet("""
-            QLabel {
-                background-color: #2a2a2a;
-                border-radius: 6px;
-                padding: 8px 12px;
-                color: #ffffff;
-                font-size: 11px;
-                font-weight: 600;
-            }
-        """)
-        
-    def set_gpu_model(self, gpu_model):
-        if gpu_model:
-            self.components = {
-                "backplate": {"name": "🔩 Backplate & I/O Bracket", "description": "The structural backbone providing video outputs, mounting support, and EMI shielding."},
-                "pcb": {"name": "🔌 Printed Circuit Board (PCB)", "description": "Multi-layer fiberglass foundation with gold-plated PCIe connector and power distribution network."},
-                "power_delivery": {"name": "⚡ Power Delivery System", "description": "Multi-phase VRM design with digital controllers for stable power delivery."},
-                "gpu_package": {"name": "🎯 GPU Package & Silicon Die", "description": "Advanced silicon die with billions of transistors and streaming multiprocessors."},
-                "vram": {"name": "💾 Video Memory (VRAM)", "description": "GDDR6 memory modules with ultra-high bandwidth for gaming performance."},
-                "heatsink": {"name": "🌡️ Cooling Heatsink", "description": "Massive aluminum fin array with direct contact technology for optimal heat dissipation."},
-                "heatpipes": {"name": "🔥 Heat Pipe Network", "description": "Copper pipes with phase-change cooling technology for efficient heat transfer."},
-                "fans": {"name": "💨 Cooling Fans", "description": "Triple fan configuration with optimized blade design and intelligent temperature control."},
-                "shroud": {"name": "🛡️ External Shroud", "description": "Engineered housing with optimized airflow channels and LED lighting."},
-                "screws": {"name": "🔧 Assembly Hardware", "description": "Precision mounting components for secure assembly and longevity."}
-            }
-            self.component_list.clear()
-            for component_id, component_info in self.components.items():
-                item = QtWidgets.QListWidgetItem(component_info["name"])
-                item.setData(QtCore.Qt.UserRole, component_id)
-                item.setToolTip(f"Click to highlight {component_info['name']}")
-                self.component_list.addItem(item)
-        else:
-            self.component_list.clear()
-            
-    def _on_component_selected(self):
-        current_item = self.component_list.currentItem()
-        if current_item:
-            component_id = current_item.data(QtCore.Qt.UserRole)
-            if component_id in self.components:
-                component_info = self.components[component_id]
-                self.component_details.setHtml(f"""
-                <h3 style="color: #4fc3f7; margin-bottom: 10px;">{component_info['name']}</h3>
-                <div style="color: #e0e0e0; line-height: 1.6;">
-                {component_info['description']}
-                </div>
-                """)
-                
-    def _on_highlight_clicked(self):
-        current_item = self.component_list.currentItem()
-        if current_item:
-            component_id = current_item.data(QtCore.Qt.UserRole)
-            self.component_selected.emit(component_id)
-            
-    def _on_clear_clicked(self):
-        self.component_selected.emit("clear")
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
 
-import json
-import sys
-import time
-from typing import Optional
+# Layout import/export works on bytes; orjson when available, stdlib json otherwise
+if HAVE_ORJSON:
+    _json_loads = orjson.loads
 
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    _json_loads = json.loads
 
-class ModernGPUVisualizer(QtWidgets.QMainWindow):
-    
-    
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Modern GPU Visualizer")
-        self.setGeometry(100, 100, 1920, 1080)
-        
-        self.setStyleSheet(self._get_modern_stylesheet())
-        
-        self.current_gpu_name = None
-        self.sim = None
-        self.is_loading = False
-        
-        self.setup_ui()
-        self._setup_connections()
-        self._load_initial_gpu()
-        
-    def _get_modern_stylesheet(self):
-        """Get modern dark theme stylesheet with excellent readability"""
-        return """
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Stylesheets and placeholder HTML are built once; Qt can skip re-parsing identical strings
+_BUTTON_QSS = """
+    QPushButton {
+        background-color: #2e2e2e;
+        color: #ffffff;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: 600;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #3e3e3e;
+    }
+    QPushButton:pressed {
+        background-color: #4e4e4e;
+    }
+"""
+
+# Highlight button: both states in one sheet, switched via the "state" property + repolish
+_HIGHLIGHT_BTN_QSS = _BUTTON_QSS + """
+    QPushButton#highlight[state="active"] {
+        background-color: #4fc3f7;
+    }
+"""
+
+_PERF_INDICATOR_QSS = """
+    QLabel {{
+        background-color: {color};
+        border-radius: 6px;
+        padding: 8px 12px;
+        color: #ffffff;
+        font-size: 11px;
+        font-weight: 600;
+    }}
+"""
+
+# Performance indicator styles: idle plus one per importance level
+_PERF_IDLE_QSS = _PERF_INDICATOR_QSS.format(color="#2a2a2a")
+_IMPACT_QSS = {
+    level: _PERF_INDICATOR_QSS.format(color=color)
+    for level, color in (("CRITICAL", "#f44336"), ("HIGH", "#ff9800"), ("MEDIUM", "#4caf50"), ("LOW", "#9e9e9e"))
+}
+# Importance strings lead with their level, so the leftmost keyword is the level
+_IMPACT_RE = re.compile("|".join(_IMPACT_QSS))
+
+# Component explorer panel chrome
+_PANEL_TITLE_QSS = """
+    QLabel {
+        color: #4fc3f7;
+        font-size: 18px;
+        font-weight: 700;
+        padding: 12px;
+        background-color: transparent;
+        border-bottom: 2px solid #404040;
+        margin-bottom: 8px;
+    }
+"""
+
+_COMPONENT_LIST_QSS = """
+    QListWidget {
+        background-color: #2e2e2e;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        padding: 8px;
+        color: #ffffff;
+        font-size: 12px;
+    }
+    QListWidget::item {
+        padding: 8px;
+        margin: 2px;
+        border-radius: 4px;
+        background-color: transparent;
+    }
+    QListWidget::item:selected {
+        background-color: #4fc3f7;
+        color: #ffffff;
+        font-weight: bold;
+    }
+    QListWidget::item:hover {
+        background-color: #3e3e3e;
+    }
+"""
+
+_COMPONENT_DETAILS_QSS = """
+    QTextBrowser {
+        background-color: #2e2e2e;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        padding: 12px;
+        color: #ffffff;
+        font-size: 11px;
+        line-height: 1.5;
+    }
+    QTextBrowser h3 {
+        color: #4fc3f7;
+        font-size: 14px;
+        font-weight: bold;
+        margin-bottom: 8px;
+    }
+    QTextBrowser strong {
+        color: #ffffff;
+        font-weight: bold;
+    }
+    QTextBrowser table {
+        border-collapse: collapse;
+        margin: 5px 0;
+    }
+"""
+
+_DETAILS_PLACEHOLDER_HTML = """
+    <div style="color: #b0bec5; text-align: center; padding: 20px;">
+        Select a component from the list above to view detailed technical information,
+        specifications, manufacturing details, and maintenance guidelines.
+    </div>
+"""
+
+_CLEARED_PLACEHOLDER_HTML = """
+    <div style="color: #b0bec5; text-align: center; padding: 20px;">
+        Component highlighting cleared. Select a component to view details.
+    </div>
+"""
+
+_INVALID_COMPONENT_HTML = """
+    <div style="color: #f44336; text-align: center; padding: 20px;">
+        Invalid component selected. Please choose a valid component from the list.
+    </div>
+"""
+
+_MODERN_QSS = """
         QMainWindow {
             background-color: #1a1a1a;
             color: #ffffff;
@@ -721,6 +520,430 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
             font-weight: 500;
         }
         """
+
+
+# Component list rows for the default explorer and for loaded GPU models; shared, immutable
+_DEFAULT_COMPONENTS = (
+    ("chassis", "🏗️ GPU Chassis/Enclosure", "Structural housing and thermal management"),
+    ("cooling", "❄️ Cooling System", "Fans, heatsink, and heat pipes"),
+    ("pcb", "🔌 PCB Board", "Printed circuit board and traces"),
+    ("gpu_die", "🎯 GPU Silicon Die", "Core processor and compute units"),
+    ("vram", "💾 Video RAM", "High-bandwidth memory chips"),
+    ("power_delivery", "⚡ Power Delivery", "VRM and voltage regulation"),
+    ("backplate", "🔩 Backplate", "Rear mounting and cooling plate"),
+    ("io_bracket", "🖥️ I/O Bracket", "Display ports and power connectors"),
+    ("microscopic", "🔬 Microscopic Components", "Resistors, capacitors, ICs"),
+    ("traces", "📡 PCB Traces", "Copper pathways and signal routing")
+)
+_DEFAULT_COMPONENT_ROWS = tuple(
+    (component_id, f"{name}\n  {description}", f"Click to explore {name}")
+    for component_id, name, description in _DEFAULT_COMPONENTS
+)
+
+_GPU_MODEL_COMPONENTS = types.MappingProxyType({
+    "backplate": {"name": "🔩 Backplate & I/O Bracket", "description": "The structural backbone providing video outputs, mounting support, and EMI shielding."},
+    "pcb": {"name": "🔌 Printed Circuit Board (PCB)", "description": "Multi-layer fiberglass foundation with gold-plated PCIe connector and power distribution network."},
+    "power_delivery": {"name": "⚡ Power Delivery System", "description": "Multi-phase VRM design with digital controllers for stable power delivery."},
+    "gpu_package": {"name": "🎯 GPU Package & Silicon Die", "description": "Advanced silicon die with billions of transistors and streaming multiprocessors."},
+    "vram": {"name": "💾 Video Memory (VRAM)", "description": "GDDR6 memory modules with ultra-high bandwidth for gaming performance."},
+    "heatsink": {"name": "🌡️ Cooling Heatsink", "description": "Massive aluminum fin array with direct contact technology for optimal heat dissipation."},
+    "heatpipes": {"name": "🔥 Heat Pipe Network", "description": "Copper pipes with phase-change cooling technology for efficient heat transfer."},
+    "fans": {"name": "💨 Cooling Fans", "description": "Triple fan configuration with optimized blade design and intelligent temperature control."},
+    "shroud": {"name": "🛡️ External Shroud", "description": "Engineered housing with optimized airflow channels and LED lighting."},
+    "screws": {"name": "🔧 Assembly Hardware", "description": "Precision mounting components for secure assembly and longevity."}
+})
+_GPU_MODEL_COMPONENT_ROWS = tuple(
+    (component_id, info["name"], f"Click to highlight {info['name']}")
+    for component_id, info in _GPU_MODEL_COMPONENTS.items()
+)
+_GPU_MODEL_COMPONENT_HTML = {
+    component_id: f"""
+            <h3 style="color: #4fc3f7; margin-bottom: 10px;">{info['name']}</h3>
+            <div style="color: #e0e0e0; line-height: 1.6;">
+            {info['description']}
+            </div>
+            """
+    for component_id, info in _GPU_MODEL_COMPONENTS.items()
+}
+
+
+# Component ids that mean "clear the highlight" rather than naming a component
+_CLEAR_SENTINELS = frozenset(("clear", "__CLEAR__"))
+
+# Item data role carrying the component id on component list rows
+_USER_ROLE = QtCore.Qt.UserRole
+
+
+@functools.lru_cache(maxsize=None)
+def _component_type_or_none(component_id: str) -> Optional[ComponentType]:
+    """Memoized ComponentType lookup; None for ids that are not component types"""
+    try:
+        return ComponentType(component_id)
+    except ValueError:
+        return None
+
+
+class DetailedComponentPanel(QtWidgets.QWidget):
+    component_selected = QtCore.Signal(str)
+    
+    def __init__(self):
+        super().__init__()
+        self.component_highlighter = ComponentHighlighter()
+        # Rendered (html, indicator sheet, indicator text) per component id
+        self._details_html_cache = {}
+        self._last_selected = None
+        # Id of the current list row, kept in step by currentItemChanged
+        self._current_component_id = None
+        # Coalesces bursts of selection changes (key-hold navigation) into one details refresh
+        self._selection_timer = QtCore.QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(16)
+        self._selection_timer.timeout.connect(self._on_component_selected)
+        self.setup_ui()
+        
+    def setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(12)
+        
+        title = QtWidgets.QLabel("🔧 Advanced GPU Component Explorer")
+        title.setStyleSheet(_PANEL_TITLE_QSS)
+        layout.addWidget(title)
+        
+        selection_group = QtWidgets.QGroupBox("🎯 Component Selection")
+        selection_layout = QtWidgets.QVBoxLayout(selection_group)
+        
+        self.component_list = QtWidgets.QListWidget()
+        self.component_list.setStyleSheet(_COMPONENT_LIST_QSS)
+        # Rows within each list share one layout, so Qt can size them from the first item
+        self.component_list.setUniformItemSizes(True)
+        
+        self.populate_component_list()
+        selection_layout.addWidget(self.component_list)
+        
+        button_layout = QtWidgets.QHBoxLayout()
+        
+        self.highlight_btn = QtWidgets.QPushButton("🔦 Highlight")
+        self.highlight_btn.setObjectName("highlight")
+        self.highlight_btn.setProperty("state", "idle")
+        self.highlight_btn.setStyleSheet(_HIGHLIGHT_BTN_QSS)
+        
+        self.clear_btn = QtWidgets.QPushButton("🧹 Clear")
+        self.clear_btn.setStyleSheet(_BUTTON_QSS)
+        
+        button_layout.addWidget(self.highlight_btn)
+        button_layout.addWidget(self.clear_btn)
+        selection_layout.addLayout(button_layout)
+        
+        layout.addWidget(selection_group)
+        
+        details_group = QtWidgets.QGroupBox("📊 Component Details")
+        details_layout = QtWidgets.QVBoxLayout(details_group)
+        
+        self.component_details = QtWidgets.QTextBrowser()
+        self.component_details.setStyleSheet(_COMPONENT_DETAILS_QSS)
+        self.component_details.setHtml(_DETAILS_PLACEHOLDER_HTML)
+        
+        details_layout.addWidget(self.component_details)
+        layout.addWidget(details_group)
+        
+        self.performance_indicator = QtWidgets.QLabel("⚡ Performance Impact: None")
+        self.performance_indicator.setStyleSheet(_PERF_IDLE_QSS)
+        layout.addWidget(self.performance_indicator)
+        
+        self.component_list.currentItemChanged.connect(self._on_current_item_changed)
+        self.component_list.itemSelectionChanged.connect(self._selection_timer.start)
+        self.highlight_btn.clicked.connect(self._on_highlight_clicked)
+        self.clear_btn.clicked.connect(self._on_clear_clicked)
+        
+    def populate_component_list(self):
+        self._fill_component_list(_DEFAULT_COMPONENT_ROWS)
+        
+    def _fill_component_list(self, rows):
+        """Replace the list contents with (component_id, label, tooltip) rows"""
+        component_list = self.component_list
+        component_list.setUpdatesEnabled(False)
+        component_list.blockSignals(True)
+        try:
+            component_list.clear()
+            self._current_component_id = None
+            component_list.addItems([label for _, label, _ in rows])
+            for i, (component_id, _, tooltip) in enumerate(rows):
+                item = component_list.item(i)
+                item.setData(_USER_ROLE, component_id)
+                item.setToolTip(tooltip)
+        finally:
+            component_list.blockSignals(False)
+            component_list.setUpdatesEnabled(True)
+            
+    def _on_current_item_changed(self, current, previous):
+        self._current_component_id = current.data(_USER_ROLE) if current else None
+        
+    def _on_component_selected(self):
+        component_id = self._current_component_id
+        if component_id is not None:
+            if component_id == self._last_selected:
+                return
+            self._last_selected = component_id
+            if component_id in getattr(self, "components", {}):
+                self.component_details.setHtml(_GPU_MODEL_COMPONENT_HTML[component_id])
+                return
+            details = self._details_html_cache.get(component_id)
+            if details is None:
+                component_type = _component_type_or_none(component_id)
+                if component_type is None:
+                    self.component_details.setHtml(_INVALID_COMPONENT_HTML)
+                    self.performance_indicator.setText("⚡ Performance Impact: Unknown")
+                    return
+                component_info = self.component_highlighter.get_component_info(component_type)
+                if not component_info:
+                    return
+                importance = component_info.importance
+                match = _IMPACT_RE.search(importance)
+                impact = match.group(0) if match else "LOW"
+                details = (
+                    self.component_highlighter.format_component_details(component_info),
+                    _IMPACT_QSS[impact],
+                    f"⚡ {importance}",
+                )
+                self._details_html_cache[component_id] = details
+                
+            html, indicator_qss, indicator_text = details
+            self.component_details.setHtml(html)
+            self.performance_indicator.setStyleSheet(indicator_qss)
+            self.performance_indicator.setText(indicator_text)
+                
+    def _on_highlight_clicked(self):
+        component_id = self._current_component_id
+        if component_id is not None:
+            if component_id not in getattr(self, "components", {}) and _component_type_or_none(component_id) is None:
+                return
+            self.component_selected.emit(component_id)
+            
+            self.highlight_btn.setText("🔦 Active")
+            self._set_highlight_state("active")
+                
+    def _on_clear_clicked(self):
+        self.component_selected.emit("clear")
+        self._last_selected = None
+        
+        self.highlight_btn.setText("🔦 Highlight")
+        self._set_highlight_state("idle")
+        
+        self.component_details.setHtml(_CLEARED_PLACEHOLDER_HTML)
+        self.performance_indicator.setText("⚡ Performance Impact: None")
+        self.performance_indicator.setStyleSheet(_PERF_IDLE_QSS)
+        
+    def _set_highlight_state(self, state):
+        """Switch the highlight button style by property; only re-matches selectors"""
+        btn = self.highlight_btn
+        if btn.property("state") == state:
+            return
+        btn.setProperty("state", state)
+        style = btn.style()
+        style.unpolish(btn)
+        style.polish(btn)
+        
+    def set_gpu_model(self, gpu_model):
+        self._last_selected = None
+        if gpu_model:
+            self.components = _GPU_MODEL_COMPONENTS
+            self._fill_component_list(_GPU_MODEL_COMPONENT_ROWS)
+        else:
+            self.component_list.clear()
+
+import json
+import sys
+import time
+from typing import Optional
+
+
+class _LayoutImportSignals(QtCore.QObject):
+    """Lives on the GUI thread so worker results arrive as queued calls"""
+    finished = QtCore.Signal(bytes, object)
+    failed = QtCore.Signal(str)
+
+
+class _LayoutImportTask(QtCore.QRunnable):
+    """Reads and parses a layout JSON file on a QThreadPool worker"""
+    
+    def __init__(self, path: str, signals: _LayoutImportSignals, known_layouts: dict):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+        self.known_layouts = known_layouts
+        
+    def run(self):
+        try:
+            with open(self.path, 'rb') as f:
+                raw = f.read()
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            layout = self.known_layouts.get(digest)
+            if layout is None:
+                layout = load_layout_from_json(_json_loads(raw))
+            self.signals.finished.emit(digest, layout)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class _LayoutExportSignals(QtCore.QObject):
+    """Lives on the GUI thread so worker results arrive as queued calls"""
+    finished = QtCore.Signal(str)
+    failed = QtCore.Signal(str)
+
+
+class _LayoutExportTask(QtCore.QRunnable):
+    """Serializes and writes a layout JSON file on a QThreadPool worker"""
+    
+    def __init__(self, path: str, layout, signals: _LayoutExportSignals):
+        super().__init__()
+        self.path = path
+        self.layout = layout
+        self.signals = signals
+        
+    def run(self):
+        try:
+            payload = _json_dumps(dump_layout_to_json(self.layout))
+            with open(self.path, 'wb') as f:
+                f.write(payload)
+            self.signals.finished.emit(self.path)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class _PresetBuildSignals(QtCore.QObject):
+    """Lives on the GUI thread; results carry the load generation they were started for"""
+    finished = QtCore.Signal(int, str, object)
+    failed = QtCore.Signal(int, str, str)
+
+
+# Generation tag for background prefetch builds; never matches a real load
+_PREFETCH_GENERATION = -1
+
+
+class _PresetBuildTask(QtCore.QRunnable):
+    """Builds a preset's GPULayout on a QThreadPool worker"""
+    
+    def __init__(self, generation: int, gpu_name: str, signals: _PresetBuildSignals):
+        super().__init__()
+        self.generation = generation
+        self.gpu_name = gpu_name
+        self.signals = signals
+        
+    def run(self):
+        try:
+            layout = PRESETS[self.gpu_name]
+        except Exception as e:
+            signal, result = self.signals.failed, str(e)
+        else:
+            signal, result = self.signals.finished, layout
+        try:
+            signal.emit(self.generation, self.gpu_name, result)
+        except RuntimeError:
+            # The window (and its signals object) went away while the build ran; the layout stays cached
+            pass
+
+
+class ModernGPUVisualizer(QtWidgets.QMainWindow):
+    
+    
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Modern GPU Visualizer")
+        self.setGeometry(100, 100, 1920, 1080)
+        
+        self.setStyleSheet(self._get_modern_stylesheet())
+        
+        self.current_gpu_name = None
+        # Set once the first preset load finishes, which may be after the window is up
+        self.current_layout = None
+        self.sim = None
+        self.is_loading = False
+        
+        # Slider-driven sim parameters: speed/power apply trailing-edge after the drag settles,
+        # utilization is throttled (leading + trailing) so the view still reacts mid-drag
+        self._pending_sim_params = {}
+        self._sim_param_timer = QtCore.QTimer(self)
+        self._sim_param_timer.setSingleShot(True)
+        self._sim_param_timer.setInterval(50)
+        self._sim_param_timer.timeout.connect(self._apply_sim_params)
+        self._pending_util = None
+        self._util_throttle_timer = QtCore.QTimer(self)
+        self._util_throttle_timer.setSingleShot(True)
+        self._util_throttle_timer.setInterval(50)
+        self._util_throttle_timer.timeout.connect(self._flush_pending_util)
+        
+        # Sim ticks in 2D mode are coalesced into at most one repaint of the visible view per ~30 fps frame;
+        # the interval stretches to 1.5x the smoothed paint cost when frames get expensive
+        self._repaint_timer = QtCore.QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(33)
+        self._paint_cost_ema_ms = 0.0
+        self._repaint_timer.timeout.connect(self._flush_view_repaint)
+        # Set by sim ticks while 3D is hidden; the 3D view is refreshed once on switching back
+        self._view3d_stale = False
+        self._resume_sim_on_show = False
+        
+        # Status bar text is throttled: bursts of messages land as one repaint per 80 ms window
+        self._pending_status = ""
+        self._status_timer = QtCore.QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(80)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        # Slots this window connected to sim.updated, so they can be disconnected individually
+        self._sim_slots = []
+        
+        # Simulation steps run on a worker thread; sim.updated delivers each step's snapshot as a queued call.
+        # Sims are parented to _sim_host so they are owned (and deleted) on that thread.
+        self._sim_thread = QtCore.QThread(self)
+        self._sim_host = QtCore.QObject()
+        self._sim_host.moveToThread(self._sim_thread)
+        self._sim_thread.finished.connect(self._sim_host.deleteLater)
+        self._sim_thread.start()
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self._shutdown_sim_thread)
+        
+        # Parsed imports keyed by file digest
+        self._imported_layouts = {}
+        self._file_dialog = None
+        self._import_signals = _LayoutImportSignals(self)
+        self._import_signals.finished.connect(self._on_import_finished)
+        self._import_signals.failed.connect(self._on_import_failed)
+        self._export_signals = _LayoutExportSignals(self)
+        self._export_signals.finished.connect(self._on_export_finished)
+        self._export_signals.failed.connect(self._on_export_failed)
+        # Bumped per preset load; layouts built for an older request are dropped
+        self._load_generation = 0
+        self._preset_signals = _PresetBuildSignals(self)
+        self._preset_signals.finished.connect(self._finish_gpu_load)
+        self._preset_signals.failed.connect(self._on_preset_build_failed)
+        self._preset_signals.finished.connect(self._on_preset_prefetched)
+        self._preset_signals.failed.connect(self._on_preset_prefetched)
+        # Once a load settles, the presets next to it in the picker are built in the background
+        self._prefetch_active = False
+        # Presets whose background build failed; never retried by prefetch
+        self._prefetch_failed = set()
+        self._prefetch_timer = QtCore.QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(2000)
+        self._prefetch_timer.timeout.connect(self._prefetch_next_preset)
+        # Colormap changes for the hidden stack page, applied when it becomes current
+        self._pending_colormap = {}
+        # Set when a preset loads while the 2D page is hidden; the 2D scene is rebuilt on the next switch
+        self._view2d_layout_stale = False
+        # Last values pushed into the current sim / views; repeats are dropped
+        self._last_sim_values = {}
+        # Latest step emitted by the current sim; the 2D view colors from it on its next repaint
+        self._sim_snapshot = None
+        self._last_colormap = None
+        
+        self.setup_ui()
+        self._setup_connections()
+        self._load_initial_gpu()
+        
+    def _get_modern_stylesheet(self):
+        """Get modern dark theme stylesheet with excellent readability"""
+        return _MODERN_QSS
         
     def setup_ui(self):
         central_widget = QtWidgets.QWidget()
@@ -765,9 +988,11 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
         view_layout.setContentsMargins(0, 0, 0, 0)
         
         self.view_stack = QtWidgets.QStackedWidget()
-        self.view2d = GPU2DView()
+        # 2D view is built on first switch to it; a placeholder holds its stack slot
+        self.view2d = None
+        self._view2d_placeholder = QtWidgets.QWidget()
         self.view3d = GPU3DView()
-        self.view_stack.addWidget(self.view2d)
+        self.view_stack.addWidget(self._view2d_placeholder)
         self.view_stack.addWidget(self.view3d)
         self.view_stack.setCurrentIndex(1)
         view_layout.addWidget(self.view_stack, 1)
@@ -779,6 +1004,8 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
                 border-radius: 8px;
             }
         """)
+        # Built after the view stack, so it already sits on top; raise once rather than per show
+        self.loading_overlay.raise_()
         self.loading_overlay.hide()
         
         loading_layout = QtWidgets.QVBoxLayout(self.loading_overlay)
@@ -794,18 +1021,14 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
         """)
         self.loading_label.setAlignment(QtCore.Qt.AlignCenter)
         
-        self.loading_spinner = QtWidgets.QLabel()
-        self.loading_spinner.setFixedSize(32, 32)
-        self.loading_spinner.setStyleSheet("""
-            QLabel {
-                border: 3px solid #404040;
-                border-top: 3px solid #4fc3f7;
-                border-radius: 16px;
-                background-color: transparent;
-            }
-        """)
+        # Indeterminate (busy) only while the overlay is shown; Qt animates it natively
+        self.loading_bar = QtWidgets.QProgressBar()
+        self.loading_bar.setFixedWidth(240)
+        self.loading_bar.setTextVisible(False)
+        self.loading_bar.setRange(0, 1)
+        self.loading_bar.setValue(1)
         
-        loading_layout.addWidget(self.loading_spinner)
+        loading_layout.addWidget(self.loading_bar, 0, QtCore.Qt.AlignHCenter)
         loading_layout.addWidget(self.loading_label)
         
         right_panel = QtWidgets.QWidget()
@@ -847,23 +1070,29 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
         self.status_label = QtWidgets.QLabel("Ready")
         self.status_bar.addWidget(self.status_label)
         
+    @QtCore.Slot(str)
     def _on_component_highlighted(self, component_id: str):
-        if component_id == "clear":
+        if component_id in _CLEAR_SENTINELS:
             self.view3d.clear_highlight()
-            self.status_label.setText("Component highlighting cleared")
+            self._queue_status("Component highlighting cleared")
         else:
             self.view3d.highlight_component(component_id)
-            self.status_label.setText(f"Highlighted: {component_id}")
+            self._queue_status(f"Highlighted: {component_id}")
     
+    @QtCore.Slot(bool)
+    def _on_visibility_checkbox_toggled(self, checked: bool):
+        # Checkboxes carry their component key as a dynamic property
+        self._on_component_visibility_changed(self.sender().property("component_key"), checked)
+        
     def _on_component_visibility_changed(self, component_type: str, visible: bool):
         self.view3d.set_component_visibility(component_type, visible)
         status = "Shown" if visible else "Hidden"
-        self.status_label.setText(f"{component_type}: {status}")
+        self._queue_status(f"{component_type}: {status}")
     
     def _on_performance_mode_changed(self, mode: str, checked: bool):
         if checked:
             self.view3d.set_performance_mode(mode)
-            self.status_label.setText(f"Performance mode: {mode}")
+            self._queue_status(f"Performance mode: {mode}")
 
     def _setup_connections(self):
         self.controls.preset.currentTextChanged.connect(self._on_gpu_selection_changed)
@@ -878,9 +1107,9 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
         
         self.controls.changed_colormap.connect(self._on_colormap_changed)
         if hasattr(self.controls, 'changed_view_mode2d'):
-            self.controls.changed_view_mode2d.connect(self.view2d.set_view_mode)
+            self.controls.changed_view_mode2d.connect(self._on_view_mode2d_changed)
         if hasattr(self.controls, 'changed_coloring_mode'):
-            self.controls.changed_coloring_mode.connect(self.view2d.set_coloring_mode)
+            self.controls.changed_coloring_mode.connect(self._on_coloring_mode_changed)
         self.controls.import_json_clicked.connect(self._on_import_json)
         self.controls.export_json_clicked.connect(self._on_export_json)
         
@@ -889,11 +1118,12 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
         if hasattr(self.controls, 'stop_global_anims'):
             self.controls.stop_global_anims.connect(self._on_stop_global_anims)
         
-        self.view_mode_group.buttonClicked.connect(self._on_view_mode_changed)
+        self.view_mode_group.idClicked.connect(self._on_view_mode_changed)
+        self.view_stack.currentChanged.connect(self._apply_pending_colormap)
         
         if hasattr(self.visibility_panel, 'component_checkboxes'):
-            for key, checkbox in self.visibility_panel.component_checkboxes.items():
-                checkbox.toggled.connect(lambda checked, k=key: self._on_component_visibility_changed(k, checked))
+            for checkbox in self.visibility_panel.component_checkboxes.values():
+                checkbox.toggled.connect(self._on_visibility_checkbox_toggled)
         
     def _load_initial_gpu(self):
         try:
@@ -907,8 +1137,10 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
         except Exception as e:
             self._show_error(f"Failed to load initial GPU: {e}")
             
+    @QtCore.Slot(str)
     def _on_gpu_selection_changed(self, gpu_name: str):
-        if self.is_loading or gpu_name == self.current_gpu_name:
+        # A pick made while another preset is still building supersedes it
+        if gpu_name == self.current_gpu_name and not self.is_loading:
             return
             
         if gpu_name not in PRESETS:
@@ -920,28 +1152,44 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
     def _load_gpu_model(self, gpu_name: str):
         self.is_loading = True
         self._show_loading(True)
-        self.status_label.setText(f"Loading {gpu_name}...")
+        self._queue_status(f"Loading {gpu_name}...")
+        self._load_generation += 1
         
+        if PRESETS.is_built(gpu_name):
+            self._finish_gpu_load(self._load_generation, gpu_name, PRESETS[gpu_name])
+        else:
+            # First use of a preset builds its layout off the GUI thread; the overlay keeps animating
+            task = _PresetBuildTask(self._load_generation, gpu_name, self._preset_signals)
+            QtCore.QThreadPool.globalInstance().start(task)
+            
+    @QtCore.Slot(int, str, object)
+    def _finish_gpu_load(self, generation: int, gpu_name: str, layout):
+        if generation != self._load_generation:
+            return
         try:
-            if self.sim and self.sim.running:
-                self.sim.stop()
+            self._retire_sim()
                 
-            self.current_layout = PRESETS[gpu_name]
+            self.current_layout = layout
             self.current_gpu_name = gpu_name
             
-            self.sim = Simulation(self.current_layout)
+            sim = self.sim = Simulation(self.current_layout)
+            sim.moveToThread(self._sim_thread)
+            # setParent must run on the thread that now owns the sim
+            QtCore.QTimer.singleShot(0, sim, lambda: sim.setParent(self._sim_host))
             
-            self.view2d.set_layout(self.current_layout)
+            if self.view2d is not None:
+                if self.view_stack.currentIndex() == 0:
+                    self.view2d.set_layout(self.current_layout)
+                else:
+                    self._view2d_layout_stale = True
             self.view3d.set_layout(self.current_layout)
             
-            QtCore.QTimer.singleShot(100, self._on_gpu_model_loaded)
-            
-            self._connect_simulation_to_view("3d")
+            # set_layout builds the model synchronously, so wiring and sim start can follow directly
+            self._on_gpu_model_loaded()
             
-            self.sim.start()
-            
-            self.status_label.setText(f"Loaded: {gpu_name}")
+            self._queue_status(f"Loaded: {gpu_name}")
             self._log_message(f"Successfully loaded GPU model: {gpu_name}")
+            self._prefetch_timer.start()
             
         except Exception as e:
             self._show_error(f"Failed to load GPU model {gpu_name}: {e}")
@@ -951,11 +1199,45 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
             self.is_loading = False
             self._show_loading(False)
             
+    @QtCore.Slot(int, str, str)
+    def _on_preset_build_failed(self, generation: int, gpu_name: str, message: str):
+        if generation != self._load_generation:
+            return
+        self.is_loading = False
+        self._show_loading(False)
+        self._show_error(f"Failed to load GPU model {gpu_name}: {message}")
+        if self.current_gpu_name:
+            self.controls.preset.setCurrentText(self.current_gpu_name)
+            
+    def _prefetch_next_preset(self):
+        """Build one unbuilt neighbour of the current preset off the GUI thread"""
+        if self.is_loading or self._prefetch_active:
+            return
+        combo = self.controls.preset
+        index = combo.currentIndex()
+        for neighbour in (index + 1, index - 1):
+            gpu_name = combo.itemText(neighbour) if 0 <= neighbour < combo.count() else ""
+            if gpu_name in PRESETS and not PRESETS.is_built(gpu_name) and gpu_name not in self._prefetch_failed:
+                self._prefetch_active = True
+                task = _PresetBuildTask(_PREFETCH_GENERATION, gpu_name, self._preset_signals)
+                QtCore.QThreadPool.globalInstance().start(task)
+                return
+                
+    def _on_preset_prefetched(self, generation: int, gpu_name: str, _result):
+        if generation != _PREFETCH_GENERATION:
+            return
+        self._prefetch_active = False
+        if not PRESETS.is_built(gpu_name):
+            self._prefetch_failed.add(gpu_name)
+        # The built layout is already cached in PRESETS; move on to the other neighbour
+        self._prefetch_timer.start()
+            
     def _on_gpu_model_loaded(self):
         if hasattr(self.view3d, 'gpu_model') and self.view3d.gpu_model:
             self.component_panel.set_gpu_model(self.view3d.gpu_model)
             # Add interactive components for ultra-detailed models
-            self.view2d.add_interactive_components(self.view3d.gpu_model)
+            if self.view2d is not None and not self._view2d_layout_stale:
+                self.view2d.add_interactive_components(self.view3d.gpu_model)
             try:
                 if hasattr(self.controls, 'set_animation_components'):
                     self.controls.set_animation_components(self.view3d.gpu_model.interactive_components)
@@ -967,79 +1249,221 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
         if not self.sim:
             return
             
-        try:
-            self.sim.updated.disconnect()
-        except:
-            pass
-            
-        self._connect_simulation_to_view("3d")
-        
-    def _on_view_mode_changed(self, button):
-        view_index = self.view_mode_group.id(button)
+        self._connect_simulation_to_view("3d" if self.view_stack.currentIndex() == 1 else "2d")
+        self.sim.start()
         
+    @QtCore.Slot(int)
+    def _on_view_mode_changed(self, view_index):
         if view_index == 1:
             self.view_stack.setCurrentIndex(1)
-            self.status_label.setText("3D View Mode")
+            if self._view3d_stale:
+                self._view3d_stale = False
+                self.view3d.update()
+            self._queue_status("3D View Mode")
             self._connect_simulation_to_view("3d")
         else:
+            view = self._ensure_view2d()
+            if self._view2d_layout_stale:
+                self._sync_view2d_layout(view)
+            view.set_sim_snapshot(self._sim_snapshot)
             self.view_stack.setCurrentIndex(0)
-            self.status_label.setText("2D View Mode")
+            self._queue_status("2D View Mode")
             self._connect_simulation_to_view("2d")
     
+    def _ensure_view2d(self):
+        """Create the 2D view on first use and bring it up to the current state"""
+        if self.view2d is not None:
+            return self.view2d
+        view = GPU2DView()
+        if hasattr(self.controls, 'view_combo'):
+            view.view_mode = self.controls.view_combo.currentText()
+        if hasattr(self.controls, 'color_mode'):
+            view.coloring_mode = self.controls.color_mode.currentText()
+        view.set_colormap(self.controls.colormap.currentText())
+        self._sync_view2d_layout(view)
+        
+        placeholder = self._view2d_placeholder
+        self.view_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._view2d_placeholder = None
+        self.view_stack.insertWidget(0, view)
+        self.view2d = view
+        return view
+        
+    def _sync_view2d_layout(self, view):
+        """Push the current layout and its interactive components into the 2D view"""
+        self._view2d_layout_stale = False
+        if self.current_layout:
+            view.set_layout(self.current_layout)
+        model = getattr(self.view3d, 'gpu_model', None)
+        if model:
+            view.add_interactive_components(model)
+        
+    def _on_view_mode2d_changed(self, mode: str):
+        if self.view2d is not None:
+            self.view2d.set_view_mode(mode)
+            
+    def _on_coloring_mode_changed(self, mode: str):
+        if self.view2d is not None:
+            self.view2d.set_coloring_mode(mode)
+    
     def _connect_simulation_to_view(self, view_mode: str):
         if not self.sim:
             return
             
-        try:
-            self.sim.updated.disconnect()
-        except:
-            pass
-            
-        if view_mode == "3d":
-            self.sim.updated.connect(self.view3d.update)
-        else:
-            self.sim.updated.connect(self.view2d.update_colors)
-            self.sim.updated.connect(self._throttled_3d_update)
-            self.sim.updated.connect(self._throttled_2d_update)
+        # GPU3DView already caps its own repaint rate; the 2D scene needs coalescing here
+        slot = self._update_view3d if view_mode == "3d" else self._schedule_view_repaint
+        if self._sim_slots == [slot]:
+            return
+        self._disconnect_sim_slots()
+        self.sim.updated.connect(slot, QtCore.Qt.UniqueConnection)
+        self._sim_slots.append(slot)
+        
+    def _retire_sim(self):
+        """Stop the current sim and delete it on its own thread"""
+        sim = self.sim
+        if not sim:
+            return
+        # Detach the views first so no tick emitted while the stop is in flight reaches them
+        self._disconnect_sim_slots()
+        sim.stop()
+        self._last_sim_values.clear()
+        self._sim_snapshot = None
+        self.sim = None
+        sim.deleteLater()
+        
+    def _shutdown_sim_thread(self):
+        if self._sim_thread.isRunning():
+            self._retire_sim()
+            self._sim_thread.quit()
+            self._sim_thread.wait()
+        
+    def _disconnect_sim_slots(self):
+        """Drop only the connections made by _connect_simulation_to_view"""
+        if self.sim:
+            for slot in self._sim_slots:
+                try:
+                    self.sim.updated.disconnect(slot)
+                except (TypeError, RuntimeError):
+                    pass
+        self._sim_slots.clear()
+    
+    @QtCore.Slot(object)
+    def _schedule_view_repaint(self, snapshot):
+        self._sim_snapshot = snapshot
+        self._view3d_stale = True
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+    
+    def _should_render(self):
+        return self.isVisible() and not self.isMinimized() and self.view_container.isVisible()
     
-    def _throttled_3d_update(self):
-        self.view3d.update()
+    @QtCore.Slot(object)
+    def _update_view3d(self, snapshot):
+        self._sim_snapshot = snapshot
+        if self._should_render():
+            self.view3d.update()
     
-    def _throttled_2d_update(self):
-        self.view2d.update_colors()
+    def _flush_view_repaint(self):
+        if not self._should_render():
+            return
+        if self.view_stack.currentIndex() == 1:
+            # paintGL runs later; pace on the duration of the last frame it finished
+            self._record_paint_cost(self.view3d.last_paint_ms)
+            self.view3d.update()
+        elif self.view2d is not None:
+            self.view2d.set_sim_snapshot(self._sim_snapshot)
+            started = time.perf_counter()
+            self.view2d.update_colors()
+            self._record_paint_cost((time.perf_counter() - started) * 1000.0)
+        
+    def _record_paint_cost(self, cost_ms: float):
+        self._paint_cost_ema_ms = 0.8 * self._paint_cost_ema_ms + 0.2 * cost_ms
+        self._repaint_timer.setInterval(max(33, int(1.5 * self._paint_cost_ema_ms)))
             
+    @QtCore.Slot(str)
     def _on_component_selected(self, component_name: str):
-        if component_name == "clear" or component_name == "__CLEAR__":
+        if component_name in _CLEAR_SENTINELS:
             self.view3d.clear_highlight()
-            self.status_label.setText("Highlight cleared")
+            self._queue_status("Highlight cleared")
         else:
             self.view3d.highlight_component(component_name)
-            self.status_label.setText(f"Selected: {component_name}")
+            self._queue_status(f"Selected: {component_name}")
             
+    @QtCore.Slot(str)
     def _on_colormap_changed(self, colormap_name: str):
-        self.view2d.set_colormap(colormap_name)
-        self.view3d.set_colormap(colormap_name)
-        self.status_label.setText(f"Colormap: {colormap_name}")
-        
+        if colormap_name == self._last_colormap:
+            return
+        self._last_colormap = colormap_name
+        # Only the visible view recolors now; the other catches up when it is switched to
+        if self.view_stack.currentIndex() == 1:
+            self.view3d.set_colormap(colormap_name)
+            if self.view2d is not None:
+                self._pending_colormap[0] = colormap_name
+        elif self.view2d is not None:
+            self.view2d.set_colormap(colormap_name)
+            self._pending_colormap[1] = colormap_name
+        self._queue_status(f"Colormap: {colormap_name}")
+        
+    def _apply_pending_colormap(self, index: int):
+        colormap_name = self._pending_colormap.pop(index, None)
+        if colormap_name is None:
+            return
+        view = self.view3d if index == 1 else self.view2d
+        if view is not None:
+            view.set_colormap(colormap_name)
+            
+    @QtCore.Slot(int)
     def _on_speed_changed(self, speed: int):
-        if self.sim:
-            self.sim.set_speed_ms(speed)
-            self.status_label.setText(f"Speed: {speed}ms")
+        self._pending_sim_params['speed'] = speed
+        self._sim_param_timer.start()
             
+    @QtCore.Slot(int)
     def _on_utilization_changed(self, utilization: int):
-        if self.sim:
-            self.sim.set_global_util(utilization)
-            self.status_label.setText(f"Utilization: {utilization}%")
+        if self._util_throttle_timer.isActive():
+            self._pending_util = utilization
+            return
+        self._apply_utilization(utilization)
+        self._util_throttle_timer.start()
             
+    @QtCore.Slot(int)
     def _on_power_changed(self, power_mv: int):
-        if self.sim:
+        self._pending_sim_params['power_mv'] = power_mv
+        self._sim_param_timer.start()
+        
+    def _apply_sim_params(self):
+        params, self._pending_sim_params = self._pending_sim_params, {}
+        if not self.sim:
+            return
+        last = self._last_sim_values
+        params = {k: v for k, v in params.items() if last.get(k) != v}
+        last.update(params)
+        if 'speed' in params:
+            speed = params['speed']
+            self.sim.set_speed_ms(speed)
+            self._queue_status(f"Speed: {speed}ms")
+        if 'power_mv' in params:
+            power_mv = params['power_mv']
             self.sim.set_power_mv(power_mv)
-            self.status_label.setText(f"Power: {power_mv}mV")
+            self._queue_status(f"Power: {power_mv}mV")
+            
+    def _apply_utilization(self, utilization: int):
+        if self.sim and self._last_sim_values.get('util') != utilization:
+            self._last_sim_values['util'] = utilization
+            self.sim.set_global_util(utilization)
+            self._queue_status(f"Utilization: {utilization}%")
+            
+    def _flush_pending_util(self):
+        if self._pending_util is None:
+            return
+        utilization, self._pending_util = self._pending_util, None
+        self._apply_utilization(utilization)
+        self._util_throttle_timer.start()
             
     def _on_simulation_started(self):
         if self.sim:
             self.sim.start()
-            self.status_label.setText("Simulation started")
+            self._queue_status("Simulation started")
             try:
                 if hasattr(self.controls, 'get_selected_animation_components') and hasattr(self.controls, 'get_selected_animation_mode'):
                     comps = self.controls.get_selected_animation_components()
@@ -1052,7 +1476,7 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
     def _on_simulation_stopped(self):
         if self.sim:
             self.sim.stop()
-            self.status_label.setText("Simulation stopped")
+            self._queue_status("Simulation stopped")
             try:
                 if hasattr(self.controls, 'get_selected_animation_components'):
                     comps = self.controls.get_selected_animation_components()
@@ -1064,7 +1488,9 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
         try:
             if self.view_3d_radio.isChecked():
                 model = getattr(self.view3d, 'gpu_model', None)
-                if model and hasattr(model, 'start_component_animation'):
+                if model and hasattr(model, 'start_component_animations'):
+                    model.start_component_animations(comp_ids, mode)
+                elif model and hasattr(model, 'start_component_animation'):
                     for cid in comp_ids:
                         try:
                             model.start_component_animation(cid, mode)
@@ -1074,7 +1500,7 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
             else:
                 if hasattr(self.view2d, 'start_global_animations'):
                     self.view2d.start_global_animations(comp_ids, mode)
-            self.status_label.setText(f"Animations started: {mode} on {len(comp_ids)} components")
+            self._queue_status(f"Animations started: {mode} on {len(comp_ids)} components")
         except Exception:
             pass
 
@@ -1082,7 +1508,9 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
         try:
             if self.view_3d_radio.isChecked():
                 model = getattr(self.view3d, 'gpu_model', None)
-                if model and hasattr(model, 'stop_component_animation'):
+                if model and hasattr(model, 'stop_component_animations'):
+                    model.stop_component_animations(comp_ids or None)
+                elif model and hasattr(model, 'stop_component_animation'):
                     if comp_ids:
                         for cid in comp_ids:
                             try:
@@ -1095,56 +1523,132 @@ class ModernGPUVisualizer(QtWidgets.QMainWindow):
             else:
                 if hasattr(self.view2d, 'stop_global_animations'):
                     self.view2d.stop_global_animations(comp_ids)
-            self.status_label.setText("Animations stopped")
+            self._queue_status("Animations stopped")
         except Exception:
             pass
             
+    def _run_json_file_dialog(self, title: str, save: bool, default_name: str = "") -> str:
+        """Show the shared, Qt-drawn JSON file dialog; returns the chosen path or ''"""
+        dialog = self._file_dialog
+        if dialog is None:
+            # Built once and reused; the non-native dialog skips the platform shell's cold start
+            dialog = QtWidgets.QFileDialog(self)
+            dialog.setOption(QtWidgets.QFileDialog.DontUseNativeDialog, True)
+            dialog.setNameFilter("JSON Files (*.json)")
+            self._file_dialog = dialog
+        dialog.setWindowTitle(title)
+        if save:
+            dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptSave)
+            dialog.setFileMode(QtWidgets.QFileDialog.AnyFile)
+            dialog.setDefaultSuffix("json")
+        else:
+            dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptOpen)
+            dialog.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+            dialog.setDefaultSuffix("")
+        dialog.selectFile(default_name)
+        if dialog.exec():
+            files = dialog.selectedFiles()
+            if files:
+                return files[0]
+        return ""
+        
     def _on_import_json(self):
-        path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Import GPU Layout", "", "JSON Files (*.json)")
+        path = self._run_json_file_dialog("Import GPU Layout", save=False)
         if path:
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                layout = load_layout_from_json(data)
-                PRESETS[layout.name] = layout
-                self.controls.preset.addItem(layout.name)
-                self.controls.preset.setCurrentText(layout.name)
-                self.status_label.setText(f"Imported: {layout.name}")
-            except Exception as e:
-                self._show_error(f"Import failed: {e}")
+            # Read + parse off the GUI thread; the result comes back through _import_signals
+            self._show_loading(True)
+            task = _LayoutImportTask(path, self._import_signals, self._imported_layouts)
+            QtCore.QThreadPool.globalInstance().start(task)
+            
+    def _on_import_finished(self, digest: bytes, layout):
+        self._show_loading(False)
+        self._imported_layouts[digest] = layout
+        PRESETS[layout.name] = layout
+        self.controls.preset.addItem(layout.name)
+        self.controls.preset.setCurrentText(layout.name)
+        self._queue_status(f"Imported: {layout.name}")
+        
+    def _on_import_failed(self, message: str):
+        self._show_loading(False)
+        self._show_error(f"Import failed: {message}")
                 
     def _on_export_json(self):
         if not self.current_layout:
             return
-        path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "Export GPU Layout", f"{self.current_layout.name}.json",
-            "JSON Files (*.json)")
+        path = self._run_json_file_dialog(
+            "Export GPU Layout", save=True, default_name=f"{self.current_layout.name}.json")
         if path:
-            try:
-                data = dump_layout_to_json(self.current_layout)
-                with open(path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
-                self.status_label.setText(f"Exported to: {path}")
-            except Exception as e:
-                self._show_error(f"Export failed: {e}")
+            # Serialize + write off the GUI thread; the result comes back through _export_signals
+            self._queue_status(f"Exporting to: {path}")
+            task = _LayoutExportTask(path, self.current_layout, self._export_signals)
+            QtCore.QThreadPool.globalInstance().start(task)
+            
+    def _on_export_finished(self, path: str):
+        self._queue_status(f"Exported to: {path}")
+        
+    def _on_export_failed(self, message: str):
+        self._show_error(f"Export failed: {message}")
                 
     def _show_loading(self, show: bool):
         if show:
             self.loading_overlay.setGeometry(self.view_container.rect())
+            self.loading_bar.setRange(0, 0)
             self.loading_overlay.show()
-            self.loading_overlay.raise_()
         else:
             self.loading_overlay.hide()
+            # A determinate bar stops the busy animation timer
+            self.loading_bar.setRange(0, 1)
+            self.loading_bar.setValue(1)
+            
+    def _queue_status(self, text: str):
+        self._pending_status = text
+        if not self._status_timer.isActive():
+            self._status_timer.start()
             
+    def _flush_status(self):
+        self.status_label.setText(self._pending_status)
+        
     def _show_error(self, message: str):
         QtWidgets.QMessageBox.critical(self, "Error", message)
+        self._status_timer.stop()
         self.status_label.setText(f"Error: {message}")
         
     def _log_message(self, message: str):
         if hasattr(self.controls, 'log_window'):
             self.controls.log_window.log(message, "INFO")
             
+    def closeEvent(self, event):
+        self._shutdown_sim_thread()
+        super().closeEvent(event)
+        
+    def hideEvent(self, event):
+        self._suspend_simulation()
+        super().hideEvent(event)
+        
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._resume_simulation()
+        
+    def changeEvent(self, event):
+        if event.type() == QtCore.QEvent.WindowStateChange:
+            if self.isMinimized():
+                self._suspend_simulation()
+            else:
+                self._resume_simulation()
+        super().changeEvent(event)
+        
+    def _suspend_simulation(self):
+        """Pause the sim while nothing is on screen, remembering to resume it later."""
+        if self.sim and self.sim.running:
+            self.sim.stop()
+            self._resume_sim_on_show = True
+            
+    def _resume_simulation(self):
+        if self._resume_sim_on_show and self.isVisible() and not self.isMinimized():
+            self._resume_sim_on_show = False
+            if self.sim:
+                self.sim.start()
+            
     def resizeEvent(self, event):
         super().resizeEvent(event)
         if self.loading_overlay.isVisible():
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the view and layout logic that does not need an OpenGL context.
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+import threading
+sys.path.insert(0, os.path.dirname(__file__))
+
+from PySide6.QtWidgets import QApplication
+
+import numpy as np
+
+from gpuviz.gpu_models import RTX4090Model
+from gpuviz.layouts import _PresetRegistry, dump_layout_to_json
+from gpuviz.models import GPULayout
+from gpuviz.sim import Simulation
+from gpuviz.view3d import GPU3DView, _GeometryBatch
+
+
+def _app():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def _hover_view(picks):
+    """GPU3DView whose picks come from the picks dict, keyed by cursor position."""
+    _app()
+    view3d = GPU3DView()
+    view3d.get_component_at_position = lambda x, y: picks.get((x, y))
+    view3d.handle_hover_event = lambda component_id: None
+    return view3d
+
+
+def test_hover_debounce_needs_agreeing_picks():
+    view3d = _hover_view({})
+    assert view3d._debounce_hover('a') is None
+    assert view3d._debounce_hover('a') == 'a'
+
+
+def test_hover_leave_clears_hover_once_cursor_stops():
+    view3d = _hover_view({(5, 5): None})
+    view3d._apply_hover('a')
+    assert view3d.hovered_component == 'a'
+
+    # One pick over empty space, then the cursor stops: the confirm timer re-picks
+    view3d._last_pick_xy = (5, 5)
+    assert view3d._debounce_hover(None) == 'a'
+    assert view3d._hover_confirm_timer.isActive()
+    view3d._confirm_pending_hover()
+    assert view3d.hovered_component is None
+
+
+def _brute_force_pick(view3d, ray_origin, ray_dir):
+    best_id, best_t = None, float('inf')
+    for comp_id, comp_data in view3d.interactive_components.items():
+        t = view3d._ray_intersects_component(ray_origin, ray_dir, comp_data)
+        if t is not None and t < best_t:
+            best_id, best_t = comp_id, t
+    return best_id
+
+
+def test_vectorized_and_bvh_picks_match_brute_force():
+    _app()
+    rng = random.Random(7)
+    view3d = GPU3DView()
+    view3d.interactive_components = {
+        f"c{i}": {
+            'position': tuple(rng.uniform(-10.0, 10.0) for _ in range(3)),
+            'size': tuple(rng.uniform(0.2, 3.0) for _ in range(3)),
+        }
+        for i in range(60)
+    }
+    view3d._build_pick_bvh()
+
+    rays = [((0.0, 0.0, 30.0), (0.0, 0.0, -1.0)), ((-30.0, 1.0, 0.5), (1.0, 0.0, 0.0))]
+    for _ in range(300):
+        target = [rng.uniform(-10.0, 10.0) for _ in range(3)]
+        origin = [rng.uniform(-30.0, 30.0) for _ in range(3)]
+        direction = [t - o for t, o in zip(target, origin)]
+        length = sum(d * d for d in direction) ** 0.5
+        rays.append((origin, [d / length for d in direction]))
+
+    hits = 0
+    for origin, direction in rays:
+        expected = _brute_force_pick(view3d, origin, direction)
+        hits += expected is not None
+        assert view3d._pick_vectorized_closest(origin, direction) == expected
+        assert view3d._pick_bvh_closest(origin, direction) == expected
+    assert hits > 50
+
+
+def test_static_cache_key_tracks_highlight():
+    _app()
+    view3d = GPU3DView()
+    view3d.gpu_model = type("Model", (), {"highlighted_component": None})()
+    plain = view3d._static_cache_key()
+    view3d.gpu_model.highlighted_component = 'vram'
+    highlighted = view3d._static_cache_key()
+    assert highlighted != plain
+
+    # Toggling visibility away and back must not land on the unhighlighted entry
+    view3d.show_traces = not view3d.show_traces
+    view3d.show_traces = not view3d.show_traces
+    assert view3d._static_cache_key() == highlighted != plain
+
+
+def test_pending_static_build_keeps_previous_entry():
+    _app()
+    view3d = GPU3DView()
+    immediate = []
+    view3d.gpu_model = type("Model", (), {"highlighted_component": None,
+                                          "draw_complete_model": lambda self, t: immediate.append(t)})()
+    old_key = view3d._static_cache_key()
+    view3d._gpu_render_cache[old_key] = (7, 24, None)
+    view3d._use_static_entry(old_key)
+    view3d._gpu_cache_valid = True
+    drawn = []
+    view3d._draw_gpu_vbo = lambda: drawn.append(view3d._gpu_vbo)
+
+    # A new state is compiled after the frame; until then the old VBO stays on screen
+    view3d.gpu_model.highlighted_component = 'vram'
+    view3d._draw_gpu_smart_cached()
+    assert view3d._rebuild_pending
+    assert drawn == [7] and immediate == []
+
+
+def _recorded_quads(view3d, draw):
+    """Run draw against a recording batch and return its quad vertices in a stable order."""
+    batch = _GeometryBatch()
+    view3d._batch = batch
+    try:
+        draw()
+    finally:
+        view3d._batch = None
+    quads = np.round(batch.build().astype(np.float64), 5)
+    return quads[np.lexsort(quads.T[::-1])]
+
+
+def test_model_trace_grid_matches_per_box_loop():
+    _app()
+    view3d = GPU3DView()
+    model = RTX4090Model(view3d)
+    length, width = 30.4, 13.7
+    color = (0.7, 0.6, 0.3, 0.8)
+
+    def per_box():
+        for i in range(8):
+            y = -width/2 + (i + 1) * (width / 9)
+            view3d._draw_3d_box(-length/2 + 2, y - 0.1, 0.08, length - 4, 0.2, 0.05, color)
+        for i in range(16):
+            y = -width/2 + i * (width / 16)
+            for j in range(20):
+                x = -length/2 + j * (length / 20)
+                view3d._draw_3d_box(x, y - 0.05, 0.08, 0.3, 0.1, 0.03, color)
+
+    expected = _recorded_quads(view3d, per_box)
+    assert np.allclose(_recorded_quads(view3d, lambda: model._draw_pcb_traces(length, width)), expected)
+    # Second draw comes from the per-model memo
+    assert np.allclose(_recorded_quads(view3d, lambda: model._draw_pcb_traces(length, width)), expected)
+
+
+def test_model_smd_parts_match_per_part_loop():
+    _app()
+    view3d = GPU3DView()
+    model = RTX4090Model(view3d)
+    length, width = 30.4, 13.7
+
+    def per_part():
+        for i in range(150):
+            x = -length/2 + 2 + (i % 25) * (length - 4) / 25
+            y = -width/2 + 1 + (i // 25) * (width - 2) / 6
+            view3d._draw_3d_box(x, y, 0.05, 0.1, 0.05, 0.02, (0.3, 0.2, 0.1, 1.0))
+        for i in range(80):
+            x = -length/2 + 2 + (i % 16) * (length - 4) / 16
+            y = -width/2 + 1 + (i // 16) * (width - 2) / 5
+            view3d._draw_3d_cylinder(x, y, 0.05, 0.03, 0.1, (0.1, 0.1, 0.2, 1.0))
+        for i in range(16):
+            x = -length/2 + 3 + i * (length - 6) / 16
+            view3d._draw_3d_cylinder(x, -width/2 + width - 2, 0.05, 0.08, 0.15, (0.2, 0.15, 0.1, 1.0))
+
+    expected = _recorded_quads(view3d, per_part)
+    assert np.allclose(_recorded_quads(view3d, lambda: model._draw_microscopic_components(length, width)), expected)
+
+
+def test_model_heatsink_fins_match_per_fin_loop():
+    _app()
+    view3d = GPU3DView()
+    model = RTX4090Model(view3d)
+
+    def per_fin():
+        for i in range(model.HEATSINK_FINS):
+            x = -16.8 + i * 33.6 / model.HEATSINK_FINS
+            view3d._draw_3d_box(x, -6.8, 0.5, 0.08, 13.6, 5.5, (0.8, 0.8, 0.85, 1.0))
+
+    expected = _recorded_quads(view3d, per_fin)
+    draw = lambda: model._draw_heatsink_fins(-16.8, 33.6, model.HEATSINK_FINS, -6.8, 13.6, 5.5)
+    assert np.allclose(_recorded_quads(view3d, draw), expected)
+
+
+def test_model_die_tiles_match_per_core_loop():
+    _app()
+    view3d = GPU3DView()
+    model = RTX4090Model(view3d)
+    die_size, z = 6.09, 0.18
+    width, height = die_size / 13, die_size / 9
+
+    def per_core():
+        for index in range(96):
+            x = -die_size/2 + (index % 12 + 0.5) * width
+            y = -die_size/2 + (index // 12 + 0.5) * height
+            view3d._draw_3d_box(x - width/3, y - height/3, z, width*0.66, height*0.66, 0.015, (0.35, 0.25, 0.15, 0.9))
+            for subarray in range(4):
+                for core in range(32):
+                    core_x = x - width/3 + (subarray % 2) * width/3 - width/8 + (core % 8) * width/32
+                    core_y = y - height/3 + (subarray // 2) * height/3 - height/8 + (core // 8) * height/16
+                    view3d._draw_3d_box(core_x - 0.01, core_y - 0.01, z + 0.015, 0.02, 0.02, 0.004,
+                                        (0.45, 0.35, 0.25, 1.0))
+
+    expected = _recorded_quads(view3d, per_core)
+    assert np.allclose(_recorded_quads(view3d, lambda: model._draw_ad102_sm_layout(die_size, z)), expected,
+                       atol=1e-5)
+
+
+def test_preset_registry_builds_lazily():
+    presets = _PresetRegistry({"Demo": ("Demo", 2, 3, 4)})
+    assert "Demo" in presets and len(presets) == 1
+    assert not presets.is_built("Demo")
+
+    layout = presets["Demo"]
+    assert presets.is_built("Demo")
+    assert presets["Demo"] is layout
+    expected = GPULayout.from_spec("Demo", 2, 3, 4)
+    assert layout == expected
+
+    custom = GPULayout.from_spec("Custom", 1, 1, 1)
+    presets["Custom"] = custom
+    assert presets.is_built("Custom") and presets["Custom"] is custom
+    assert not presets.is_built("Missing")
+
+
+def test_preset_registry_concurrent_lookups_share_one_layout():
+    presets = _PresetRegistry({"Big": ("Big", 8, 18, 128)})
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(presets["Big"])) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(results) == 4
+    assert all(layout is results[0] for layout in results)
+
+
+def test_export_writes_each_layouts_own_structure():
+    _app()
+    import main
+
+    signals = main._LayoutExportSignals()
+    exported = []
+    signals.finished.connect(exported.append)
+    # Same name and per-SM core counts, different GPC split
+    layouts = [GPULayout.from_spec("Custom", 2, 3, 4), GPULayout.from_spec("Custom", 3, 2, 4)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, layout in enumerate(layouts):
+            path = os.path.join(tmp, f"layout{i}.json")
+            main._LayoutExportTask(path, layout, signals).run()
+            with open(path, 'rb') as f:
+                assert json.loads(f.read()) == dump_layout_to_json(layout)
+    assert len(exported) == 2
+
+
+def test_sim_step_emits_snapshot_without_touching_layout():
+    _app()
+    layout = GPULayout.from_spec("Custom", 2, 3, 4)
+    cores = [c for g in layout.gpcs for sm in g.sms for c in sm.cores]
+    before = [(c.activity, c.temperature, c.mem_pressure) for c in cores]
+    sim = Simulation(layout)
+    snapshots = []
+    sim.updated.connect(snapshots.append)
+    sim.step()
+    assert len(snapshots) == 1
+    snapshot = snapshots[0]
+    assert len(snapshot['sm_activity']) == 6
+    for key in ('activity', 'temperature', 'mem_pressure'):
+        assert isinstance(snapshot[key], tuple) and len(snapshot[key]) == 24
+    assert [(c.activity, c.temperature, c.mem_pressure) for c in cores] == before
+
+
+if __name__ == "__main__":
+    test_hover_debounce_needs_agreeing_picks()
+    test_hover_leave_clears_hover_once_cursor_stops()
+    test_vectorized_and_bvh_picks_match_brute_force()
+    test_static_cache_key_tracks_highlight()
+    test_pending_static_build_keeps_previous_entry()
+    test_model_trace_grid_matches_per_box_loop()
+    test_model_smd_parts_match_per_part_loop()
+    test_model_heatsink_fins_match_per_fin_loop()
+    test_model_die_tiles_match_per_core_loop()
+    test_preset_registry_builds_lazily()
+    test_preset_registry_concurrent_lookups_share_one_layout()
+    test_export_writes_each_layouts_own_structure()
+    test_sim_step_emits_snapshot_without_touching_layout()
+    print("All regression tests passed!")